@@ -2,8 +2,7 @@
 nahiarhdNLP - Advanced Indonesian Natural Language Processing Library
 """
 
-# Import main modules
-from . import datasets, preprocessing
+from importlib import import_module
 
 # Version info
 __version__ = "1.5.3"
@@ -12,3 +11,14 @@ __email__ = "raihanhd.dev@gmail.com"
 
 # Export main modules
 __all__ = ["preprocessing", "datasets"]
+
+
+def __getattr__(name):
+    # Submodul di-import saat pertama diakses (PEP 562), bukan saat import paket
+    if name in __all__:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,8 @@
+"""
+Jalankan CLI dengan `python -m nahiarhdNLP`.
+"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
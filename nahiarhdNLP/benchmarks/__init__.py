@@ -0,0 +1,24 @@
+"""
+Benchmark suite nahiarhdNLP.
+
+Corpus sintetis dibuat dari dataset bawaan (lihat `corpus`), setiap step dan
+kombinasi step umum diukur (lihat `suite`), hasilnya disimpan sebagai JSON dan
+bisa dibandingkan dengan baseline:
+
+        python -m nahiarhdNLP.benchmarks run -o baseline.json
+        python -m nahiarhdNLP.benchmarks run -o current.json --baseline baseline.json
+        python -m nahiarhdNLP.benchmarks compare baseline.json current.json
+"""
+
+from .corpus import DEFAULT_MIX, CorpusGenerator, corpus_digest
+from .suite import COMBINATIONS, compare, run_suite, time_pipeline
+
+__all__ = [
+    "COMBINATIONS",
+    "DEFAULT_MIX",
+    "CorpusGenerator",
+    "compare",
+    "corpus_digest",
+    "run_suite",
+    "time_pipeline",
+]
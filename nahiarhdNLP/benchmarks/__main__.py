@@ -0,0 +1,252 @@
+"""
+Jalankan benchmark suite dari command line.
+
+Contoh:
+
+        python -m nahiarhdNLP.benchmarks run -o baseline.json
+        python -m nahiarhdNLP.benchmarks run --steps stopword,stem --size 500
+        python -m nahiarhdNLP.benchmarks run -o current.json --baseline baseline.json
+        python -m nahiarhdNLP.benchmarks compare baseline.json current.json
+
+`run --baseline` dan `compare` keluar dengan kode 1 jika ada regresi, jadi bisa
+dipakai langsung di CI.
+"""
+
+import argparse
+import json
+import sys
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from .corpus import DEFAULT_MIX, CorpusGenerator
+from .suite import COMBINATIONS, compare, run_suite
+
+console = Console(stderr=True)
+
+_STATUS_STYLES = {
+    "regression": "bold red",
+    "improvement": "green",
+    "ok": "dim",
+    "missing": "yellow",
+    "new": "cyan",
+}
+
+
+def _parse_mix(values: list) -> dict:
+    mix = {}
+    for value in values or []:
+        name, _, probability = value.partition("=")
+        if name not in DEFAULT_MIX or not probability:
+            raise ValueError(
+                f"Invalid --mix {value!r}; use feature=probability with feature "
+                f"in {sorted(DEFAULT_MIX)}"
+            )
+        mix[name] = float(probability)
+    return mix
+
+
+def _split(value: str) -> list:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def print_results(result: dict) -> None:
+    table = Table(box=box.ROUNDED, title="Benchmark results")
+    table.add_column("Group", style="dim")
+    table.add_column("Name", style="cyan")
+    table.add_column("Load s", justify="right")
+    table.add_column("First s", justify="right")
+    table.add_column("Median s", justify="right")
+    table.add_column("Docs/s", justify="right", style="green")
+    table.add_column("MB/s", justify="right")
+    for group, entries in result["results"].items():
+        for name, entry in entries.items():
+            table.add_row(
+                group,
+                name,
+                f"{entry['load_s']:.3f}",
+                f"{entry['first_s']:.3f}",
+                f"{entry['median_s']:.4f}",
+                f"{entry['docs_per_s']:,.0f}",
+                f"{entry['mb_per_s']:.2f}",
+            )
+    console.print(table)
+
+
+def print_comparison(baseline: dict, current: dict, rows: list) -> int:
+    """Tampilkan perbandingan; kembalikan jumlah regresi."""
+    if baseline["corpus"]["digest"] != current["corpus"]["digest"]:
+        console.print(
+            "[yellow]Warning: corpus differs from the baseline; "
+            "timings are not directly comparable[/yellow]"
+        )
+    for key in ("python", "machine", "processor"):
+        old, new = baseline["environment"].get(key), current["environment"].get(key)
+        if old != new:
+            console.print(f"[yellow]Warning: {key} changed: {old} -> {new}[/yellow]")
+
+    table = Table(box=box.ROUNDED, title="Comparison with baseline")
+    table.add_column("Group", style="dim")
+    table.add_column("Name", style="cyan")
+    table.add_column("Baseline s", justify="right")
+    table.add_column("Current s", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+    for row in rows:
+        style = _STATUS_STYLES[row["status"]]
+        if "ratio" in row:
+            timings = (
+                f"{row['baseline_s']:.4f}",
+                f"{row['current_s']:.4f}",
+                f"{row['ratio'] - 1:+.1%}",
+            )
+        else:
+            timings = ("-", "-", "-")
+        table.add_row(
+            row["group"],
+            row["name"],
+            *timings,
+            f"[{style}]{row['status']}[/{style}]",
+        )
+    console.print(table)
+
+    regressions = sum(row["status"] == "regression" for row in rows)
+    if regressions:
+        console.print(f"[bold red]{regressions} regression(s) found[/bold red]")
+    else:
+        console.print("[green]No regressions[/green]")
+    return regressions
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run(args) -> int:
+    steps = _split(args.steps) if args.steps else None
+    if args.combinations is None:
+        combinations = COMBINATIONS
+    else:
+        names = _split(args.combinations)
+        unknown = [name for name in names if name not in COMBINATIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown combinations: {unknown}. Available: {sorted(COMBINATIONS)}"
+            )
+        combinations = {name: COMBINATIONS[name] for name in names}
+
+    generator = CorpusGenerator(
+        seed=args.seed,
+        min_words=args.min_words,
+        max_words=args.max_words,
+        vocab_size=args.vocab_size,
+        mix=_parse_mix(args.mix),
+    )
+    result = run_suite(
+        size=args.size,
+        repeat=args.repeat,
+        steps=steps,
+        combinations=combinations,
+        generator=generator,
+        progress=lambda group, name: console.print(f"[dim]{group}: {name}[/dim]"),
+    )
+    print_results(result)
+
+    report = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output and args.output != "-":
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+        console.print(f"Results written to {args.output}")
+    else:
+        print(report)
+
+    if args.baseline:
+        baseline = _load(args.baseline)
+        rows = compare(baseline, result, args.threshold, args.min_seconds)
+        return 1 if print_comparison(baseline, result, rows) else 0
+    return 0
+
+
+def run_compare(args) -> int:
+    baseline, current = _load(args.baseline), _load(args.current)
+    rows = compare(baseline, current, args.threshold, args.min_seconds)
+    return 1 if print_comparison(baseline, current, rows) else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m nahiarhdNLP.benchmarks",
+        description="Benchmark step Pipeline atas corpus sintetis.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_threshold_args(subparser):
+        subparser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.10,
+            help="perlambatan relatif yang dianggap regresi (default: 0.10)",
+        )
+        subparser.add_argument(
+            "--min-seconds",
+            type=float,
+            default=0.001,
+            help="selisih absolut minimum yang dihitung (default: 0.001)",
+        )
+
+    run_parser = subparsers.add_parser("run", help="jalankan benchmark")
+    run_parser.add_argument("-o", "--output", help="file JSON hasil (default: stdout)")
+    run_parser.add_argument(
+        "--size", type=int, default=2000, help="jumlah dokumen (default: 2000)"
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=3, help="putaran terukur (default: 3)"
+    )
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--min-words", type=int, default=5)
+    run_parser.add_argument("--max-words", type=int, default=30)
+    run_parser.add_argument(
+        "--vocab-size",
+        type=int,
+        default=2000,
+        help="jumlah kata baku dari wordlist (default: 2000)",
+    )
+    run_parser.add_argument(
+        "--mix",
+        action="append",
+        metavar="FEATURE=P",
+        help="override peluang fitur, mis. --mix html=0.5 (bisa berulang)",
+    )
+    run_parser.add_argument(
+        "--steps", help="step yang diukur sendiri, dipisah koma (default: semua)"
+    )
+    run_parser.add_argument(
+        "--combinations",
+        help=f"kombinasi yang diukur, dipisah koma (default: {','.join(COMBINATIONS)})",
+    )
+    run_parser.add_argument("--baseline", help="hasil JSON untuk dibandingkan")
+    add_threshold_args(run_parser)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser("compare", help="bandingkan dua file hasil")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    add_threshold_args(compare_parser)
+    compare_parser.set_defaults(handler=run_compare)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""
+Generator corpus sintetis gaya media sosial Indonesia.
+
+Kosakata diambil dari dataset bawaan: kata baku dari `wordlist.json`, slang dari
+`slang.csv`, dan emoji dari `emoji.csv`. Frekuensi kata mengikuti distribusi
+Zipf agar pola pengulangan token (dan efek cache) mirip teks asli. Dengan seed
+dan parameter yang sama, corpus yang dihasilkan selalu identik.
+"""
+
+import hashlib
+import random
+import string
+from itertools import accumulate
+
+from nahiarhdNLP.datasets.loaders import DatasetLoader
+
+# fitur -> peluang muncul per dokumen (kecuali "slang", "repeated", "upper":
+# peluang per kata)
+DEFAULT_MIX = {
+    "mention": 0.4,
+    "hashtag": 0.3,
+    "url": 0.25,
+    "emoji": 0.5,
+    "html": 0.1,
+    "email": 0.05,
+    "phone": 0.05,
+    "currency": 0.05,
+    "number": 0.15,
+    "punctuation": 0.5,
+    "slang": 0.2,
+    "repeated": 0.05,
+    "upper": 0.05,
+}
+
+_DOMAINS = ["com", "co.id", "id", "net", "org"]
+_HTML_TAGS = ["b", "i", "p", "div", "span", "strong"]
+_PUNCTUATION = ["!", "!!!", "?", "??", ".", "...", ",", "!?"]
+
+
+def _zipf_weights(size: int, exponent: float = 1.0) -> list:
+    """Bobot kumulatif Zipf untuk `random.choices(cum_weights=...)`."""
+    return list(accumulate(1.0 / rank**exponent for rank in range(1, size + 1)))
+
+
+class CorpusGenerator:
+    """Generator tweet sintetis dengan panjang dan campuran fitur yang diatur.
+
+    Example:
+        >>> generator = CorpusGenerator(seed=42, mix={"html": 0.5})
+        >>> corpus = generator.generate(1000)
+        >>> generator.describe()["mix"]["html"]
+        0.5
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        min_words: int = 5,
+        max_words: int = 30,
+        vocab_size: int = 2000,
+        slang_size: int = 500,
+        emoji_size: int = 200,
+        mix: dict = None,
+        loader: DatasetLoader = None,
+    ):
+        """Inisialisasi generator.
+
+        Args:
+            seed: Seed random; seed yang sama menghasilkan corpus yang sama
+            min_words: Jumlah kata minimum per dokumen
+            max_words: Jumlah kata maksimum per dokumen
+            vocab_size: Jumlah kata baku yang diambil dari wordlist
+            slang_size: Jumlah kata slang yang diambil dari slang.csv
+            emoji_size: Jumlah emoji yang diambil dari emoji.csv
+            mix: Override peluang fitur (lihat DEFAULT_MIX)
+            loader: DatasetLoader yang dipakai (default: loader baru)
+        """
+        if min_words < 1 or max_words < min_words:
+            raise ValueError("need 1 <= min_words <= max_words")
+        unknown = set(mix or {}) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(
+                f"Unknown mix features: {sorted(unknown)}. "
+                f"Available: {sorted(DEFAULT_MIX)}"
+            )
+
+        self.seed = seed
+        self.min_words = min_words
+        self.max_words = max_words
+        self.mix = {**DEFAULT_MIX, **(mix or {})}
+
+        loader = loader or DatasetLoader()
+        # Sampling dari daftar yang diurutkan agar tidak bergantung urutan file
+        rng = random.Random(seed)
+        wordlist = sorted(set(loader.load_wordlist_dataset()))
+        slang = sorted({item["slang"] for item in loader.load_slang_dataset()})
+        emoji = sorted({item["emoji"] for item in loader.load_emoji_dataset()})
+        if not wordlist:
+            raise ValueError("wordlist dataset is empty")
+
+        self.vocab = rng.sample(wordlist, min(vocab_size, len(wordlist)))
+        self.slang = rng.sample(slang, min(slang_size, len(slang)))
+        self.emoji = rng.sample(emoji, min(emoji_size, len(emoji)))
+        self._vocab_weights = _zipf_weights(len(self.vocab))
+        self._slang_weights = _zipf_weights(len(self.slang))
+        self._emoji_weights = _zipf_weights(len(self.emoji))
+
+    def describe(self) -> dict:
+        """Parameter generator (disimpan di hasil benchmark)."""
+        return {
+            "seed": self.seed,
+            "min_words": self.min_words,
+            "max_words": self.max_words,
+            "vocab_size": len(self.vocab),
+            "slang_size": len(self.slang),
+            "emoji_size": len(self.emoji),
+            "mix": dict(self.mix),
+        }
+
+    def generate(self, size: int) -> list:
+        """Buat `size` dokumen; hasil deterministik untuk parameter yang sama."""
+        rng = random.Random(self.seed)
+        return [self._document(rng) for _ in range(size)]
+
+    def _word(self, rng) -> str:
+        mix = self.mix
+        if self.slang and rng.random() < mix["slang"]:
+            word = rng.choices(self.slang, cum_weights=self._slang_weights)[0]
+        else:
+            word = rng.choices(self.vocab, cum_weights=self._vocab_weights)[0]
+        if rng.random() < mix["repeated"]:
+            word += word[-1] * rng.randint(2, 5)
+        if rng.random() < mix["upper"]:
+            word = word.upper()
+        return word
+
+    def _emoji(self, rng) -> str:
+        count = rng.randint(1, 3)
+        return "".join(
+            rng.choices(self.emoji, cum_weights=self._emoji_weights, k=count)
+        )
+
+    def _document(self, rng) -> str:
+        mix = self.mix
+        words = [
+            self._word(rng) for _ in range(rng.randint(self.min_words, self.max_words))
+        ]
+
+        def pick():
+            return rng.choice(self.vocab)
+
+        extras = []
+        if rng.random() < mix["mention"]:
+            extras.append(f"@{pick()}{rng.randint(0, 99)}")
+        if rng.random() < mix["hashtag"]:
+            extras.append("#" + "".join(w.capitalize() for w in (pick(), pick())))
+        if rng.random() < mix["url"]:
+            if rng.random() < 0.5:
+                host = f"{pick()}.{rng.choice(_DOMAINS)}"
+                extras.append(f"https://{host}/{pick()}?id={rng.randint(1, 9999)}")
+            else:
+                extras.append(f"www.{pick()}.{rng.choice(_DOMAINS)}")
+        if rng.random() < mix["emoji"]:
+            extras.append(self._emoji(rng))
+        if rng.random() < mix["email"]:
+            extras.append(f"{pick()}@{pick()}.{rng.choice(_DOMAINS)}")
+        if rng.random() < mix["phone"]:
+            extras.append("08" + "".join(rng.choices(string.digits, k=10)))
+        if rng.random() < mix["currency"]:
+            extras.append(f"Rp{rng.randint(1, 999)}.000")
+        if rng.random() < mix["number"]:
+            extras.append(str(rng.randint(0, 2024)))
+
+        for extra in extras:
+            words.insert(rng.randint(0, len(words)), extra)
+        text = " ".join(words)
+
+        if rng.random() < mix["punctuation"]:
+            text += rng.choice(_PUNCTUATION)
+        if rng.random() < mix["html"]:
+            tag = rng.choice(_HTML_TAGS)
+            text = f"<{tag}>{text}</{tag}>"
+        return text
+
+
+def corpus_digest(corpus: list) -> str:
+    """Hash isi corpus, untuk memastikan baseline dibandingkan dengan data sama."""
+    digest = hashlib.sha256()
+    for text in corpus:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
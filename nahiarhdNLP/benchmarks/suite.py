@@ -0,0 +1,264 @@
+"""
+Pengukuran throughput setiap step dan kombinasi step, serta perbandingan hasil
+dengan baseline.
+
+Hasil `run_suite` berupa dict yang bisa disimpan sebagai JSON:
+
+        {
+            "schema": 1,
+            "environment": {...},
+            "corpus": {"docs": ..., "digest": ..., "generator": {...}},
+            "results": {
+                "steps": {step: {...}},
+                "combinations": {nama: {...}},
+            },
+        }
+"""
+
+import gc
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import nahiarhdNLP
+from nahiarhdNLP.preprocessing import Pipeline
+
+from .corpus import CorpusGenerator, corpus_digest
+
+# Naikkan jika struktur JSON hasil berubah
+SCHEMA_VERSION = 1
+
+# Kombinasi step yang umum dipakai (lihat "Configuration Tips" di README)
+COMBINATIONS = {
+    "social_media": [
+        "clean_html",
+        "clean_urls",
+        "clean_mentions",
+        "clean_hashtags",
+        "remove_emoji",
+        "remove_lowercase",
+        "remove_repeated_chars",
+        "remove_extra_spaces",
+    ],
+    "ml_preprocessing": [
+        "clean_html",
+        "remove_urls",
+        "remove_mentions",
+        "remove_hashtags",
+        "remove_emoji",
+        "remove_punctuation",
+        "remove_numbers",
+        "remove_lowercase",
+        "remove_extra_spaces",
+        "stopword",
+        "stem",
+    ],
+    "normalization": [
+        "clean_html",
+        "remove_urls",
+        "emoji_to_text",
+        "remove_repeated_chars",
+        "remove_lowercase",
+        "spell_corrector_sentence",
+        "remove_extra_spaces",
+    ],
+    "anonymization": [
+        "replace_email",
+        "replace_link",
+        "replace_user",
+        "remove_phones",
+        "remove_extra_spaces",
+    ],
+    "tokenize": [
+        "clean_html",
+        "remove_urls",
+        "remove_mentions",
+        "remove_punctuation",
+        "remove_lowercase",
+        "stopword",
+        "tokenizer",
+    ],
+}
+
+# Group di hasil benchmark, sesuai urutan pengukuran
+GROUPS = ("steps", "combinations")
+
+
+def environment() -> dict:
+    """Informasi mesin & versi, untuk menilai apakah dua hasil sebanding."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "nahiarhdNLP": nahiarhdNLP.__version__,
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+    }
+
+
+def time_pipeline(steps: list, corpus: list, repeat: int = 3) -> dict:
+    """Ukur `process_batch` satu konfigurasi atas corpus.
+
+    Resource dimuat dulu lewat `warm_up`, lalu satu putaran pertama (cache
+    stemming/spell masih dingin) diukur terpisah dari `repeat` putaran
+    berikutnya.
+
+    Args:
+        steps: Daftar step yang diaktifkan (urutan dipertahankan)
+        corpus: Daftar teks input
+        repeat: Jumlah putaran yang diukur
+
+    Returns:
+        dict: {steps, load_s, first_s, runs_s, min_s, median_s, docs_per_s,
+        mb_per_s}
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    pipeline = Pipeline({step: True for step in steps})
+
+    start = time.perf_counter()
+    pipeline.warm_up()
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pipeline.process_batch(corpus)
+    first_s = time.perf_counter() - start
+
+    runs = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        pipeline.process_batch(corpus)
+        runs.append(time.perf_counter() - start)
+
+    median_s = statistics.median(runs)
+    megabytes = sum(len(text.encode("utf-8")) for text in corpus) / 1e6
+    return {
+        "steps": list(steps),
+        "load_s": load_s,
+        "first_s": first_s,
+        "runs_s": runs,
+        "min_s": min(runs),
+        "median_s": median_s,
+        "docs_per_s": len(corpus) / median_s if median_s else 0.0,
+        "mb_per_s": megabytes / median_s if median_s else 0.0,
+    }
+
+
+def run_suite(
+    size: int = 2000,
+    repeat: int = 3,
+    steps: list = None,
+    combinations: dict = None,
+    generator: CorpusGenerator = None,
+    progress=None,
+) -> dict:
+    """Jalankan seluruh benchmark.
+
+    Args:
+        size: Jumlah dokumen corpus
+        repeat: Jumlah putaran yang diukur per konfigurasi
+        steps: Step yang diukur sendiri-sendiri (default: semua step dari
+            `Pipeline.get_available_steps()`)
+        combinations: {nama: daftar step} (default: COMBINATIONS)
+        generator: CorpusGenerator (default: seed 42)
+        progress: Callback `progress(group, name)` sebelum tiap pengukuran
+
+    Returns:
+        dict: Hasil lengkap (lihat docstring modul)
+    """
+    generator = generator or CorpusGenerator()
+    corpus = generator.generate(size)
+    if steps is None:
+        steps = list(Pipeline.get_available_steps())
+    if combinations is None:
+        combinations = COMBINATIONS
+
+    configs = {
+        "steps": {step: [step] for step in steps},
+        "combinations": combinations,
+    }
+    results = {group: {} for group in GROUPS}
+    for group in GROUPS:
+        for name, config_steps in configs[group].items():
+            if progress is not None:
+                progress(group, name)
+            results[group][name] = time_pipeline(config_steps, corpus, repeat)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "corpus": {
+            "docs": len(corpus),
+            "chars": sum(map(len, corpus)),
+            "digest": corpus_digest(corpus),
+            "generator": generator.describe(),
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.10,
+    min_seconds: float = 0.001,
+) -> list:
+    """Bandingkan dua hasil `run_suite` berdasarkan median waktu.
+
+    Args:
+        baseline: Hasil yang disimpan sebelumnya
+        current: Hasil terbaru
+        threshold: Perlambatan relatif yang dianggap regresi (0.10 = 10%)
+        min_seconds: Selisih absolut minimum agar perubahan dihitung; mencegah
+            noise pada step yang sangat cepat
+
+    Returns:
+        list: Satu dict per konfigurasi {group, name, baseline_s, current_s,
+        ratio, status} dengan status "regression", "improvement", "ok",
+        "missing" (hanya di baseline) atau "new" (hanya di hasil terbaru)
+    """
+    if baseline.get("schema") != current.get("schema"):
+        raise ValueError(
+            f"Cannot compare schema {baseline.get('schema')} "
+            f"with schema {current.get('schema')}"
+        )
+
+    rows = []
+    for group in GROUPS:
+        old = baseline["results"].get(group, {})
+        new = current["results"].get(group, {})
+        for name in list(old) + [name for name in new if name not in old]:
+            row = {"group": group, "name": name}
+            if name not in new:
+                rows.append({**row, "status": "missing"})
+                continue
+            if name not in old:
+                rows.append({**row, "status": "new"})
+                continue
+
+            old_s, new_s = old[name]["median_s"], new[name]["median_s"]
+            ratio = new_s / old_s if old_s else float("inf")
+            if abs(new_s - old_s) < min_seconds:
+                status = "ok"
+            elif ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 / (1 + threshold):
+                status = "improvement"
+            else:
+                status = "ok"
+            rows.append(
+                {
+                    **row,
+                    "baseline_s": old_s,
+                    "current_s": new_s,
+                    "ratio": ratio,
+                    "status": status,
+                }
+            )
+    return rows
@@ -0,0 +1,402 @@
+"""
+Command line interface nahiarhdNLP.
+
+Contoh:
+
+        nahiarhdnlp process -c config.json data/*.jsonl -o hasil.jsonl
+        cat tweets.txt | nahiarhdnlp process -s remove_urls,remove_mentions,stopword
+        nahiarhdnlp process -c config.yaml dump.csv --field content --workers 8
+        nahiarhdnlp cache warm
+
+Input dibaca dan ditulis secara streaming per chunk, jadi file berukuran
+beberapa GB bisa diproses tanpa dimuat seluruhnya ke memori.
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from itertools import tee
+
+FORMATS = ("jsonl", "csv", "txt")
+
+# Ekstensi file -> format input
+_EXTENSION_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "jsonl",
+    ".csv": "csv",
+    ".txt": "txt",
+}
+
+
+def load_config(path: str) -> dict:
+    """Baca config pipeline {step: True/False} dari file JSON atau YAML."""
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError(
+                "PyYAML belum terinstall. Install dengan: pip install pyyaml"
+            ) from None
+        config = yaml.safe_load(content)
+    else:
+        config = json.loads(content)
+
+    if not isinstance(config, dict):
+        raise ValueError(f"Config {path} must be a mapping of step_name: true/false")
+    return config
+
+
+def expand_inputs(patterns: list) -> list:
+    """Ekspansi path/glob menjadi daftar file; "-" berarti stdin."""
+    if not patterns:
+        return ["-"]
+    paths = []
+    for pattern in patterns:
+        if pattern == "-":
+            paths.append(pattern)
+            continue
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No input matches: {pattern}")
+        paths.extend(matches)
+    return paths
+
+
+def detect_format(path: str, default: str = "txt") -> str:
+    """Tebak format input dari ekstensi file."""
+    if path == "-":
+        return default
+    return _EXTENSION_FORMATS.get(os.path.splitext(path)[1].lower(), default)
+
+
+def _open_input(path: str):
+    if path == "-":
+        if hasattr(sys.stdin, "reconfigure"):
+            sys.stdin.reconfigure(encoding="utf-8", newline="")
+        # Jangan tutup stdin saat blok `with` selesai
+        return contextlib.nullcontext(sys.stdin)
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+class RecordReader:
+    """Baca record dari file/stdin secara streaming.
+
+    Setiap record berupa `(record, text)`: `record` adalah struktur aslinya
+    (dict untuk JSONL/CSV, None untuk TXT) dan `text` adalah teks yang diproses.
+    """
+
+    def __init__(self, paths: list, input_format: str = "auto", field: str = "text"):
+        self.paths = paths
+        self.input_format = input_format
+        self.field = field
+        # Header CSV pertama (dipakai writer CSV)
+        self.fieldnames = None
+
+    def _format_for(self, path: str) -> str:
+        if self.input_format != "auto":
+            return self.input_format
+        return detect_format(path)
+
+    def __iter__(self):
+        for path in self.paths:
+            input_format = self._format_for(path)
+            with _open_input(path) as f:
+                if input_format == "txt":
+                    for line in f:
+                        yield None, line.rstrip("\r\n")
+                elif input_format == "jsonl":
+                    yield from self._read_jsonl(f, path)
+                else:
+                    yield from self._read_csv(f, path)
+
+    def _read_jsonl(self, f, path):
+        first = True
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            # File .json berisi satu array: dibaca utuh, bukan per baris
+            if first and line.lstrip().startswith("["):
+                yield from self._read_json_array(line + f.read(), path)
+                return
+            first = False
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from None
+            yield self._json_record(record)
+
+    def _read_json_array(self, content, path):
+        try:
+            records = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: invalid JSON: {e}") from None
+        if not isinstance(records, list):
+            raise ValueError(f"{path}: expected a JSON array of records")
+        for record in records:
+            yield self._json_record(record)
+
+    def _json_record(self, record):
+        text = record.get(self.field) if isinstance(record, dict) else None
+        return record, text if isinstance(text, str) else None
+
+    def _read_csv(self, f, path):
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None:
+            return
+        if self.field not in reader.fieldnames:
+            raise ValueError(
+                f"{path}: column '{self.field}' not found in {reader.fieldnames}"
+            )
+        if self.fieldnames is None:
+            self.fieldnames = list(reader.fieldnames)
+        for record in reader:
+            yield record, record[self.field]
+
+
+class RecordWriter:
+    """Tulis hasil secara bertahap dalam format yang sama dengan input."""
+
+    def __init__(self, stream, output_format: str, output_field: str, reader):
+        self.stream = stream
+        self.output_format = output_format
+        self.output_field = output_field
+        self.reader = reader
+        self._csv_writer = None
+
+    def write(self, record, result) -> None:
+        if self.output_format == "txt":
+            self.stream.write(_as_text(result) + "\n")
+        elif self.output_format == "jsonl":
+            if record is None:
+                record = {self.reader.field: None}
+            if result is not None:
+                record[self.output_field] = result
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            if record is None:
+                record = {self.reader.field: None}
+            if self._csv_writer is None:
+                fieldnames = list(self.reader.fieldnames or record.keys())
+                if self.output_field not in fieldnames:
+                    fieldnames.append(self.output_field)
+                self._csv_writer = csv.DictWriter(
+                    self.stream, fieldnames=fieldnames, extrasaction="ignore"
+                )
+                self._csv_writer.writeheader()
+            record[self.output_field] = _as_text(result)
+            self._csv_writer.writerow(record)
+
+
+def _as_text(result) -> str:
+    """Hasil step tokenizer berupa list; tulis sebagai token dipisah spasi."""
+    if result is None:
+        return ""
+    if isinstance(result, list):
+        return " ".join(result)
+    return result
+
+
+def _build_pipeline(args):
+    from .preprocessing import Pipeline
+
+    if args.config:
+        config = load_config(args.config)
+    else:
+        config = {}
+    if args.steps:
+        steps = [step.strip() for step in args.steps.split(",")]
+        config.update({step: True for step in steps if step})
+    if not any(config.values()):
+        raise ValueError("No preprocessing steps enabled; use --config or --steps")
+    return Pipeline(config)
+
+
+def run_process(args) -> int:
+    pipeline = _build_pipeline(args)
+    if args.result_cache:
+        pipeline.enable_result_cache(maxsize=args.result_cache)
+    paths = expand_inputs(args.inputs)
+    reader = RecordReader(paths, args.format, args.field)
+
+    if args.format != "auto":
+        output_format = args.format
+    else:
+        formats = {detect_format(path) for path in paths}
+        if len(formats) > 1:
+            raise ValueError(
+                f"Inputs have mixed formats {sorted(formats)}; use --format"
+            )
+        output_format = formats.pop()
+    output_field = args.output_field or args.field
+
+    stats = {"docs": 0, "bytes": 0}
+
+    def texts(records):
+        for _, text in records:
+            stats["docs"] += 1
+            if text:
+                stats["bytes"] += len(text.encode("utf-8"))
+            yield text
+
+    start = time.perf_counter()
+    # Satu iterator untuk teks yang diproses, satu lagi untuk record yang
+    # ditulis ulang; tee hanya menahan record dari chunk yang sedang diproses
+    records_for_texts, records_for_output = tee(reader)
+    if args.workers == 1:
+        results = pipeline.process_iter(
+            texts(records_for_texts), chunk_size=args.chunk_size
+        )
+    else:
+        results = pipeline.process_parallel(
+            texts(records_for_texts),
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            executor=args.executor,
+        )
+
+    if args.output and args.output != "-":
+        output = open(args.output, "w", encoding="utf-8", newline="")
+    else:
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8", newline="")
+        output = contextlib.nullcontext(sys.stdout)
+
+    with output as stream:
+        writer = RecordWriter(stream, output_format, output_field, reader)
+        for result in results:
+            record, _ = next(records_for_output)
+            writer.write(record, result)
+        stream.flush()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        docs, megabytes = stats["docs"], stats["bytes"] / 1e6
+        seconds = max(elapsed, 1e-9)
+        print(
+            f"Processed {docs:,} docs ({megabytes:,.1f} MB) in {elapsed:.2f}s: "
+            f"{docs / seconds:,.0f} docs/s, {megabytes / seconds:,.2f} MB/s",
+            file=sys.stderr,
+        )
+        if pipeline.result_cache is not None:
+            cache = pipeline.result_cache.stats()
+            print(
+                f"Result cache: {cache['saved_rate']:.1%} of docs reused "
+                f"({cache['hits']:,} hits, {cache['deduplicated']:,} duplicates "
+                f"in chunk, hit rate {cache['hit_rate']:.1%})",
+                file=sys.stderr,
+            )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="nahiarhdnlp",
+        description="Preprocessing teks Bahasa Indonesia dari command line.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    process = subparsers.add_parser(
+        "process",
+        help="proses file JSONL/CSV/TXT atau stdin dengan Pipeline",
+        description="Proses corpus JSONL/CSV/TXT secara streaming dengan Pipeline.",
+    )
+    process.add_argument(
+        "inputs",
+        nargs="*",
+        help="file atau glob input (default/'-': stdin)",
+    )
+    process.add_argument("-c", "--config", help="config pipeline (JSON atau YAML)")
+    process.add_argument(
+        "-s", "--steps", help="daftar step dipisah koma, mis. remove_urls,stopword"
+    )
+    process.add_argument("-o", "--output", help="file output (default: stdout)")
+    process.add_argument(
+        "-f",
+        "--format",
+        choices=("auto",) + FORMATS,
+        default="auto",
+        help="format input & output (default: dari ekstensi, stdin = txt)",
+    )
+    process.add_argument(
+        "--field",
+        default="text",
+        help="field JSONL / kolom CSV berisi teks (default: text)",
+    )
+    process.add_argument(
+        "--output-field",
+        help="field/kolom untuk hasil (default: menimpa --field)",
+    )
+    process.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="jumlah worker (default: 1, 0 = jumlah CPU)",
+    )
+    process.add_argument(
+        "--executor",
+        choices=("process", "thread"),
+        default="process",
+        help="jenis worker; thread hanya lebih cepat di Python free-threaded "
+        "(default: process)",
+    )
+    process.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="jumlah record per chunk (default: 1000)",
+    )
+    process.add_argument(
+        "--result-cache",
+        type=int,
+        default=0,
+        metavar="SIZE",
+        help="cache hasil untuk SIZE teks & lewati duplikat (default: 0 = mati)",
+    )
+    process.add_argument(
+        "-q", "--quiet", action="store_true", help="jangan tampilkan throughput"
+    )
+    process.set_defaults(handler=run_process)
+
+    cache = subparsers.add_parser(
+        "cache",
+        help="kelola cache biner dataset",
+        description="Kelola cache biner dataset nahiarhdNLP.",
+    )
+    cache.add_argument("action", choices=["warm", "rebuild", "clear"])
+    cache.set_defaults(handler=run_cache)
+
+    return parser
+
+
+def run_cache(args) -> int:
+    from .datasets.__main__ import main as datasets_main
+
+    return datasets_main([args.action])
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "workers", 1) == 0:
+        args.workers = os.cpu_count() or 1
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
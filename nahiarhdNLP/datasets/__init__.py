@@ -2,6 +2,27 @@
 Dataset module for nahiarhdNLP.
 """
 
-from .loaders import DatasetLoader
+from importlib import import_module
 
-__all__ = ["DatasetLoader"]
+__all__ = ["DatasetLoader", "DatasetCache", "SharedTable", "use_shared_dictionaries"]
+
+# nama atribut -> modul relatif yang mendefinisikannya (di-import saat diakses)
+_LAZY_ATTRS = {
+    "DatasetLoader": ".loaders",
+    "DatasetCache": ".cache",
+    "SharedTable": ".shared",
+    "use_shared_dictionaries": ".shared",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
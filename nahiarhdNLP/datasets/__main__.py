@@ -0,0 +1,46 @@
+"""
+Kelola cache dataset dari command line.
+
+Contoh:
+
+        python -m nahiarhdNLP.datasets warm
+        python -m nahiarhdNLP.datasets rebuild
+        python -m nahiarhdNLP.datasets clear
+"""
+
+import argparse
+import time
+
+from .loaders import DatasetLoader
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m nahiarhdNLP.datasets",
+        description="Kelola cache biner dataset nahiarhdNLP.",
+    )
+    parser.add_argument(
+        "command",
+        choices=["warm", "rebuild", "clear"],
+        help="warm: bangun cache yang belum ada, rebuild: bangun ulang semua, "
+        "clear: hapus semua file cache",
+    )
+    args = parser.parse_args(argv)
+
+    loader = DatasetLoader()
+    if args.command == "clear":
+        removed = loader.clear_cache()
+        print(f"Removed {removed} cache file(s) from {loader.cache.cache_dir}")
+        return 0
+
+    start = time.perf_counter()
+    counts = loader.warm_cache(rebuild=args.command == "rebuild")
+    elapsed = time.perf_counter() - start
+    for name, count in counts.items():
+        print(f"{name:<10} {count:>7,} entries")
+    print(f"Cache ready in {loader.cache.cache_dir} ({elapsed:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
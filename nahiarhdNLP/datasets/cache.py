@@ -0,0 +1,204 @@
+"""
+Cache biner untuk dataset yang sudah diparse.
+
+Hasil parsing dataset (list/dict berisi string) disimpan dengan `marshal` di
+folder cache user, dengan nama file yang memuat versi format, versi Python,
+dan hash isi file sumber. Jika file sumber berubah, hash-nya berubah dan cache
+lama otomatis diabaikan lalu dibangun ulang.
+
+Lokasi cache:
+    1. `NAHIARHDNLP_CACHE_DIR` jika di-set
+    2. `$XDG_CACHE_HOME/nahiarhdNLP`
+    3. `~/.cache/nahiarhdNLP`
+
+Set `NAHIARHDNLP_NO_CACHE=1` untuk menonaktifkan cache sepenuhnya.
+"""
+
+import gc
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+# Naikkan jika struktur data yang di-cache berubah
+CACHE_VERSION = 1
+
+CACHE_DIR_ENV_VAR = "NAHIARHDNLP_CACHE_DIR"
+NO_CACHE_ENV_VAR = "NAHIARHDNLP_NO_CACHE"
+
+_SUFFIX = ".marshal"
+# Format marshal bisa berbeda antar versi Python
+_PYTHON = f"py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def default_cache_dir() -> Path:
+    """Folder cache sesuai environment variable / konvensi XDG."""
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "nahiarhdNLP"
+
+
+def file_digest(*paths: Union[str, Path]) -> str:
+    """Hash isi satu atau beberapa file sumber."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def text_digest(items: Iterable[str]) -> str:
+    """Hash daftar string (mis. wordlist yang sudah ada di memori)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for item in items:
+        digest.update(item.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """Penyimpanan hasil parsing dataset di disk.
+
+    Example:
+        >>> cache = DatasetCache()
+        >>> data = cache.load_or_build("slang", digest, parse_slang)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """Inisialisasi cache.
+
+        Args:
+            cache_dir: Folder cache (default: `default_cache_dir()`)
+            enabled: Aktif/nonaktif (default: aktif, kecuali
+                NAHIARHDNLP_NO_CACHE di-set)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        if enabled is None:
+            enabled = not os.environ.get(NO_CACHE_ENV_VAR)
+        self.enabled = enabled
+
+    def path_for(self, name: str, digest: str) -> Path:
+        """Path file cache untuk dataset `name` dengan hash sumber `digest`."""
+        return self.cache_dir / f"{name}-v{CACHE_VERSION}-{_PYTHON}-{digest}{_SUFFIX}"
+
+    def load(self, name: str, digest: str) -> Any:
+        """Baca cache; None jika belum ada atau rusak."""
+        if not self.enabled:
+            return None
+        try:
+            # loads(read()) jauh lebih cepat daripada marshal.load(file)
+            raw = self.path_for(name, digest).read_bytes()
+        except OSError:
+            return None
+
+        # Data berisi ratusan ribu objek baru tanpa siklus; GC hanya memperlambat
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return marshal.loads(raw)
+        except (EOFError, ValueError, TypeError):
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def store(self, name: str, digest: str, data: Any) -> bool:
+        """Tulis cache secara atomik dan hapus versi lama dataset yang sama.
+
+        Returns:
+            True jika berhasil ditulis. Kegagalan (mis. filesystem read-only)
+            tidak dianggap error karena cache hanya optimasi.
+        """
+        if not self.enabled:
+            return False
+        path = self.path_for(name, digest)
+        if not self.write_atomic(path, marshal.dumps(data)):
+            return False
+        self.remove_stale(f"{name}-v*-{_PYTHON}-*{_SUFFIX}", keep=path)
+        return True
+
+    def write_atomic(self, path: Path, payload: bytes) -> bool:
+        """Tulis `payload` ke `path` lewat file sementara + `os.replace`.
+
+        Proses lain tidak pernah melihat file yang setengah tertulis.
+
+        Returns:
+            True jika berhasil ditulis
+        """
+        import tempfile
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def remove_stale(self, pattern: str, keep: Path) -> None:
+        """Hapus file cache yang cocok dengan `pattern` kecuali `keep`."""
+        for stale in self.cache_dir.glob(pattern):
+            if stale != keep:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+    def load_or_build(
+        self,
+        name: str,
+        digest: str,
+        builder: Callable[[], Any],
+        rebuild: bool = False,
+    ) -> Any:
+        """Ambil data dari cache, atau bangun lewat `builder` lalu simpan.
+
+        Args:
+            name: Nama dataset (dipakai sebagai prefix nama file)
+            digest: Hash sumber data (lihat `file_digest`)
+            builder: Fungsi tanpa argumen yang menghasilkan data (hanya tipe
+                bawaan: str, int, list, dict, tuple)
+            rebuild: Abaikan cache yang ada dan bangun ulang
+
+        Returns:
+            Data hasil cache atau builder
+        """
+        if not rebuild:
+            data = self.load(name, digest)
+            if data is not None:
+                return data
+        data = builder()
+        self.store(name, digest, data)
+        return data
+
+    def clear(self) -> int:
+        """Hapus semua file cache. Returns: jumlah file yang dihapus."""
+        removed = 0
+        if not self.cache_dir.is_dir():
+            return removed
+        paths = list(self.cache_dir.glob(f"*{_SUFFIX}"))
+        # Tabel memory-mapped dari nahiarhdNLP.datasets.shared
+        paths += self.cache_dir.glob("*.table")
+        for path in paths:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
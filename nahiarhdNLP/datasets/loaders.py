@@ -1,84 +1,201 @@
+import ast
+import csv
 import json
 from pathlib import Path
 
-import pandas as pd
+from .cache import DatasetCache, file_digest
 
 
 class DatasetLoader:
-    """Loader untuk dataset NLP Indonesia dari file CSV lokal."""
+    """Loader untuk dataset NLP Indonesia dari file CSV lokal.
 
-    def __init__(self):
+    Hasil parsing CSV disimpan di cache biner (lihat `nahiarhdNLP.datasets.cache`)
+    sehingga pemanggilan berikutnya, termasuk di proses lain, tidak perlu
+    mem-parse ulang CSV.
+    """
+
+    # nama dataset -> (nama file, nama method parser)
+    CACHED_DATASETS = {
+        "stopwords": ("stop_word.csv", "_parse_stopwords"),
+        "slang": ("slang.csv", "_parse_slang"),
+        "emoji": ("emoji.csv", "_parse_emoji"),
+        "wordlist": ("wordlist.json", "_parse_wordlist"),
+        "root_words": ("kata_dasar_kbbi.csv", "_parse_root_words"),
+        "kamus": ("kamus.txt", "_parse_kamus"),
+    }
+
+    def __init__(self, cache=None):
+        """Inisialisasi loader.
+
+        Args:
+            cache: DatasetCache yang dipakai (default: cache di folder user)
+        """
         # Path ke folder datasets
         self.datasets_dir = Path(__file__).parent
+        self.cache = cache if cache is not None else DatasetCache()
+
+    def dataset_digest(self, name):
+        """Hash isi file sumber dataset `name` (lihat CACHED_DATASETS)."""
+        filename, _ = self.CACHED_DATASETS[name]
+        return file_digest(self.datasets_dir / filename)
+
+    def _load_cached(self, name, rebuild=False):
+        filename, parser = self.CACHED_DATASETS[name]
+        path = self.datasets_dir / filename
+        return self.cache.load_or_build(
+            name,
+            self.dataset_digest(name),
+            lambda: getattr(self, parser)(path),
+            rebuild=rebuild,
+        )
+
+    def warm_cache(self, rebuild=False):
+        """Bangun cache untuk semua dataset.
+
+        Args:
+            rebuild: Bangun ulang walaupun cache sudah ada
+
+        Returns:
+            Dict nama dataset -> jumlah entri
+        """
+        return {
+            name: len(self._load_cached(name, rebuild=rebuild))
+            for name in self.CACHED_DATASETS
+        }
+
+    def clear_cache(self):
+        """Hapus semua file cache dataset. Returns: jumlah file yang dihapus."""
+        return self.cache.clear()
 
     def load_stopwords_dataset(self, language="indonesian"):
         """Load stopwords dari CSV."""
-        csv_path = self.datasets_dir / "stop_word.csv"
         try:
-            df = pd.read_csv(csv_path)
-            # Kolom: stopword
-            data = df["stopword"].dropna().astype(str).tolist()
-            return data
+            return self._load_cached("stopwords")
         except Exception as e:
             print(f"Error loading stopwords from CSV: {e}")
             return []
 
     def load_slang_dataset(self, language="indonesian"):
         """Load slang dari CSV."""
-        csv_path = self.datasets_dir / "slang.csv"
         try:
-            df = pd.read_csv(csv_path)
-            # Kolom: slang, formal
-            data = []
-            for idx in range(len(df)):
-                slang_val = df.iloc[idx, 0]
-                formal_val = df.iloc[idx, 1]
-                if pd.notnull(slang_val) and pd.notnull(formal_val):
-                    data.append({"slang": str(slang_val), "formal": str(formal_val)})
-            return data
+            return self._load_cached("slang")
         except Exception as e:
             print(f"Error loading slang from CSV: {e}")
             return []
 
     def load_emoji_dataset(self, language="indonesian"):
         """Load emoji dari CSV."""
-        csv_path = self.datasets_dir / "emoji.csv"
         try:
-            df = pd.read_csv(csv_path)
-            # Kolom: emoji, name_id, alias, aliases (aliases berupa string list)
-            data = []
-            for idx in range(len(df)):
-                row = df.iloc[idx]
-                aliases_val = row.get("aliases", "")
-                aliases_list = []
-                if pd.notnull(aliases_val):
-                    aliases_str = str(aliases_val).strip()
-                    if aliases_str and aliases_str != "nan":
-                        try:
-                            aliases_list = eval(aliases_str)
-                        except Exception as e:
-                            print(f"Error loading emoji from CSV: {e}")
-                            aliases_list = []
-
-                item = {
-                    "emoji": str(row.get("emoji", "")),
-                    "name_id": str(row.get("name_id", "")),
-                    "alias": str(row.get("alias", "")),
-                    "aliases": aliases_list,
-                }
-                data.append(item)
-            return data
+            return self._load_cached("emoji")
         except Exception as e:
             print(f"Error loading emoji from CSV: {e}")
             return []
 
     def load_wordlist_dataset(self, language="indonesian"):
         """Load wordlist dari JSON."""
-        json_path = self.datasets_dir / "wordlist.json"
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data if isinstance(data, list) else []
+            return self._load_cached("wordlist")
         except Exception as e:
             print(f"Error loading wordlist from JSON: {e}")
             return []
+
+    def load_root_words_dataset(self, language="indonesian"):
+        """Load kata dasar KBBI (satu kata, huruf kecil) dari CSV."""
+        try:
+            return self._load_cached("root_words")
+        except Exception as e:
+            print(f"Error loading root words from CSV: {e}")
+            return []
+
+    def load_kamus_dataset(self, language="indonesian"):
+        """Load entri kamus.txt: list (entri, kode kelas kata atau None)."""
+        try:
+            return self._load_cached("kamus")
+        except Exception as e:
+            print(f"Error loading kamus from TXT: {e}")
+            return []
+
+    @staticmethod
+    def _read_csv_rows(csv_path):
+        """Baca CSV sebagai list dict (kolom -> nilai, sel kosong jadi None)."""
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            return [
+                {key: value if value else None for key, value in row.items()}
+                for row in csv.DictReader(f)
+            ]
+
+    @classmethod
+    def _parse_stopwords(cls, csv_path):
+        # Kolom: stopword
+        return [
+            row["stopword"]
+            for row in cls._read_csv_rows(csv_path)
+            if row["stopword"] is not None
+        ]
+
+    @staticmethod
+    def _parse_slang(csv_path):
+        # Kolom: slang, formal
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header
+            return [
+                {"slang": row[0], "formal": row[1]}
+                for row in reader
+                if len(row) >= 2 and row[0] and row[1]
+            ]
+
+    @classmethod
+    def _parse_emoji(cls, csv_path):
+        # Kolom: emoji, name_id, alias, aliases (aliases berupa string list)
+        data = []
+        for row in cls._read_csv_rows(csv_path):
+            aliases_list = []
+            aliases_str = (row.get("aliases") or "").strip()
+            if aliases_str:
+                try:
+                    aliases_list = list(ast.literal_eval(aliases_str))
+                except Exception as e:
+                    print(f"Error loading emoji from CSV: {e}")
+                    aliases_list = []
+
+            data.append(
+                {
+                    "emoji": row.get("emoji") or "",
+                    "name_id": row.get("name_id") or "",
+                    "alias": row.get("alias") or "",
+                    "aliases": aliases_list,
+                }
+            )
+        return data
+
+    @staticmethod
+    def _parse_wordlist(json_path):
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, list) else []
+
+    @staticmethod
+    def _parse_root_words(csv_path):
+        # Kolom: kata, kelas kata (tanpa header). Entri berspasi (mis. "adu
+        # domba") dilewati karena tidak pernah cocok dengan satu token.
+        words = {}
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                word = row[0].strip().lower() if row else ""
+                if word and " " not in word:
+                    words[word] = None
+        return list(words)
+
+    @staticmethod
+    def _parse_kamus(txt_path):
+        # Format per baris: "<kode kelas kata>\t<entri>". Kode kosong untuk
+        # afiks ("-an", "ber-", "-el-", "ber -- an") dan kata tanpa kelas.
+        entries = []
+        with open(txt_path, "r", encoding="utf-8") as f:
+            for line in f:
+                tag, _, entry = line.rstrip("\r\n").partition("\t")
+                entry = entry.strip()
+                if entry:
+                    entries.append((entry, tag.strip() or None))
+        return entries
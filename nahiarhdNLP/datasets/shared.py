@@ -0,0 +1,408 @@
+"""
+Dictionary read-only dalam format biner ringkas yang bisa dibagi antarproses.
+
+Setiap worker yang memuat dictionary besar (wordlist, slang, indeks SymSpell,
+emoji) sebagai dict/set Python menyimpan salinannya sendiri: jutaan objek
+string kecil, dan halaman copy-on-write hasil `fork` pun ikut tersalin karena
+refcount objek diubah setiap kali dibaca. `SharedTable` menyimpan seluruh
+dictionary sebagai satu hash table di buffer datar (tanpa objek per entri)
+yang di-`mmap` dari folder cache dataset; semua proses yang membuka file yang
+sama memakai halaman memori yang sama dari page cache OS, jadi RSS per worker
+tambahan hampir tidak bertambah.
+
+Format (semua bilangan uint32 native, urutan bagian):
+
+    header | slot_hashes[slots] | slot_entries[slots] | key_offsets[n+1] |
+    value_offsets[n+1] | postings[p] | key_bytes | value_bytes
+
+Kunci disimpan sebagai UTF-8 berurutan sesuai urutan sisip dan di-hash dengan
+`zlib.crc32` (deterministik antarproses, tidak seperti `hash()`). Tabel
+memakai open addressing dengan load factor <= 0.5.
+
+Mode shared diaktifkan lewat `use_shared_dictionaries(True)` atau env var
+`NAHIARHDNLP_SHARED_DICTS=1`; worker `Pipeline.process_parallel` memakainya
+secara default.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from zlib import crc32
+
+from .cache import DatasetCache
+
+SHARED_ENV_VAR = "NAHIARHDNLP_SHARED_DICTS"
+
+# Naikkan jika layout biner berubah
+FORMAT_VERSION = 1
+
+# Jenis nilai tabel
+KIND_SET = 0  # hanya kunci
+KIND_STR = 1  # kunci -> str
+KIND_INTS = 2  # kunci -> deret uint32 (mis. id kata)
+
+_MAGIC = b"NHDT"
+# magic, versi, jenis, entri, slot, postings, byte kunci, byte nilai
+_HEADER = struct.Struct("=4sIIIIIII")
+_SUFFIX = ".table"
+
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+# Jumlah hasil lookup terakhir yang diingat per proses (lihat SharedTable)
+DEFAULT_MEMO_SIZE = 65_536
+
+# None = ikuti env var / default pemanggil (lihat shared_dictionaries_enabled)
+_enabled: Optional[bool] = None
+
+
+def use_shared_dictionaries(enabled: Optional[bool] = True) -> None:
+    """Aktifkan/nonaktifkan dictionary shared untuk resource yang dibuat sesudahnya.
+
+    Args:
+        enabled: True/False, atau None untuk kembali mengikuti env var
+            NAHIARHDNLP_SHARED_DICTS
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def shared_dictionaries_enabled(default: bool = False) -> bool:
+    """Apakah resource baru sebaiknya memakai SharedTable.
+
+    Args:
+        default: Nilai jika belum diatur lewat `use_shared_dictionaries`
+            maupun env var
+
+    Returns:
+        bool: Status mode shared
+    """
+    if _enabled is not None:
+        return _enabled
+    value = os.environ.get(SHARED_ENV_VAR)
+    if value:
+        return value.lower() not in ("0", "false", "no", "off")
+    return default
+
+
+def _encode(key: str) -> bytes:
+    return key.encode("utf-8", "surrogatepass")
+
+
+def _decode(data) -> str:
+    return str(data, "utf-8", "surrogatepass")
+
+
+class SharedTable(Mapping):
+    """Hash table read-only di atas satu buffer (bytes atau mmap).
+
+    Berperilaku seperti dict (`in`, `get`, `[]`, iterasi sesuai urutan
+    sisip); untuk KIND_SET nilainya selalu True. Nilai KIND_INTS berupa
+    memoryview uint32 tanpa salinan.
+
+    Lookup di buffer dilakukan di Python (~1 µs), jadi hasil lookup terakhir
+    diingat di dict kecil per proses. Token teks mengikuti distribusi Zipf,
+    sehingga sebagian besar lookup cukup dijawab memo ini; ukurannya dibatasi
+    `memo_size` dan dikosongkan saat penuh, jadi tidak tumbuh seukuran tabel.
+
+    Example:
+        >>> table = SharedTable(SharedTable.build({"gw": "saya"}, KIND_STR))
+        >>> table["gw"], "lu" in table
+        ('saya', False)
+    """
+
+    def __init__(self, buffer, memo_size: int = DEFAULT_MEMO_SIZE):
+        """Buka tabel dari buffer hasil `build`.
+
+        Args:
+            buffer: bytes, bytearray, atau mmap berisi tabel
+            memo_size: Jumlah hasil lookup yang diingat (0 untuk menonaktifkan)
+
+        Raises:
+            ValueError: Jika buffer bukan tabel yang valid untuk versi ini
+        """
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError("buffer is too small for a shared table")
+        magic, version, kind, entries, slots, postings, key_size, value_size = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != _MAGIC or version != FORMAT_VERSION or kind > KIND_INTS:
+            raise ValueError("not a shared table (or an incompatible version)")
+        counts = (slots, slots, entries + 1, entries + 1, postings)
+        expected = _HEADER.size + 4 * sum(counts) + key_size + value_size
+        if len(view) != expected or slots & (slots - 1):
+            raise ValueError("shared table is truncated or corrupt")
+
+        self._buffer = buffer
+        self.memo_size = memo_size
+        self._memo = {}
+        self.kind = kind
+        self._size = entries
+        self._mask = slots - 1
+        arrays = []
+        offset = _HEADER.size
+        for count in counts:
+            arrays.append(view[offset : offset + 4 * count].cast(_UINT32))
+            offset += 4 * count
+        (
+            self._slot_hashes,
+            self._slot_entries,
+            self._key_offsets,
+            self._value_offsets,
+            self._postings,
+        ) = arrays
+        # Slice langsung dari buffer (bytes/mmap) menghasilkan bytes, jauh lebih
+        # cepat dibanding membandingkan slice memoryview
+        self._key_start = offset
+        self._value_start = offset + key_size
+
+    @staticmethod
+    def build(data: Union[Mapping, Iterable], kind: int = KIND_SET) -> bytes:
+        """Serialisasi data menjadi tabel.
+
+        Args:
+            data: Iterable kunci (KIND_SET), dict kunci -> str (KIND_STR), atau
+                dict kunci -> int / iterable int (KIND_INTS). Kunci duplikat
+                hanya disimpan sekali di posisi kemunculan pertamanya.
+            kind: KIND_SET, KIND_STR, atau KIND_INTS
+
+        Returns:
+            bytes: Isi tabel, siap ditulis ke file atau dibuka dengan SharedTable
+        """
+        if kind == KIND_SET:
+            items = dict.fromkeys(data, True)
+        elif kind in (KIND_STR, KIND_INTS):
+            items = dict(data)
+        else:
+            raise ValueError(f"Unknown shared table kind: {kind}")
+
+        slots = 8
+        while slots < 2 * len(items):
+            slots *= 2
+        mask = slots - 1
+        slot_hashes = array(_UINT32, bytes(4 * slots))
+        slot_entries = array(_UINT32, bytes(4 * slots))
+        key_offsets = array(_UINT32, [0])
+        value_offsets = array(_UINT32, [0])
+        postings = array(_UINT32)
+        keys = bytearray()
+        values = bytearray()
+
+        for entry, (key, value) in enumerate(items.items()):
+            encoded = _encode(key)
+            keys += encoded
+            key_offsets.append(len(keys))
+            if kind == KIND_STR:
+                values += _encode(value)
+                value_offsets.append(len(values))
+            elif kind == KIND_INTS:
+                if isinstance(value, int):
+                    postings.append(value)
+                else:
+                    postings.extend(value)
+                value_offsets.append(len(postings))
+            else:
+                value_offsets.append(0)
+
+            key_hash = crc32(encoded)
+            slot = key_hash & mask
+            while slot_entries[slot]:
+                slot = (slot + 1) & mask
+            slot_hashes[slot] = key_hash
+            slot_entries[slot] = entry + 1
+
+        header = _HEADER.pack(
+            _MAGIC,
+            FORMAT_VERSION,
+            kind,
+            len(items),
+            slots,
+            len(postings),
+            len(keys),
+            len(values),
+        )
+        return b"".join(
+            [
+                header,
+                slot_hashes.tobytes(),
+                slot_entries.tobytes(),
+                key_offsets.tobytes(),
+                value_offsets.tobytes(),
+                postings.tobytes(),
+                bytes(keys),
+                bytes(values),
+            ]
+        )
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "SharedTable":
+        """Buka tabel dari file lewat mmap read-only (tanpa membaca isinya)."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except ValueError:
+            buffer.close()
+            raise
+
+    def _find(self, key) -> int:
+        """Index entri untuk `key`, atau -1."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return -1
+
+        entry = self._probe(key)
+        if self.memo_size:
+            memo = self._memo
+            if len(memo) >= self.memo_size:
+                memo.clear()
+            memo[key] = entry
+        return entry
+
+    def _probe(self, key) -> int:
+        try:
+            encoded = key.encode()
+        except UnicodeEncodeError:
+            # Surrogate tunggal disimpan apa adanya (lihat _encode)
+            encoded = _encode(key)
+        except AttributeError:
+            return -1
+        key_hash = crc32(encoded)
+        mask = self._mask
+        slot = key_hash & mask
+        slot_hashes = self._slot_hashes
+        slot_entries = self._slot_entries
+        entry = slot_entries[slot]
+        while entry:
+            if slot_hashes[slot] == key_hash:
+                offsets = self._key_offsets
+                start = self._key_start
+                if (
+                    self._buffer[start + offsets[entry - 1] : start + offsets[entry]]
+                    == encoded
+                ):
+                    return entry - 1
+            slot = (slot + 1) & mask
+            entry = slot_entries[slot]
+        return -1
+
+    def _value(self, entry: int):
+        kind = self.kind
+        if kind == KIND_SET:
+            return True
+        offsets = self._value_offsets
+        if kind == KIND_STR:
+            start = self._value_start
+            return _decode(
+                self._buffer[start + offsets[entry] : start + offsets[entry + 1]]
+            )
+        return self._postings[offsets[entry] : offsets[entry + 1]]
+
+    def key_at(self, entry: int) -> str:
+        """Kunci ke-`entry` sesuai urutan sisip."""
+        offsets = self._key_offsets
+        start = self._key_start
+        return _decode(
+            self._buffer[start + offsets[entry] : start + offsets[entry + 1]]
+        )
+
+    def keys_view(self) -> "KeySequence":
+        """Kunci sebagai sequence read-only (mis. pengganti list wordlist)."""
+        return KeySequence(self)
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) >= 0
+
+    def get(self, key, default=None):
+        entry = self._find(key)
+        return default if entry < 0 else self._value(entry)
+
+    def __getitem__(self, key):
+        entry = self._find(key)
+        if entry < 0:
+            raise KeyError(key)
+        return self._value(entry)
+
+    def __iter__(self):
+        for entry in range(self._size):
+            yield self.key_at(entry)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"SharedTable(kind={self.kind}, entries={self._size})"
+
+
+class KeySequence(Sequence):
+    """Kunci SharedTable sebagai sequence read-only, tanpa salinan."""
+
+    def __init__(self, table: SharedTable):
+        self.table = table
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.key_at(i) for i in range(*index.indices(len(self)))]
+        size = len(self.table)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("KeySequence index out of range")
+        return self.table.key_at(index)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, key) -> bool:
+        return key in self.table
+
+    def __repr__(self) -> str:
+        return f"KeySequence(entries={len(self)})"
+
+
+def shared_table(
+    name: str,
+    digest: str,
+    builder,
+    kind: int = KIND_SET,
+    cache: Optional[DatasetCache] = None,
+) -> SharedTable:
+    """Buka tabel `name` dari folder cache, atau bangun lalu simpan dulu.
+
+    File yang sudah ada cukup di-mmap. Jika cache nonaktif atau tidak bisa
+    ditulis, tabel tetap dibangun di memori proses ini (masih ringkas, tapi
+    tidak terbagi dengan proses lain).
+
+    Args:
+        name: Nama tabel (prefix nama file)
+        digest: Hash sumber data; berubah = tabel dibangun ulang
+        builder: Fungsi tanpa argumen yang menghasilkan data untuk `build`
+        kind: KIND_SET, KIND_STR, atau KIND_INTS
+        cache: DatasetCache yang menentukan folder (default: cache baru)
+
+    Returns:
+        SharedTable: Tabel siap pakai
+    """
+    cache = cache if cache is not None else DatasetCache()
+    path = cache.cache_dir / f"{name}-t{FORMAT_VERSION}-{digest}{_SUFFIX}"
+    if cache.enabled:
+        try:
+            return SharedTable.open(path)
+        except (OSError, ValueError):
+            pass
+
+    payload = SharedTable.build(builder(), kind)
+    if cache.enabled and cache.write_atomic(path, payload):
+        cache.remove_stale(f"{name}-t*-*{_SUFFIX}", keep=path)
+        try:
+            return SharedTable.open(path)
+        except (OSError, ValueError):
+            pass
+    return SharedTable(payload)
@@ -4,8 +4,28 @@ Expose `Pipeline` for convenience so callers can do:
 
         from nahiarhdNLP.preprocessing import Pipeline
 
+`Pipeline` is loaded lazily (PEP 562) on first access, so importing this
+package stays cheap.
 """
 
-from .main import Pipeline  # noqa: F401
+from importlib import import_module
 
 __all__ = ["Pipeline"]
+
+# nama atribut -> modul relatif yang mendefinisikannya
+_LAZY_ATTRS = {
+    "Pipeline": ".main",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,154 @@
+"""
+Micro-batching untuk API async Pipeline.
+
+Request `aprocess` yang datang bersamaan dikumpulkan menjadi satu batch kecil
+lalu dijalankan di executor (thread atau process), sehingga event loop tidak
+pernah menjalankan preprocessing sendiri. Jumlah item yang menunggu dan batch
+yang berjalan bersamaan dibatasi (backpressure).
+"""
+
+import asyncio
+
+
+class MicroBatcher:
+    """Gabungkan item dari banyak coroutine menjadi batch.
+
+    Batch dikirim saat berisi `max_batch_size` item, atau setelah `max_delay`
+    detik sejak item pertama masuk, mana yang lebih dulu.
+
+    Example:
+        >>> batcher = MicroBatcher(run_batch, max_batch_size=64)
+        >>> result = await batcher.submit("teks")
+    """
+
+    def __init__(
+        self,
+        run_batch,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+        max_pending: int = 10_000,
+        max_concurrency: int = 4,
+    ):
+        """Inisialisasi batcher. Harus dibuat di dalam event loop yang dipakai.
+
+        Args:
+            run_batch: Coroutine function `run_batch(items) -> list hasil`
+            max_batch_size: Jumlah item maksimum per batch
+            max_delay: Waktu tunggu maksimum (detik) sebelum batch dikirim
+            max_pending: Jumlah item maksimum yang sedang menunggu/diproses;
+                pemanggil berikutnya menunggu sampai ada slot kosong
+            max_concurrency: Jumlah batch maksimum yang berjalan bersamaan
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_pending < max_batch_size:
+            raise ValueError("max_pending must be >= max_batch_size")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_concurrency = max_concurrency
+        self.loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(max_pending)
+        self._running = asyncio.Semaphore(max_concurrency)
+        self._pending = []
+        self._flush_handle = None
+        # Referensi task agar tidak di-garbage-collect sebelum selesai
+        self._tasks = set()
+
+    async def submit(self, item):
+        """Masukkan satu item ke batch berikutnya dan tunggu hasilnya."""
+        await self._slots.acquire()
+        try:
+            future = self.loop.create_future()
+            self._pending.append((item, future))
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = self.loop.call_later(self.max_delay, self._flush)
+            return await future
+        finally:
+            self._slots.release()
+
+    async def map(self, items: list) -> list:
+        """Proses banyak item langsung per batch, tanpa menunggu `max_delay`.
+
+        Setiap item memakai satu slot `max_pending` seperti `submit`, dan
+        paling banyak `max_concurrency` batch dari satu pemanggilan `map` yang
+        berjalan sekaligus. Batch berikutnya baru dikirim setelah ada yang
+        selesai, sehingga request `submit` lain tidak mengantre di belakang
+        seluruh isi `map`.
+        """
+        size = self.max_batch_size
+        tasks = []
+        in_flight = set()
+        try:
+            for start in range(0, len(items), size):
+                while len(in_flight) >= self.max_concurrency:
+                    _, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                batch = items[start : start + size]
+                await self._acquire_slots(len(batch))
+                task = self.loop.create_task(self._run_mapped(batch))
+                tasks.append(task)
+                in_flight.add(task)
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [result for batch in results for result in batch]
+
+    async def _acquire_slots(self, count: int) -> None:
+        acquired = 0
+        try:
+            for _ in range(count):
+                await self._slots.acquire()
+                acquired += 1
+        except BaseException:
+            for _ in range(acquired):
+                self._slots.release()
+            raise
+
+    async def _run_mapped(self, items: list) -> list:
+        try:
+            return await self._run_limited(items)
+        finally:
+            for _ in items:
+                self._slots.release()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = self.loop.create_task(self._run_pending(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_limited(self, items: list) -> list:
+        async with self._running:
+            return await self.run_batch(items)
+
+    async def _run_pending(self, batch: list) -> None:
+        try:
+            results = await self._run_limited([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            # Pemanggil yang sudah dibatalkan dilewati
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,146 @@
+"""
+Fusi step cleaning berbasis regex menjadi satu rangkaian pass yang minimal.
+
+Hampir setiap method cleaning melakukan `re.sub(pola)` lalu merapikan spasi
+(`re.sub(r"\\s+", " ")` + `strip()`). Jika beberapa step seperti itu berurutan,
+perapian spasi di antaranya tidak perlu: pola-pola ini tidak peduli berapa
+banyak spasi di antara kata, jadi cukup dirapikan sekali di akhir. Step yang
+hasilnya bergantung pada jumlah spasi (mis. `remove_phones`) tetap menerima
+input yang sudah rapi.
+"""
+
+from collections import namedtuple
+from functools import partial
+
+from . import text_cleaner, text_cleaner_word, text_replace
+
+
+def collapse_whitespace(text: str) -> str:
+    """Setara `re.sub(r"\\s+", " ", text).strip()`, tapi jauh lebih cepat.
+
+    Keduanya memakai definisi whitespace Unicode yang sama (`str.isspace`).
+    """
+    return " ".join(text.split())
+
+
+# Memakai collections.namedtuple (bukan typing.NamedTuple) supaya modul ini
+# tidak meng-import `typing` di jalur import pipeline cleaning
+CleaningOp = namedtuple(
+    "CleaningOp",
+    ["apply", "collapse", "whitespace_sensitive", "keeps_collapsed"],
+    defaults=(False, False),
+)
+CleaningOp.__doc__ = """Deskripsi satu step cleaning yang bisa difusikan.
+
+Attributes:
+    apply: Transformasi utama (None jika step hanya merapikan spasi)
+    collapse: Step aslinya merapikan spasi setelah `apply`
+    whitespace_sensitive: Hasil `apply` bergantung pada jumlah/posisi spasi,
+        jadi inputnya harus sudah dirapikan
+    keeps_collapsed: Input yang spasinya sudah rapi tetap rapi setelah
+        `apply` (dipakai planner, lihat preprocessing.planner)
+
+Step dengan `collapse=False` wajib tidak peduli jumlah spasi dan tidak
+menghasilkan spasi baru, agar perapian yang tertunda tetap sah.
+"""
+
+
+def _sub(pattern, repl: str):
+    return partial(pattern.sub, repl)
+
+
+# Setara dengan method aslinya untuk kwargs yang dipakai Pipeline
+CLEANING_OPS = {
+    "remove_html": CleaningOp(_sub(text_cleaner.HTML_PATTERN, " "), True),
+    "remove_urls": CleaningOp(_sub(text_cleaner.URL_PATTERN, " "), True),
+    "remove_mentions": CleaningOp(_sub(text_cleaner.MENTION_PATTERN, " "), True),
+    "remove_hashtags": CleaningOp(_sub(text_cleaner.HASHTAG_PATTERN, " "), True),
+    "remove_punctuation": CleaningOp(_sub(text_cleaner.PUNCTUATION_PATTERN, " "), True),
+    "remove_emoji": CleaningOp(_sub(text_cleaner.EMOJI_PATTERN, " "), True),
+    "remove_lowercase": CleaningOp(str.lower, False, keeps_collapsed=True),
+    "remove_extra_spaces": CleaningOp(None, True),
+    # \t, \n, \r diganti spasi lalu dirapikan = cukup dirapikan
+    "remove_whitespace": CleaningOp(None, True),
+    "remove_repeated_chars": CleaningOp(
+        _sub(text_cleaner.REPEATED_CHARS_PATTERN, r"\1\1"), False, keeps_collapsed=True
+    ),
+    "remove_special_chars": CleaningOp(
+        _sub(text_cleaner.SPECIAL_CHARS_PATTERN, ""), True
+    ),
+    "remove_emails": CleaningOp(_sub(text_cleaner.EMAIL_PATTERN, ""), True),
+    # Pola telepon menghitung spasi ({8,}), jadi butuh input yang sudah rapi
+    "remove_phones": CleaningOp(_sub(text_cleaner.PHONE_PATTERN, ""), True, True),
+    "remove_currency": CleaningOp(_sub(text_cleaner.CURRENCY_PATTERN, ""), True),
+    "remove_numbers": CleaningOp(_sub(text_cleaner.NUMBER_PATTERN, " "), True),
+    "clean_urls": CleaningOp(_sub(text_cleaner_word.URL_PROTOCOL_PATTERN, ""), True),
+    "clean_mentions": CleaningOp(_sub(text_cleaner_word.MENTION_PATTERN, r" \1"), True),
+    "clean_hashtags": CleaningOp(_sub(text_cleaner_word.HASHTAG_PATTERN, r" \1"), True),
+    "clean_html": CleaningOp(_sub(text_cleaner_word.HTML_PATTERN, " "), True),
+    "replace_email": CleaningOp(
+        _sub(text_replace.EMAIL_PATTERN, "<email>"), False, keeps_collapsed=True
+    ),
+    "replace_link": CleaningOp(
+        _sub(text_replace.URL_PATTERN, "<link>"), False, keeps_collapsed=True
+    ),
+    "replace_user": CleaningOp(
+        _sub(text_replace.USER_PATTERN, "<user>"), False, keeps_collapsed=True
+    ),
+}
+
+
+class FusedCleaner:
+    """Gabungan beberapa step cleaning berurutan dengan perapian spasi minimal.
+
+    Hasilnya identik dengan menjalankan method aslinya satu per satu.
+
+    Example:
+        >>> fused = FusedCleaner(["remove_html", "remove_urls", "remove_mentions"])
+        >>> fused("<p>Halo   @budi</p> https://x.com")
+        'Halo'
+    """
+
+    def __init__(self, steps, trailing_collapse: bool = True):
+        """Susun rencana eksekusi.
+
+        Args:
+            steps: Nama step (harus ada di CLEANING_OPS), sesuai urutan config
+            trailing_collapse: False jika hasilnya langsung dipecah dengan
+                `split()` oleh step berikutnya, sehingga perapian spasi
+                terakhir tidak diperlukan
+        """
+        self.steps = tuple(steps)
+        self.trailing_collapse = trailing_collapse
+        unknown = [step for step in self.steps if step not in CLEANING_OPS]
+        if unknown:
+            raise ValueError(f"Steps cannot be fused: {unknown}")
+
+        plan = []
+        # True jika ada perapian spasi yang tertunda
+        dirty = False
+        for step in self.steps:
+            op = CLEANING_OPS[step]
+            if op.whitespace_sensitive and dirty:
+                plan.append(collapse_whitespace)
+                dirty = False
+            if op.apply is not None:
+                plan.append(op.apply)
+            if op.collapse:
+                dirty = True
+        if dirty and trailing_collapse:
+            plan.append(collapse_whitespace)
+
+        self.plan = tuple(plan)
+
+    def __call__(self, text: str) -> str:
+        for func in self.plan:
+            text = func(text)
+        return text
+
+    def process_batch(self, texts: list) -> list:
+        """Jalankan rencana atas seluruh batch, satu pass per langkah."""
+        for func in self.plan:
+            texts = list(map(func, texts))
+        return texts
+
+    def __repr__(self) -> str:
+        return f"FusedCleaner(steps={list(self.steps)}, passes={len(self.plan)})"
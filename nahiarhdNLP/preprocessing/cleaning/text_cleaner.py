@@ -2,7 +2,47 @@
 Text cleaner for Indonesian text processing.
 """
 
-import re
+from ..patterns import register_pattern
+
+# Pola regex dikompilasi sekali saat import modul (lihat preprocessing.patterns)
+URL_PATTERN = register_pattern(
+    "text_cleaner.url",
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+)
+MENTION_PATTERN = register_pattern("text_cleaner.mention", r"@\w+")
+HASHTAG_PATTERN = register_pattern("text_cleaner.hashtag", r"#\w+")
+PUNCTUATION_PATTERN = register_pattern("text_cleaner.punctuation", r"[^\w\s]")
+REPEATED_CHARS_PATTERN = register_pattern("text_cleaner.repeated_chars", r"(.)\1{2,}")
+SPECIAL_CHARS_PATTERN = register_pattern(
+    "text_cleaner.special_chars", r'[^\w\s.,!?;:()"\'-]'
+)
+HTML_PATTERN = register_pattern("text_cleaner.html", r"<[^>]+>")
+EMOJI_PATTERN = register_pattern(
+    "text_cleaner.emoji",
+    r"[\U0001F600-\U0001F64F]|[\U0001F300-\U0001F5FF]|[\U0001F680-\U0001F6FF]|[\U0001F700-\U0001F77F]|[\U0001F780-\U0001F7FF]|[\U0001F800-\U0001F8FF]|[\U0001F900-\U0001F9FF]|[\U0001FA00-\U0001FA6F]|[\U0001FA70-\U0001FAFF]|[\U00002600-\U000026FF]|[\U00002700-\U000027BF]",
+)
+EMAIL_PATTERN = register_pattern(
+    "text_cleaner.email", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+)
+EMAIL_PARTS_PATTERN = register_pattern(
+    "text_cleaner.email_parts", r"([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+)\.([a-zA-Z]{2,})"
+)
+PHONE_PATTERN = register_pattern("text_cleaner.phone", r"[\+]?[\d\-\(\)\s]{8,}\d")
+PHONE_FORMATTED_PATTERN = register_pattern(
+    "text_cleaner.phone_formatted",
+    r"(\+62|62|0)([\d\-\(\)]{8,})(?=\s|$)|(\([\d]{3,4}\)\s?[\d\-\(\)]{6,})(?=\s|$)|([\+\d][\d\-\(\)]{8,})(?=\s|$)",
+)
+PHONE_FORMATTING_PATTERN = register_pattern(
+    "text_cleaner.phone_formatting", r"[\-\(\)\s]"
+)
+CURRENCY_PATTERN = register_pattern(
+    "text_cleaner.currency", r"[$€£¥₹Rp\.,]?\d+(?:[\.,]\d+)*[$€£¥₹Rp]?"
+)
+CURRENCY_SYMBOL_PATTERN = register_pattern(
+    "text_cleaner.currency_symbol", r"([$€£¥₹Rp\.,])(\d+(?:[\.,]\d+)*)"
+)
+NUMBER_PATTERN = register_pattern("text_cleaner.number", r"\d+")
+WHITESPACE_PATTERN = register_pattern("text_cleaner.whitespace", r"\s+")
 
 
 class TextCleaner:
@@ -45,9 +85,8 @@ class TextCleaner:
             return text
 
         # Pattern untuk URL - replace with space to preserve word boundaries
-        url_pattern = r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-        result = re.sub(url_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = URL_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_mentions(self, text: str, force: bool = False) -> str:
@@ -64,9 +103,8 @@ class TextCleaner:
             return text
 
         # Pattern untuk mentions - replace with space to preserve word boundaries
-        mention_pattern = r"@\w+"
-        result = re.sub(mention_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = MENTION_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_hashtags(self, text: str, force: bool = False) -> str:
@@ -83,9 +121,8 @@ class TextCleaner:
             return text
 
         # Pattern untuk hashtags - replace with space to preserve word boundaries
-        hashtag_pattern = r"#\w+"
-        result = re.sub(hashtag_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = HASHTAG_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_punctuation(self, text: str, force: bool = False) -> str:
@@ -102,9 +139,8 @@ class TextCleaner:
             return text
 
         # Pattern untuk punctuation - replace with space to preserve word boundaries
-        punctuation_pattern = r"[^\w\s]"
-        result = re.sub(punctuation_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = PUNCTUATION_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_lowercase(self, text: str) -> str:
@@ -134,7 +170,7 @@ class TextCleaner:
             return text
 
         # Replace multiple spaces with single space
-        text = re.sub(r"\s+", " ", text)
+        text = WHITESPACE_PATTERN.sub(" ", text)
         return text.strip()
 
     def remove_repeated_chars(self, text: str) -> str:
@@ -150,8 +186,7 @@ class TextCleaner:
             return text
 
         # Pattern untuk repeated characters (3+ times)
-        repeated_pattern = r"(.)\1{2,}"
-        return re.sub(repeated_pattern, r"\1\1", text)
+        return REPEATED_CHARS_PATTERN.sub(r"\1\1", text)
 
     def remove_special_chars(self, text: str) -> str:
         """Remove special characters that are not alphanumeric or spaces.
@@ -163,9 +198,8 @@ class TextCleaner:
             Text with special characters removed
         """
         # Keep alphanumeric, spaces, and common punctuation
-        special_pattern = r'[^\w\s.,!?;:()"\'-]'
-        result = re.sub(special_pattern, "", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = SPECIAL_CHARS_PATTERN.sub("", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_html(self, text: str, force: bool = False) -> str:
@@ -182,9 +216,8 @@ class TextCleaner:
             return text
 
         # Pattern untuk HTML tags - replace with space to preserve word boundaries
-        html_pattern = r"<[^>]+>"
-        result = re.sub(html_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = HTML_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_emoji(self, text: str, force: bool = False) -> str:
@@ -202,9 +235,8 @@ class TextCleaner:
 
         # Pattern untuk emoji (Unicode ranges)
         # Menangkap semua karakter emoji berdasarkan Unicode blocks
-        emoji_pattern = r"[\U0001F600-\U0001F64F]|[\U0001F300-\U0001F5FF]|[\U0001F680-\U0001F6FF]|[\U0001F700-\U0001F77F]|[\U0001F780-\U0001F7FF]|[\U0001F800-\U0001F8FF]|[\U0001F900-\U0001F9FF]|[\U0001FA00-\U0001FA6F]|[\U0001FA70-\U0001FAFF]|[\U00002600-\U000026FF]|[\U00002700-\U000027BF]"
-        result = re.sub(emoji_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = EMOJI_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_whitespace(self, text: str) -> str:
@@ -217,10 +249,8 @@ class TextCleaner:
             Text with cleaned whitespace
         """
         # Replace tabs, newlines, etc. with spaces
-        text = re.sub(r"\t", " ", text)
-        text = re.sub(r"\n", " ", text)
-        text = re.sub(r"\r", " ", text)
-        result = re.sub(r"\s+", " ", text).strip()
+        text = text.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+        result = WHITESPACE_PATTERN.sub(" ", text).strip()
         return result
 
     def remove_emails(
@@ -243,14 +273,12 @@ class TextCleaner:
         if keep_text:
             # Remove @ and . from emails but keep the text parts
             # More comprehensive pattern to handle various email formats
-            email_pattern = r"([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+)\.([a-zA-Z]{2,})"
-            result = re.sub(email_pattern, r"\1 \2 \3", text)
+            result = EMAIL_PARTS_PATTERN.sub(r"\1 \2 \3", text)
         else:
             # Remove entire email
-            email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-            result = re.sub(email_pattern, "", text)
+            result = EMAIL_PATTERN.sub("", text)
 
-        result = re.sub(r"\s+", " ", result).strip()
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_phones(
@@ -274,27 +302,24 @@ class TextCleaner:
         if keep_numbers:
             # Remove phone formatting but keep numbers using regex substitution
             # Pattern to match phone numbers with formatting (more precise)
-            phone_pattern = r"(\+62|62|0)([\d\-\(\)]{8,})(?=\s|$)|(\([\d]{3,4}\)\s?[\d\-\(\)]{6,})(?=\s|$)|([\+\d][\d\-\(\)]{8,})(?=\s|$)"
-
             def remove_phone_match(match):
                 if match.group(1):  # Indonesian format (+62/62/0)
                     prefix = match.group(1)
-                    numbers = re.sub(r"[\-\(\)\s]", "", match.group(2))
+                    numbers = PHONE_FORMATTING_PATTERN.sub("", match.group(2))
                     return prefix + numbers
                 elif match.group(3):  # Parenthetical format like (021) 123-4567
-                    numbers = re.sub(r"[\-\(\)\s]", "", match.group(3))
+                    numbers = PHONE_FORMATTING_PATTERN.sub("", match.group(3))
                     return numbers
                 else:  # International format
-                    numbers = re.sub(r"[\-\(\)\s]", "", match.group(4))
+                    numbers = PHONE_FORMATTING_PATTERN.sub("", match.group(4))
                     return numbers
 
-            result = re.sub(phone_pattern, remove_phone_match, text)
+            result = PHONE_FORMATTED_PATTERN.sub(remove_phone_match, text)
         else:
             # Remove entire phone numbers
-            phone_pattern = r"[\+]?[\d\-\(\)\s]{8,}\d"
-            result = re.sub(phone_pattern, "", text)
+            result = PHONE_PATTERN.sub("", text)
 
-        result = re.sub(r"\s+", " ", result).strip()
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_currency(
@@ -316,14 +341,12 @@ class TextCleaner:
 
         if keep_numbers:
             # Remove currency symbols but keep numbers
-            currency_pattern = r"([$€£¥₹Rp\.,])(\d+(?:[\.,]\d+)*)"
-            result = re.sub(currency_pattern, r"\2", text)
+            result = CURRENCY_SYMBOL_PATTERN.sub(r"\2", text)
         else:
             # Remove entire currency mentions
-            currency_pattern = r"[$€£¥₹Rp\.,]?\d+(?:[\.,]\d+)*[$€£¥₹Rp]?"
-            result = re.sub(currency_pattern, "", text)
+            result = CURRENCY_PATTERN.sub("", text)
 
-        result = re.sub(r"\s+", " ", result).strip()
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def remove_numbers(self, text: str, force: bool = False) -> str:
@@ -340,9 +363,8 @@ class TextCleaner:
             return text
 
         # Pattern untuk numbers - replace with space to preserve word boundaries
-        number_pattern = r"\d+"
-        result = re.sub(number_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = NUMBER_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def get_options(self) -> dict:
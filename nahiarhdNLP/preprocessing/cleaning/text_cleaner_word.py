@@ -2,7 +2,16 @@
 Text cleaner for Indonesian text processing.
 """
 
-import re
+from ..patterns import register_pattern
+
+# Pola regex dikompilasi sekali saat import modul (lihat preprocessing.patterns)
+URL_PROTOCOL_PATTERN = register_pattern(
+    "text_cleaner_word.url_protocol", r"http[s]?://"
+)
+MENTION_PATTERN = register_pattern("text_cleaner_word.mention", r"@(\w+)")
+HASHTAG_PATTERN = register_pattern("text_cleaner_word.hashtag", r"#(\w+)")
+HTML_PATTERN = register_pattern("text_cleaner_word.html", r"<[^>]+>")
+WHITESPACE_PATTERN = register_pattern("text_cleaner_word.whitespace", r"\s+")
 
 
 class TextCleanerWord:
@@ -34,9 +43,8 @@ class TextCleanerWord:
             return text
 
         # Pattern untuk URL protocols
-        url_pattern = r"http[s]?://"
-        result = re.sub(url_pattern, "", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = URL_PROTOCOL_PATTERN.sub("", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def clean_mentions(self, text: str, force: bool = False) -> str:
@@ -53,9 +61,8 @@ class TextCleanerWord:
             return text
 
         # Pattern untuk mentions, remove @ but keep the word with space
-        mention_pattern = r"@(\w+)"
-        result = re.sub(mention_pattern, r" \1", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = MENTION_PATTERN.sub(r" \1", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def clean_hashtags(self, text: str, force: bool = False) -> str:
@@ -72,9 +79,8 @@ class TextCleanerWord:
             return text
 
         # Pattern untuk hashtags, remove # but keep the word with space
-        hashtag_pattern = r"#(\w+)"
-        result = re.sub(hashtag_pattern, r" \1", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = HASHTAG_PATTERN.sub(r" \1", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def clean_html(self, text: str, force: bool = False) -> str:
@@ -91,9 +97,8 @@ class TextCleanerWord:
             return text
 
         # Pattern untuk HTML tags - replace with space to preserve word boundaries
-        html_pattern = r"<[^>]+>"
-        result = re.sub(html_pattern, " ", text)
-        result = re.sub(r"\s+", " ", result).strip()
+        result = HTML_PATTERN.sub(" ", text)
+        result = WHITESPACE_PATTERN.sub(" ", result).strip()
         return result
 
     def get_options(self) -> dict:
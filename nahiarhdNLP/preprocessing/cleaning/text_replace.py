@@ -4,7 +4,14 @@ Text replacement utilities: replace emails, links, and user mentions with tokens
 This module provides simple, well-documented functions used by the pipeline.
 """
 
-import re
+from ..patterns import register_pattern
+
+# Pola regex dikompilasi sekali saat import modul (lihat preprocessing.patterns)
+EMAIL_PATTERN = register_pattern(
+    "text_replace.email", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+)
+URL_PATTERN = register_pattern("text_replace.url", r"(https?://[^\s]+|www\.[^\s]+)")
+USER_PATTERN = register_pattern("text_replace.user", r"@\w+")
 
 
 class TextReplace:
@@ -23,10 +30,7 @@ class TextReplace:
         if not self.replace_email and not force:
             return text
 
-        email_pattern = re.compile(
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
-        )
-        result = re.sub(email_pattern, "<email>", text)
+        result = EMAIL_PATTERN.sub("<email>", text)
         return result
 
     def replace_link(self, text: str, force: bool = False) -> str:
@@ -39,8 +43,7 @@ class TextReplace:
         if not self.replace_link and not force:
             return text
 
-        url_pattern = re.compile(r"(https?://[^\s]+|www\.[^\s]+)")
-        result = re.sub(url_pattern, "<link>", text)
+        result = URL_PATTERN.sub("<link>", text)
         return result
 
     def replace_user(self, text: str, force: bool = False) -> str:
@@ -53,8 +56,7 @@ class TextReplace:
         if not self.replace_user and not force:
             return text
 
-        user_pattern = re.compile(r"@\w+")
-        result = re.sub(user_pattern, "<user>", text)
+        result = USER_PATTERN.sub("<user>", text)
         return result
 
     def get_options(self) -> dict:
@@ -0,0 +1,374 @@
+"""
+Pemrosesan kolom (pandas Series / Arrow array) untuk Pipeline.
+
+Tahap cleaning yang difusikan (lihat cleaning.fusion) dijalankan dengan kernel
+string pyarrow.compute atas seluruh kolom sekaligus: `re.sub` menjadi
+`replace_substring_regex`, `str.lower` menjadi `utf8_lower`, dan perapian spasi
+menjadi `utf8_trim` + `utf8_split_whitespace` + `binary_join` (atau satu regex
++ `utf8_trim` jika definisi spasi Arrow berbeda). Tahap lain (token stream,
+stemming, spell corrector, emoji, dll.) tetap dijalankan per elemen lewat fungsi
+batch Pipeline.
+
+Kernel hanya dipakai jika hasilnya dijamin sama dengan modul `re`:
+
+- Pola diterjemahkan ke sintaks RE2. `\\w`, `\\s`, dan `\\d` diganti kelas
+  karakter yang dibangun dari definisi Python sendiri (`str.isalnum`,
+  `str.isspace`, `str.isdecimal`), karena di RE2 ketiganya hanya ASCII.
+- Pola dengan backreference, lookaround, `\\b`, `$`, flag, atau yang bisa cocok
+  dengan string kosong tidak diterjemahkan dan dijalankan per elemen.
+- `str.lower` memakai `utf8_lower` untuk seluruh kolom; hanya teks yang berisi
+  karakter dari `_lower_exceptions()` (mis. İ, sigma kapital) yang di-lower
+  ulang per elemen.
+- Jika engine regex bukan `re` (lihat preprocessing.patterns), semua pola
+  dijalankan per elemen.
+"""
+
+import re
+from functools import lru_cache, partial
+
+from . import patterns
+from .cleaning.fusion import FusedCleaner, collapse_whitespace
+
+# Escape yang sama artinya di Python dan RE2
+_PLAIN_ESCAPES = frozenset("ntrfv")
+_CLASS_ESCAPES = {
+    "w": lambda char: char.isalnum() or char == "_",
+    "s": str.isspace,
+    "d": str.isdecimal,
+}
+_CODEPOINT_ESCAPES = {"x": 2, "u": 4, "U": 8}
+# Plane 4-13 belum terisi dan plane 15-16 hanya private use (bukan huruf,
+# angka, spasi, dan tanpa huruf kecil), jadi cukup memeriksa code point ini
+_CODEPOINTS = (range(0x40000), range(0xE0000, 0xE1000))
+_REPLACEMENT_PATTERN = re.compile(r"(?:[^\\]|\\[1-9])*")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError:
+        raise ImportError(
+            "pyarrow belum terinstall. Install dengan: pip install pyarrow"
+        ) from None
+    return pyarrow, pyarrow.compute
+
+
+@lru_cache(maxsize=None)
+def _unicode_chars() -> tuple:
+    """Semua karakter di _CODEPOINTS kecuali surrogate."""
+    return tuple(
+        chr(codepoint)
+        for codepoints in _CODEPOINTS
+        for codepoint in codepoints
+        if not 0xD800 <= codepoint <= 0xDFFF
+    )
+
+
+def _format_class(chars) -> str:
+    """Isi kelas karakter RE2 (tanpa kurung) dari karakter yang terurut."""
+    parts = []
+    start = end = None
+    for codepoint in map(ord, chars):
+        if end is not None and codepoint == end + 1:
+            end = codepoint
+            continue
+        if start is not None:
+            parts.append(_format_range(start, end))
+        start = end = codepoint
+    if start is not None:
+        parts.append(_format_range(start, end))
+    return "".join(parts)
+
+
+def _format_range(start: int, end: int) -> str:
+    if start == end:
+        return f"\\x{{{start:X}}}"
+    return f"\\x{{{start:X}}}-\\x{{{end:X}}}"
+
+
+@lru_cache(maxsize=None)
+def _class_body(escape: str) -> str:
+    """Isi kelas karakter RE2 yang setara `\\<escape>` Python."""
+    return _format_class(filter(_CLASS_ESCAPES[escape], _unicode_chars()))
+
+
+@lru_cache(maxsize=None)
+def _lower_exceptions() -> str:
+    """Karakter yang `utf8_lower` Arrow-nya berbeda dengan `str.lower`.
+
+    Termasuk sigma kapital, karena `str.lower` membedakan sigma akhir kata.
+    """
+    pa, pc = _require_pyarrow()
+    chars = _unicode_chars()
+    lowered = pc.utf8_lower(pa.array(chars)).to_pylist()
+    exceptions = {char for char, low in zip(chars, lowered) if char.lower() != low}
+    exceptions.add("\u03a3")
+    return _format_class(sorted(exceptions))
+
+
+@lru_cache(maxsize=None)
+def _arrow_whitespace_matches() -> bool:
+    """True jika definisi spasi Arrow sama dengan `str.isspace`.
+
+    `utf8_is_space` dan `utf8_split_whitespace` memakai definisi yang sama.
+    """
+    pa, pc = _require_pyarrow()
+    chars = _unicode_chars()
+    spaces = pc.utf8_is_space(pa.array(chars)).to_pylist()
+    return spaces == [char.isspace() for char in chars]
+
+
+def translate_pattern(pattern):
+    """Terjemahkan pola `re` terkompilasi ke RE2, atau None jika tidak setara.
+
+    Args:
+        pattern: Pola hasil `re.compile`
+
+    Returns:
+        str | None: Pola RE2 yang cocok dengan teks yang sama persis
+    """
+    if not isinstance(pattern, re.Pattern) or pattern.flags & ~re.UNICODE:
+        return None
+    source = pattern.pattern
+    if not isinstance(source, str):
+        return None
+
+    out = []
+    in_class = False
+    # Posisi karakter pertama isi kelas; "]" di posisi ini adalah literal
+    class_first = -1
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            escape = source[i + 1]
+            i += 2
+            if escape in _CLASS_ESCAPES:
+                body = _class_body(escape)
+                out.append(body if in_class else f"[{body}]")
+            elif escape.lower() in _CLASS_ESCAPES:
+                if in_class:
+                    return None
+                out.append(f"[^{_class_body(escape.lower())}]")
+            elif escape in _CODEPOINT_ESCAPES:
+                width = _CODEPOINT_ESCAPES[escape]
+                out.append(f"\\x{{{source[i : i + width]}}}")
+                i += width
+            elif escape in _PLAIN_ESCAPES or not escape.isalnum():
+                out.append("\\" + escape)
+            else:
+                # \b, \B, \A, \Z, backreference, dll.
+                return None
+            continue
+
+        if in_class:
+            if char == "]" and i != class_first:
+                in_class = False
+            elif char == "[":
+                char = "\\["
+        elif char == "[":
+            in_class = True
+            if source.startswith("[^", i):
+                out.append("[^")
+                i += 2
+                class_first = i
+                continue
+            class_first = i + 1
+        elif char == "$":
+            # `$` di Python juga cocok sebelum newline terakhir
+            return None
+        elif source.startswith("(?", i) and not source.startswith(("(?:", "(?P<"), i):
+            # Lookaround, flag inline, atau (?P=name)
+            return None
+        out.append(char)
+        i += 1
+
+    # Tanpa lookaround/\b/$, pola yang bisa cocok kosong pasti cocok dengan "";
+    # penggantian match kosong di RE2 berbeda dengan re.sub
+    if pattern.match("") is not None:
+        return None
+    return "".join(out)
+
+
+def _is_string(pa, array) -> bool:
+    return pa.types.is_string(array.type) or pa.types.is_large_string(array.type)
+
+
+def _apply_elementwise(pa, array, func):
+    """Jalankan `func` per teks (fallback untuk langkah tanpa kernel)."""
+    return pa.array(list(map(func, array.to_pylist())), type=array.type)
+
+
+def _lower(pa, pc, array):
+    """`str.lower`: `utf8_lower`, kecuali teks berisi karakter pengecualian."""
+    lowered = pc.utf8_lower(array)
+    mask = pc.match_substring_regex(array, pattern=f"[{_lower_exceptions()}]")
+    if not pc.any(mask).as_py():
+        return lowered
+    subset = array.filter(mask).to_pylist()
+    replaced = pa.array([text.lower() for text in subset], type=array.type)
+    return pc.replace_with_mask(lowered, mask, replaced)
+
+
+def _collapse(pa, pc, array):
+    """`collapse_whitespace`: trim, pecah per spasi, lalu gabung dengan " "."""
+    whitespace = "".join(filter(str.isspace, _unicode_chars()))
+    pieces = pc.utf8_split_whitespace(pc.utf8_trim(array, characters=whitespace))
+    return pc.binary_join(pieces, pa.scalar(" ", array.type))
+
+
+def _collapse_regex(pc, array):
+    array = pc.replace_substring_regex(
+        array, pattern=f"[{_class_body('s')}]+", replacement=" "
+    )
+    return pc.utf8_trim(array, characters=" ")
+
+
+def _kernel(func):
+    """Kernel Arrow untuk satu langkah FusedCleaner, atau None."""
+    pa, pc = _require_pyarrow()
+    if func is collapse_whitespace:
+        if _arrow_whitespace_matches():
+            return partial(_collapse, pa, pc)
+        return partial(_collapse_regex, pc)
+    if func is str.lower:
+        return partial(_lower, pa, pc)
+    if (
+        patterns.engine is re
+        and isinstance(func, partial)
+        and getattr(func.func, "__name__", None) == "sub"
+        and len(func.args) == 1
+        and not func.keywords
+    ):
+        pattern = translate_pattern(getattr(func.func, "__self__", None))
+        replacement = func.args[0]
+        if pattern is not None and _REPLACEMENT_PATTERN.fullmatch(replacement):
+            return partial(
+                pc.replace_substring_regex, pattern=pattern, replacement=replacement
+            )
+    return None
+
+
+@lru_cache(maxsize=None)
+def _fused_kernels(steps: tuple, trailing_collapse: bool) -> tuple:
+    """Fungsi per langkah rencana FusedCleaner atas Arrow array."""
+    pa, _ = _require_pyarrow()
+    fused = FusedCleaner(steps, trailing_collapse)
+    kernels = []
+    for func in fused.plan:
+        kernel = _kernel(func)
+        if kernel is None:
+            kernel = partial(_apply_elementwise, pa, func=func)
+        kernels.append(kernel)
+    return tuple(kernels)
+
+
+def _as_string_array(pa, values):
+    """Arrow array string dari Array/ChunkedArray/iterable, atau None."""
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    elif not isinstance(values, pa.Array):
+        try:
+            values = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    if pa.types.is_null(values.type):
+        values = values.cast(pa.large_string())
+    return values if _is_string(pa, values) else None
+
+
+def process_arrow(pipeline, values):
+    """Proses kolom teks Arrow dengan kernel vektor jika memungkinkan.
+
+    Args:
+        pipeline: Instance Pipeline
+        values: pyarrow Array atau ChunkedArray bertipe string
+
+    Returns:
+        Array (atau ChunkedArray jika input ChunkedArray) dengan null tetap
+        null. Jika step terakhir tokenizer, hasilnya list<string> dan teks
+        kosong menjadi list kosong.
+    """
+    pa, pc = _require_pyarrow()
+    chunked = isinstance(values, pa.ChunkedArray)
+    array = _as_string_array(pa, values)
+    if array is None:
+        raise TypeError(f"Expected a string array, got {values.type}")
+
+    # Teks kosong dikembalikan apa adanya, sama seperti `Pipeline.process`
+    active = pc.fill_null(pc.greater(pc.binary_length(array), 0), False)
+    batch = array.filter(active)
+    stages = pipeline.plan.stages
+    # Hanya step tokenizer di akhir yang menghasilkan list token
+    returns_tokens = bool(stages) and stages[-1].steps[-1] == "tokenizer"
+    for stage, batch_function in zip(stages, pipeline.batch_functions):
+        if stage.kind == "fused":
+            for kernel in _fused_kernels(stage.steps, stage.trailing_collapse):
+                batch = kernel(batch)
+        else:
+            last = returns_tokens and stage is stages[-1]
+            batch = pa.array(
+                batch_function(batch.to_pylist()),
+                type=pa.list_(array.type) if last else array.type,
+            )
+
+    if not returns_tokens:
+        result = pc.replace_with_mask(array, active, batch)
+    else:
+        tokens = iter(batch.to_pylist())
+        result = pa.array(
+            [
+                next(tokens) if flag else (None if text is None else [])
+                for flag, text in zip(active.to_pylist(), array.to_pylist())
+            ],
+            type=pa.list_(array.type),
+        )
+    return pa.chunked_array([result]) if chunked else result
+
+
+def process_series(pipeline, series):
+    """Proses pandas Series teks; index, nama, dan nilai null dipertahankan.
+
+    Series bertipe string (`StringDtype`) menghasilkan dtype yang sama; dtype
+    lain menghasilkan object. Series object yang berisi selain teks dan null
+    diproses per elemen seperti `process_batch`.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError(
+            "pandas belum terinstall. Install dengan: pip install pandas"
+        ) from None
+    pa, _ = _require_pyarrow()
+
+    nulls = series.isna().to_numpy()
+    array = _as_string_array(pa, series)
+    if array is None:
+        values = series.to_list()
+        active = [i for i, null in enumerate(nulls) if not null]
+        processed = pipeline.process_batch([values[i] for i in active])
+        for i, value in zip(active, processed):
+            values[i] = value
+        return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+    result = process_arrow(pipeline, array)
+    if not _is_string(pa, result):
+        values = result.to_pylist()
+        # Teks kosong tetap "" seperti `process` (di Arrow menjadi list kosong)
+        for i, text in enumerate(series.to_list()):
+            if text == "":
+                values[i] = ""
+    elif isinstance(series.dtype, pd.StringDtype):
+        values = pd.array(result, dtype=series.dtype)
+        return pd.Series(values, index=series.index, name=series.name)
+    else:
+        values = result.to_pandas()
+
+    out = pd.Series(values, index=series.index, name=series.name, dtype=object)
+    if nulls.any():
+        # Nilai null asli (None / NaN / pd.NA) dikembalikan apa adanya
+        out[nulls] = series[nulls]
+    return out
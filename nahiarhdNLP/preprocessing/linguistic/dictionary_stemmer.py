@@ -0,0 +1,654 @@
+"""
+Engine stemming native berbasis kamus kata dasar (default: KBBI).
+
+Algoritmanya sama dengan Sastrawi (Nazief & Adriani, CS, ECS, ditambah aturan
+ku-/kau-), tetapi:
+
+- Kamus kata dasar disimpan di frozenset (hash lookup), bukan list yang dicek
+  dengan `in` secara linear seperti `ArrayDictionary` Sastrawi. Lookup inilah
+  yang mendominasi waktu stemming Sastrawi.
+- Aturan prefix disambiguator ditulis sebagai operasi string biasa tanpa regex
+  dan dikelompokkan dalam tabel berdasarkan dua huruf pertama kata, jadi hanya
+  aturan yang mungkin cocok yang dicoba.
+
+Dengan kamus yang sama, hasilnya identik dengan Sastrawi (termasuk quirk-nya),
+lihat `tests/benchmark_stemmer_engines.py`. Input diasumsikan sudah
+dinormalisasi seperti di `Stemmer.stem_tokens` (huruf kecil, a-z0-9-).
+"""
+
+from typing import Iterable
+
+_VOWELS = frozenset("aiueo")
+_CONSONANTS = frozenset("bcdfghjklmnpqrstvwxyz")
+_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+# Kelas huruf khusus beberapa aturan (sesuai regex Sastrawi)
+_CONSONANTS_NO_R = _CONSONANTS - {"r"}
+_CONSONANTS_35 = frozenset("bcdfghjkpqstvxz")
+_NOT_E_OR_N = _LETTERS - {"e", "n"}
+# Regex aturan 16 `[g|h|q|k]` ikut mencocokkan "|"
+_RULE_16 = frozenset("g|hqk")
+
+# Partikel / kata ganti yang boleh menempel dengan tanda hubung (nikmat-Ku)
+_PARTICLES = frozenset({"ku", "mu", "nya", "lah", "kah", "tah", "pun"})
+
+_INFLECTIONAL_PARTICLES = ("lah", "kah", "tah", "pun")
+_POSSESSIVE_PRONOUNS = ("nya", "ku", "mu")
+# Urut dari yang terpanjang: regex Sastrawi mengambil match paling kiri
+_DERIVATIONAL_SUFFIXES = ("isasi", "isme", "kan", "is", "an", "i")
+_PLAIN_PREFIXES = frozenset({"di", "ke", "se"})
+_SUFFIX_TYPES = frozenset({"DS", "PP", "P"})
+
+# Confix stripping: (prefix, suffix) yang dicoba prefix dulu baru suffix
+_PRECEDENCE_ADJUSTMENT = (
+    ("be", "lah"),
+    ("be", "an"),
+    ("me", "i"),
+    ("di", "i"),
+    ("pe", "i"),
+    ("ter", "i"),
+)
+
+
+def _remove_particle(word: str) -> str:
+    # -*(lah|kah|tah|pun)$
+    if word.endswith(_INFLECTIONAL_PARTICLES):
+        return word[:-3].rstrip("-")
+    return word
+
+
+def _remove_possessive(word: str) -> str:
+    # -*(ku|mu|nya)$
+    for suffix in _POSSESSIVE_PRONOUNS:
+        if word.endswith(suffix):
+            return word[: -len(suffix)].rstrip("-")
+    return word
+
+
+def _remove_derivational(word: str) -> str:
+    # (is|isme|isasi|i|kan|an)$
+    for suffix in _DERIVATIONAL_SUFFIXES:
+        if word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+# (jenis affix, fungsi) sesuai urutan visitor suffix Sastrawi
+_SUFFIX_REMOVERS = (
+    ("P", _remove_particle),
+    ("PP", _remove_possessive),
+    ("DS", _remove_derivational),
+)
+
+
+# Aturan prefix disambiguator. Setiap aturan mengembalikan kandidat kata dasar
+# atau None jika tidak cocok; nomor mengikuti DisambiguatorPrefixRule Sastrawi.
+
+
+def _rule_1a(w):  # ^ber([aiueo].*)$
+    if w[:3] == "ber" and w[3:4] in _VOWELS:
+        return w[3:]
+
+
+def _rule_1b(w):  # ^ber([aiueo].*)$ -> r...
+    if w[:3] == "ber" and w[3:4] in _VOWELS:
+        return "r" + w[3:]
+
+
+def _rule_2(w):  # ^ber([C])([a-z])(.*), bukan ...er
+    if (
+        w[:3] == "ber"
+        and w[3:4] in _CONSONANTS
+        and w[4:5] in _LETTERS
+        and w[5:7] != "er"
+    ):
+        return w[3:]
+
+
+def _rule_3(w):  # ^ber([C])([a-z])er([aiueo])(.*), C != r
+    if (
+        w[:3] == "ber"
+        and w[3:4] in _CONSONANTS
+        and w[4:5] in _LETTERS
+        and w[5:7] == "er"
+        and w[7:8] in _VOWELS
+        and w[3] != "r"
+    ):
+        return w[3:]
+
+
+def _rule_4(w):
+    if w == "belajar":
+        return "ajar"
+
+
+def _rule_5(w):  # ^be([C kecuali r])(er[C])(.*)$
+    if (
+        w[:2] == "be"
+        and w[2:3] in _CONSONANTS_NO_R
+        and w[3:5] == "er"
+        and w[5:6] in _CONSONANTS
+    ):
+        return w[2:]
+
+
+def _rule_6a(w):  # ^ter([aiueo].*)$
+    if w[:3] == "ter" and w[3:4] in _VOWELS:
+        return w[3:]
+
+
+def _rule_6b(w):  # ^ter([aiueo].*)$ -> r...
+    if w[:3] == "ter" and w[3:4] in _VOWELS:
+        return "r" + w[3:]
+
+
+def _rule_7(w):  # ^ter([C])er([aiueo].*)$, C != r
+    if (
+        w[:3] == "ter"
+        and w[3:4] in _CONSONANTS
+        and w[4:6] == "er"
+        and w[6:7] in _VOWELS
+        and w[3] != "r"
+    ):
+        return w[3:]
+
+
+def _rule_8(w):  # ^ter([C])(.*)$, C != r, bukan ...er
+    if w[:3] == "ter" and w[3:4] in _CONSONANTS and w[3] != "r" and w[4:6] != "er":
+        return w[3:]
+
+
+def _rule_9(w):  # ^te([C])er([C])(.*)$, C != r
+    if (
+        w[:2] == "te"
+        and w[2:3] in _CONSONANTS
+        and w[3:5] == "er"
+        and w[5:6] in _CONSONANTS
+        and w[2] != "r"
+    ):
+        return w[2:]
+
+
+def _rule_10(w):  # ^me([lrwy])([aiueo])(.*)$
+    if w[:2] == "me" and w[2:3] in ("l", "r", "w", "y") and w[3:4] in _VOWELS:
+        return w[2:]
+
+
+def _rule_11(w):  # ^mem([bfv])(.*)$
+    if w[:3] == "mem" and w[3:4] in ("b", "f", "v"):
+        return w[3:]
+
+
+def _rule_12(w):  # ^mempe(.*)$ -> pe...
+    if w[:5] == "mempe":
+        return w[3:]
+
+
+def _rule_13a(w):  # ^mem([aiueo])(.*)$ -> m...
+    if w[:3] == "mem" and w[3:4] in _VOWELS:
+        return "m" + w[3:]
+
+
+def _rule_13b(w):  # ^mem([aiueo])(.*)$ -> p...
+    if w[:3] == "mem" and w[3:4] in _VOWELS:
+        return "p" + w[3:]
+
+
+def _rule_14(w):  # ^men([cdjstz])(.*)$
+    if w[:3] == "men" and w[3:4] in ("c", "d", "j", "s", "t", "z"):
+        return w[3:]
+
+
+def _rule_15a(w):  # ^men([aiueo])(.*)$ -> n...
+    if w[:3] == "men" and w[3:4] in _VOWELS:
+        return "n" + w[3:]
+
+
+def _rule_15b(w):  # ^men([aiueo])(.*)$ -> t...
+    if w[:3] == "men" and w[3:4] in _VOWELS:
+        return "t" + w[3:]
+
+
+def _rule_16(w):  # ^meng([g|h|q|k])(.*)$
+    if w[:4] == "meng" and w[4:5] in _RULE_16:
+        return w[4:]
+
+
+def _rule_17a(w):  # ^meng([aiueo])(.*)$
+    if w[:4] == "meng" and w[4:5] in _VOWELS:
+        return w[4:]
+
+
+def _rule_17b(w):  # ^meng([aiueo])(.*)$ -> k...
+    if w[:4] == "meng" and w[4:5] in _VOWELS:
+        return "k" + w[4:]
+
+
+def _rule_17c(w):  # ^menge(.*)$
+    if w[:5] == "menge":
+        return w[5:]
+
+
+def _rule_17d(w):  # ^meng([aiueo])(.*)$ -> ng...
+    if w[:4] == "meng" and w[4:5] in _VOWELS:
+        return w[2:]
+
+
+def _rule_18a(w):  # ^meny([aiueo])(.*)$ -> ny...
+    if w[:4] == "meny" and w[4:5] in _VOWELS:
+        return w[2:]
+
+
+def _rule_18b(w):  # ^meny([aiueo])(.*)$ -> s...
+    if w[:4] == "meny" and w[4:5] in _VOWELS:
+        return "s" + w[4:]
+
+
+def _rule_19(w):  # ^memp([a-z kecuali e, n])(.*)$ -> p...
+    if w[:4] == "memp" and w[4:5] in _NOT_E_OR_N:
+        return w[3:]
+
+
+def _rule_20(w):  # ^pe([wy])([aiueo])(.*)$
+    if w[:2] == "pe" and w[2:3] in ("w", "y") and w[3:4] in _VOWELS:
+        return w[2:]
+
+
+def _rule_21a(w):  # ^per([aiueo])(.*)$
+    if w[:3] == "per" and w[3:4] in _VOWELS:
+        return w[3:]
+
+
+def _rule_21b(w):  # ^pe(r[aiueo])(.*)$
+    if w[:3] == "per" and w[3:4] in _VOWELS:
+        return w[2:]
+
+
+def _rule_23(w):  # ^per([C])([a-z])(.*)$, bukan ...er
+    if (
+        w[:3] == "per"
+        and w[3:4] in _CONSONANTS
+        and w[4:5] in _LETTERS
+        and w[5:7] != "er"
+    ):
+        return w[3:]
+
+
+def _rule_24(w):  # ^per([C])([a-z])er([aiueo])(.*)$, C != r
+    if (
+        w[:3] == "per"
+        and w[3:4] in _CONSONANTS
+        and w[4:5] in _LETTERS
+        and w[5:7] == "er"
+        and w[7:8] in _VOWELS
+        and w[3] != "r"
+    ):
+        return w[3:]
+
+
+def _rule_25(w):  # ^pem([bfv])(.*)$
+    if w[:3] == "pem" and w[3:4] in ("b", "f", "v"):
+        return w[3:]
+
+
+def _rule_26a(w):  # ^pem([aiueo])(.*)$ -> m...
+    if w[:3] == "pem" and w[3:4] in _VOWELS:
+        return "m" + w[3:]
+
+
+def _rule_26b(w):  # ^pem([aiueo])(.*)$ -> p...
+    if w[:3] == "pem" and w[3:4] in _VOWELS:
+        return "p" + w[3:]
+
+
+def _rule_27(w):  # ^pen([cdjz])(.*)$
+    if w[:3] == "pen" and w[3:4] in ("c", "d", "j", "z"):
+        return w[3:]
+
+
+def _rule_28a(w):  # ^pen([aiueo])(.*)$ -> n...
+    if w[:3] == "pen" and w[3:4] in _VOWELS:
+        return "n" + w[3:]
+
+
+def _rule_28b(w):  # ^pen([aiueo])(.*)$ -> t...
+    if w[:3] == "pen" and w[3:4] in _VOWELS:
+        return "t" + w[3:]
+
+
+def _rule_29(w):  # ^peng([C])(.*)$
+    if w[:4] == "peng" and w[4:5] in _CONSONANTS:
+        return w[4:]
+
+
+def _rule_30a(w):  # ^peng([aiueo])(.*)$
+    if w[:4] == "peng" and w[4:5] in _VOWELS:
+        return w[4:]
+
+
+def _rule_30b(w):  # ^peng([aiueo])(.*)$ -> k...
+    if w[:4] == "peng" and w[4:5] in _VOWELS:
+        return "k" + w[4:]
+
+
+def _rule_30c(w):  # ^penge(.*)$
+    if w[:5] == "penge":
+        return w[5:]
+
+
+def _rule_31a(w):  # ^peny([aiueo])(.*)$ -> ny...
+    if w[:4] == "peny" and w[4:5] in _VOWELS:
+        return w[2:]
+
+
+def _rule_31b(w):  # ^peny([aiueo])(.*)$ -> s...
+    if w[:4] == "peny" and w[4:5] in _VOWELS:
+        return "s" + w[4:]
+
+
+def _rule_32(w):  # pelajar, ^pe(l[aiueo])(.*)$
+    if w == "pelajar":
+        return "ajar"
+    if w[:3] == "pel" and w[3:4] in _VOWELS:
+        return w[2:]
+
+
+def _rule_34(w):  # ^pe([C])(.*)$, bukan ...er
+    if w[:2] == "pe" and w[2:3] in _CONSONANTS and w[3:5] != "er":
+        return w[2:]
+
+
+def _rule_35(w):  # ^ter([C35])(er[C])(.*)$
+    if (
+        w[:3] == "ter"
+        and w[3:4] in _CONSONANTS_35
+        and w[4:6] == "er"
+        and w[6:7] in _CONSONANTS
+    ):
+        return w[3:]
+
+
+def _rule_36(w):  # ^pe([C35])(er[C])(.*)$
+    if (
+        w[:2] == "pe"
+        and w[2:3] in _CONSONANTS_35
+        and w[3:5] == "er"
+        and w[5:6] in _CONSONANTS
+    ):
+        return w[2:]
+
+
+def _infix_rules(infix: str):
+    """Aturan sisipan 37-40: ^([C])(infix[aiueo])(.*)$ -> kata utuh / tanpa sisipan."""
+
+    def keep(w):
+        if w[:1] in _CONSONANTS and w[1:3] == infix and w[3:4] in _VOWELS:
+            return w
+
+    def remove(w):
+        if w[:1] in _CONSONANTS and w[1:3] == infix and w[3:4] in _VOWELS:
+            return w[0] + w[3:]
+
+    return (keep, remove)
+
+
+def _rule_41(w):  # ^ku(.*)$
+    if w[:2] == "ku":
+        return w[2:]
+
+
+def _rule_42(w):  # ^kau(.*)$
+    if w[:3] == "kau":
+        return w[3:]
+
+
+_CONSONANT_E = frozenset(c + "e" for c in _CONSONANTS)
+_CONSONANT_I = frozenset(c + "i" for c in _CONSONANTS)
+
+# (dua huruf awal yang mungkin cocok, aturan satu visitor) sesuai urutan
+# visitor prefix Sastrawi
+_PREFIX_VISITORS = (
+    ({"be"}, (_rule_1a, _rule_1b)),
+    ({"be"}, (_rule_2,)),
+    ({"be"}, (_rule_3,)),
+    ({"be"}, (_rule_4,)),
+    ({"be"}, (_rule_5,)),
+    ({"te"}, (_rule_6a, _rule_6b)),
+    ({"te"}, (_rule_7,)),
+    ({"te"}, (_rule_8,)),
+    ({"te"}, (_rule_9,)),
+    ({"me"}, (_rule_10,)),
+    ({"me"}, (_rule_11,)),
+    ({"me"}, (_rule_12,)),
+    ({"me"}, (_rule_13a, _rule_13b)),
+    ({"me"}, (_rule_14,)),
+    ({"me"}, (_rule_15a, _rule_15b)),
+    ({"me"}, (_rule_16,)),
+    ({"me"}, (_rule_17a, _rule_17b, _rule_17c, _rule_17d)),
+    ({"me"}, (_rule_18a, _rule_18b)),
+    ({"me"}, (_rule_19,)),
+    ({"pe"}, (_rule_20,)),
+    ({"pe"}, (_rule_21a, _rule_21b)),
+    ({"pe"}, (_rule_23,)),
+    ({"pe"}, (_rule_24,)),
+    ({"pe"}, (_rule_25,)),
+    ({"pe"}, (_rule_26a, _rule_26b)),
+    ({"pe"}, (_rule_27,)),
+    ({"pe"}, (_rule_28a, _rule_28b)),
+    ({"pe"}, (_rule_29,)),
+    ({"pe"}, (_rule_30a, _rule_30b, _rule_30c)),
+    ({"pe"}, (_rule_31a, _rule_31b)),
+    ({"pe"}, (_rule_32,)),
+    ({"pe"}, (_rule_34,)),
+    ({"te"}, (_rule_35,)),
+    ({"pe"}, (_rule_36,)),
+    (_CONSONANT_E, _infix_rules("er")),
+    (_CONSONANT_E, _infix_rules("el")),
+    (_CONSONANT_E, _infix_rules("em")),
+    (_CONSONANT_I, _infix_rules("in")),
+    ({"ku"}, (_rule_41,)),
+    ({"ka"}, (_rule_42,)),
+)
+
+
+def _build_prefix_table() -> dict:
+    """Dua huruf awal -> tuple visitor yang mungkin cocok (urutan dipertahankan).
+
+    Visitor yang tidak cocok tidak mengubah apa pun di Sastrawi, jadi
+    melewatinya tidak mengubah hasil.
+    """
+    table = {}
+    for heads, rules in _PREFIX_VISITORS:
+        for head in heads:
+            table.setdefault(head, []).append(rules)
+    return {head: tuple(visitors) for head, visitors in table.items()}
+
+
+_PREFIX_TABLE = _build_prefix_table()
+
+
+class _Context:
+    """State stemming satu kata (padanan `Sastrawi.Stemmer.Context.Context`).
+
+    Removal disimpan sebagai tuple (jenis affix, subject, hasil, bagian yang
+    dibuang).
+    """
+
+    __slots__ = ("roots", "original", "current", "removals", "stopped")
+
+    def __init__(self, word: str, roots: frozenset):
+        self.roots = roots
+        self.original = word
+        self.current = word
+        self.removals = []
+        # DontStemShortWord
+        self.stopped = len(word) <= 3
+
+    def execute(self) -> str:
+        self._stem()
+        return self.current if self.current in self.roots else self.original
+
+    def _stem(self) -> None:
+        roots = self.roots
+        original = self.original
+        if original in roots:
+            return
+
+        for prefix, suffix in _PRECEDENCE_ADJUSTMENT:
+            if (
+                original.startswith(prefix)
+                and original.endswith(suffix)
+                and len(original) >= len(prefix) + len(suffix)
+            ):
+                self._remove_prefixes()
+                if self.current in roots:
+                    return
+                self._remove_suffixes()
+                if self.current in roots:
+                    return
+                self.current = original
+                self.removals = []
+                break
+
+        self._remove_suffixes()
+        if self.current in roots:
+            return
+        self._remove_prefixes()
+        if self.current in roots:
+            return
+        self._restore_suffixes()
+
+    def _remove_suffixes(self) -> None:
+        roots = self.roots
+        for affix_type, remove in _SUFFIX_REMOVERS:
+            word = self.current
+            result = remove(word)
+            if result != word:
+                self.removals.append((affix_type, word, result, word[len(result) :]))
+                self.current = result
+            if self.current in roots or self.stopped:
+                return
+
+    def _remove_prefixes(self) -> None:
+        for _ in range(3):
+            self._accept_prefix_visitors()
+            if self.current in self.roots:
+                return
+
+    def _accept_prefix_visitors(self) -> None:
+        roots = self.roots
+        removals = self.removals
+        count = len(removals)
+
+        # RemovePlainPrefix selalu jadi visitor pertama
+        word = self.current
+        if word[:2] in _PLAIN_PREFIXES:
+            removals.append(("DP", word, word[2:], word[:2]))
+            self.current = word = word[2:]
+        if word in roots or self.stopped or len(removals) > count:
+            return
+
+        for rules in _PREFIX_TABLE.get(word[:2], ()):
+            result = None
+            for rule in rules:
+                result = rule(word)
+                if result in roots:
+                    break
+            # Seperti Sastrawi, yang dipakai hasil aturan terakhir yang dicoba
+            if not result:
+                continue
+            removals.append(("DP", word, result, None))
+            self.current = result
+            return
+
+    def _restore_suffixes(self) -> None:
+        """ECS loop pengembalian akhiran."""
+        removals = self.removals
+        if removals:
+            self.current = removals[0][1]
+        # Sama seperti `list.remove` di dalam loop Sastrawi: removal DP yang
+        # tepat setelah removal DP lain ikut terlewati
+        index = 0
+        while index < len(removals):
+            if removals[index][0] == "DP":
+                del removals[index]
+            index += 1
+
+        roots = self.roots
+        current = self.current
+        # Removal yang ditambahkan selama loop tidak ikut diiterasi
+        for index in range(len(removals) - 1, -1, -1):
+            affix_type, subject, result, removed = removals[index]
+            if affix_type not in _SUFFIX_TYPES:
+                continue
+            if removed == "kan":
+                self.current = result + "k"
+                self._remove_prefixes()
+                if self.current in roots:
+                    return
+                self.current = result + "kan"
+            else:
+                self.current = subject
+            self._remove_prefixes()
+            if self.current in roots:
+                return
+            self.current = current
+
+
+class DictionaryStemmer:
+    """Stemmer kata bahasa Indonesia dengan kamus kata dasar di hash index.
+
+    Example:
+        >>> stemmer = DictionaryStemmer({"makan", "ajar"})
+        >>> stemmer.stem_word("memakan")
+        'makan'
+        >>> stemmer.stem_word("pelajaran")
+        'ajar'
+    """
+
+    def __init__(self, roots: Iterable[str], min_length: int = 1):
+        """Inisialisasi stemmer.
+
+        Args:
+            roots: Kata dasar (huruf kecil); entri kosong atau berspasi
+                diabaikan
+            min_length: Panjang minimum kata dasar. KBBI memuat nama huruf
+                ("a", "ka", "en", ...) sebagai kata dasar, sehingga tanpa batas
+                ini "berkeranlah" bisa menjadi "r".
+        """
+        self.roots = frozenset(
+            word
+            for word in roots
+            if len(word) >= min_length and word.strip() and " " not in word
+        )
+
+    def __len__(self) -> int:
+        return len(self.roots)
+
+    def stem_word(self, word: str) -> str:
+        """Stem satu token yang sudah dinormalisasi (huruf kecil, a-z0-9-)."""
+        if self._is_plural(word):
+            return self._stem_plural(word)
+        return _Context(word, self.roots).execute()
+
+    @staticmethod
+    def _is_plural(word: str) -> bool:
+        head, hyphen, tail = word.rpartition("-")
+        if not hyphen:
+            return False
+        # nikmat-ku bukan bentuk ulang, tapi buku-buku-nya iya
+        return "-" in head if tail in _PARTICLES else True
+
+    def _stem_plural(self, plural: str) -> str:
+        first, _, second = plural.rpartition("-")
+        # malaikat-malaikat-nya -> malaikat, malaikat-nya
+        if second in _PARTICLES and "-" in first:
+            first, _, rest = first.rpartition("-")
+            second = f"{rest}-{second}"
+
+        roots = self.roots
+        root1 = _Context(first, roots).execute()
+        root2 = _Context(second, roots).execute()
+        # meniru-nirukan -> tiru
+        if second not in roots and root2 == second:
+            root2 = _Context("me" + second, roots).execute()
+        return root1 if root1 == root2 else plural
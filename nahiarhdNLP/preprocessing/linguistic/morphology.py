@@ -0,0 +1,347 @@
+"""
+Analisis morfologi kata bahasa Indonesia berbasis `datasets/kamus.txt`.
+
+Entri afiks di kamus (prefix "ber-", sufiks "-kan", infiks "-el-", konfiks
+"ber -- an") dikompilasi sekali menjadi dua trie: trie prefix dibaca dari
+depan kata dan trie sufiks dibaca dari belakang. Setiap kata dipecah menjadi
+semua kombinasi prefix + kata dasar + sufiks yang mungkin dalam satu kali
+jalan per trie, lalu dipilih kandidat yang kata dasarnya ada di kamus.
+
+Prefix bernasal ("meng-", "peng-") beserta "ber-", "per-", "ter-" diperluas ke
+alomorfnya (mem-, men-, meny-, menge-, ...), termasuk huruf awal kata dasar
+yang luluh (memukul -> pukul, menyapu -> sapu). Alomorf nasal hanya dipakai di
+depan huruf awal yang sesuai (men- + dengar, bukan men- + ari).
+"""
+
+from collections import namedtuple
+from typing import Iterable, List
+
+from .stem_cache import DEFAULT_MAXSIZE, StemCache
+
+MorphAnalysis = namedtuple(
+    "MorphAnalysis",
+    ["word", "root", "prefixes", "infix", "suffixes", "pos", "known"],
+)
+MorphAnalysis.__doc__ = """Hasil analisis morfologi satu token.
+
+Attributes:
+    word: Token yang dianalisis (huruf kecil)
+    root: Kata dasar (sama dengan `word` jika tidak dikenal)
+    prefixes: Tuple prefix dari luar ke dalam, bentuk kamus (mis. "meng-")
+    infix: Infiks bentuk kamus (mis. "-el-") atau None
+    suffixes: Tuple sufiks dari dalam ke luar (mis. ("-kan", "-nya"))
+    pos: Tuple kelas kata kata dasar menurut kamus (bisa kosong)
+    known: True jika kata dasar ditemukan di kamus
+"""
+
+# Kode kelas kata di kamus.txt
+POS_TAGS = {
+    "a": "Adjektiva",
+    "adv": "Adverbia",
+    "n": "Nomina",
+    "num": "Numeralia",
+    "p": "Partikel",
+    "pron": "Pronomina",
+    "v": "Verba",
+}
+
+# Afiks produktif yang tidak tercantum di kamus.txt
+_EXTRA_AFFIXES = ("ter-", "-ku")
+
+# Bentuk permukaan prefix: (bentuk, huruf awal kata dasar yang luluh)
+_ALLOMORPHS = {
+    "meng-": (
+        ("me", ""),
+        ("mem", ""),
+        ("mem", "p"),
+        ("men", ""),
+        ("men", "t"),
+        ("meng", ""),
+        ("meng", "k"),
+        ("meny", "s"),
+        ("menge", ""),
+    ),
+    "peng-": (
+        ("pe", ""),
+        ("pem", ""),
+        ("pem", "p"),
+        ("pen", ""),
+        ("pen", "t"),
+        ("peng", ""),
+        ("peng", "k"),
+        ("peny", "s"),
+        ("penge", ""),
+    ),
+    "ber-": (("ber", ""), ("be", ""), ("bel", "")),
+    "per-": (("per", ""), ("pe", ""), ("pel", "")),
+    "ter-": (("ter", ""), ("te", "")),
+}
+
+# Huruf awal kata dasar yang boleh mengikuti alomorf nasal tanpa huruf luluh
+# (me-lempar, mem-baca, men-dengar, meng-ambil); menari bukan men- + ari
+_VOWELS = "aiueo"
+_NASAL_ONSETS = {"": "lmnrwy", "m": "bfvp", "n": "cdjstz", "ng": _VOWELS + "ghk"}
+_ONSETS = {
+    (prefix, head + nasal): onsets
+    for prefix, head in (("meng-", "me"), ("peng-", "pe"))
+    for nasal, onsets in _NASAL_ONSETS.items()
+}
+
+# Urutan lapisan sufiks dari luar: partikel, kata ganti, lalu derivasional
+_PARTICLE, _PRONOUN, _DERIVATIONAL = 3, 2, 1
+_SUFFIX_SLOTS = {"-kah": _PARTICLE, "-lah": _PARTICLE, "-mu": _PRONOUN}
+_SUFFIX_SLOTS.update({"-nya": _PRONOUN, "-ku": _PRONOUN})
+# Sufiks asli; sufiks lain di kamus adalah serapan (-is, -isme, -wan, ...)
+_NATIVE_SUFFIXES = frozenset(_SUFFIX_SLOTS) | {"-i", "-an", "-kan"}
+
+# Jumlah prefix bertumpuk maksimum (mem-per-, di-per-, ke-ber-)
+_MAX_PREFIXES = 2
+# Kata dasar yang lebih pendek tidak dipakai (kamus memuat nama huruf)
+_MIN_ROOT_LENGTH = 3
+
+
+class _Trie:
+    """Trie karakter sederhana: node berupa dict, nilai disimpan di kunci None."""
+
+    def __init__(self):
+        self.root = {}
+
+    def add(self, key: str, value) -> None:
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(value)
+
+    def matches(self, chars):
+        """Yield (panjang, nilai) untuk setiap kunci yang menjadi awalan `chars`."""
+        node = self.root
+        length = 0
+        for char in chars:
+            node = node.get(char)
+            if node is None:
+                return
+            length += 1
+            values = node.get(None)
+            if values:
+                yield length, values
+
+
+class MorphologicalAnalyzer:
+    """Pecah token menjadi prefix, infiks, kata dasar, dan sufiks.
+
+    Hasil per token disimpan di cache LRU, jadi token yang sering muncul hanya
+    dianalisis sekali.
+
+    Example:
+        >>> analyzer = MorphologicalAnalyzer()
+        >>> analysis = analyzer.analyze("mempermainkannya")
+        >>> analysis.root, analysis.prefixes, analysis.suffixes
+        ('main', ('meng-', 'per-'), ('-kan', '-nya'))
+        >>> analysis.pos
+        ('Verba',)
+        >>> analyzer.lemmatize(["Mereka", "bermain", "bola"])
+        ['mereka', 'main', 'bola']
+    """
+
+    def __init__(self, cache_size: int = None, entries: Iterable = None):
+        """Inisialisasi analyzer.
+
+        Args:
+            cache_size: Jumlah token maksimum di cache (default: 100.000;
+                0 = tanpa cache)
+            entries: Entri (kata/afiks, kode kelas kata) pengganti kamus.txt
+        """
+        if entries is None:
+            from nahiarhdNLP.datasets.loaders import DatasetLoader
+
+            entries = DatasetLoader().load_kamus_dataset()
+        self.cache = StemCache(
+            maxsize=DEFAULT_MAXSIZE if cache_size is None else cache_size
+        )
+        self._compile(entries)
+
+    def _compile(self, entries) -> None:
+        roots = {}
+        prefixes, suffixes, infixes = [], [], []
+        confixes = set()
+        for entry, tag in entries:
+            entry = entry.lower()
+            if " -- " in entry:
+                prefix, _, suffix = entry.partition(" -- ")
+                confixes.add((prefix + "-", "-" + suffix))
+            elif entry.startswith("-") and entry.endswith("-") and len(entry) > 2:
+                infixes.append(entry)
+            elif entry.startswith("-"):
+                suffixes.append(entry)
+            elif entry.endswith("-"):
+                prefixes.append(entry)
+            elif " " not in entry:
+                tags = roots.setdefault(entry, [])
+                pos = POS_TAGS.get(tag)
+                if pos and pos not in tags:
+                    tags.append(pos)
+        for affix in _EXTRA_AFFIXES:
+            (suffixes if affix.startswith("-") else prefixes).append(affix)
+
+        # Hash index kata dasar -> tuple kelas kata
+        self.roots = {word: tuple(tags) for word, tags in roots.items()}
+        self.confixes = frozenset(confixes)
+        self.infixes = {infix.strip("-"): infix for infix in infixes}
+
+        self._prefix_trie = _Trie()
+        for prefix in dict.fromkeys(prefixes):
+            default = ((prefix.rstrip("-"), ""),)
+            for surface, restore in _ALLOMORPHS.get(prefix, default):
+                self._prefix_trie.add(surface, (prefix, restore))
+        # Sufiks disimpan terbalik agar dicocokkan dari akhir kata
+        self._suffix_trie = _Trie()
+        for suffix in dict.fromkeys(suffixes):
+            slot = _SUFFIX_SLOTS.get(suffix, _DERIVATIONAL)
+            self._suffix_trie.add(suffix.lstrip("-")[::-1], (suffix, slot))
+
+    def __len__(self) -> int:
+        return len(self.roots)
+
+    def analyze(self, word: str) -> MorphAnalysis:
+        """Analisis satu token (dicocokkan dalam huruf kecil)."""
+        word = word.lower()
+        result = self.cache.get(word)
+        if result is None:
+            result = self._analyze(word)
+            self.cache.set(word, result)
+        return result
+
+    def analyze_tokens(self, tokens: Iterable[str]) -> List[MorphAnalysis]:
+        """Analisis daftar token; token yang sama dalam batch dianalisis sekali."""
+        return self._analyze_all(tokens, {})
+
+    def analyze_batch(self, token_lists: Iterable[Iterable[str]]) -> List[list]:
+        """Analisis banyak daftar token (mis. satu per dokumen) sekaligus."""
+        seen = {}
+        return [self._analyze_all(tokens, seen) for tokens in token_lists]
+
+    def lemmatize(self, tokens: Iterable[str]) -> List[str]:
+        """Kata dasar setiap token."""
+        return [analysis.root for analysis in self.analyze_tokens(tokens)]
+
+    def cache_stats(self) -> dict:
+        """Statistik cache analisis (lihat `StemCache.stats`)."""
+        return self.cache.stats()
+
+    def _analyze_all(self, tokens, seen: dict) -> list:
+        analyze = self.analyze
+        results = []
+        for token in tokens:
+            result = seen.get(token)
+            if result is None:
+                result = seen[token] = analyze(token)
+            results.append(result)
+        return results
+
+    def _analyze(self, word: str) -> MorphAnalysis:
+        pos = self.roots.get(word)
+        if pos is not None:
+            return MorphAnalysis(word, word, (), None, (), pos, True)
+
+        best = self._best_split(word)
+        if best is None and "-" in word:
+            best = self._reduplication(word)
+        if best is None:
+            return MorphAnalysis(word, word, (), None, (), (), False)
+        root, prefixes, infix, suffixes = best
+        return MorphAnalysis(
+            word, root, prefixes, infix, suffixes, self.roots[root], True
+        )
+
+    def _best_split(self, word: str):
+        """Kandidat terbaik (root, prefixes, infix, suffixes) atau None.
+
+        Urutan preferensi: afiks paling sedikit (konfiks dihitung satu),
+        tanpa infiks, tanpa sufiks serapan, sufiks terpanjang (sama seperti
+        Sastrawi), kata dasar terpanjang, lalu tanpa huruf luluh.
+        """
+        roots = self.roots
+        best = None
+        best_score = None
+        for stem, suffixes in self._suffix_splits(word, _PARTICLE):
+            for root, prefixes, restored in self._prefix_splits(stem, 0):
+                infix = None
+                if root not in roots:
+                    root, infix = self._remove_infix(root)
+                    if infix is None:
+                        continue
+                if len(root) < _MIN_ROOT_LENGTH:
+                    continue
+                count = len(prefixes) + len(suffixes) + (infix is not None)
+                if (
+                    prefixes
+                    and suffixes
+                    and (prefixes[-1], suffixes[0]) in self.confixes
+                ):
+                    count -= 1
+                score = (
+                    count,
+                    infix is not None,
+                    sum(suffix not in _NATIVE_SUFFIXES for suffix in suffixes),
+                    -sum(map(len, suffixes)),
+                    -len(root),
+                    restored,
+                )
+                if best_score is None or score < best_score:
+                    best, best_score = (root, prefixes, infix, suffixes), score
+        return best
+
+    def _suffix_splits(self, word: str, max_slot: int):
+        """Yield (sisa kata, sufiks dari dalam ke luar), termasuk tanpa sufiks."""
+        yield word, ()
+        for length, values in self._suffix_trie.matches(reversed(word)):
+            if length >= len(word):
+                break
+            stem = word[:-length]
+            for suffix, slot in values:
+                if slot > max_slot:
+                    continue
+                for inner, suffixes in self._suffix_splits(stem, slot - 1):
+                    yield inner, suffixes + (suffix,)
+
+    def _prefix_splits(self, word: str, depth: int):
+        """Yield (sisa kata, prefix dari luar ke dalam, jumlah huruf luluh)."""
+        yield word, (), 0
+        if depth >= _MAX_PREFIXES:
+            return
+        for length, values in self._prefix_trie.matches(word):
+            if length >= len(word):
+                break
+            rest = word[length:]
+            for prefix, restore in values:
+                onsets = _ONSETS.get((prefix, word[:length]))
+                if onsets is not None and not restore and rest[0] not in onsets:
+                    continue
+                for inner, prefixes, restored in self._prefix_splits(
+                    restore + rest, depth + 1
+                ):
+                    yield inner, (prefix,) + prefixes, restored + bool(restore)
+
+    def _remove_infix(self, word: str):
+        """(kata dasar, infiks) untuk bentuk K + infiks + ..., atau (word, None)."""
+        infix = self.infixes.get(word[1:3])
+        if infix is not None:
+            root = word[0] + word[3:]
+            if root in self.roots:
+                return root, infix
+        return word, None
+
+    def _reduplication(self, word: str):
+        """Kata ulang (berlari-lari, buku-bukunya): gabungan analisis kedua sisi."""
+        first, _, second = word.rpartition("-")
+        left = self.roots.get(first) is not None or self._best_split(first)
+        right = self.roots.get(second) is not None or self._best_split(second)
+        if not left or not right:
+            return None
+        left = (first, (), None, ()) if left is True else left
+        right = (second, (), None, ()) if right is True else right
+        if left[0] != right[0]:
+            return None
+        prefixes = tuple(dict.fromkeys(left[1] + right[1]))
+        suffixes = tuple(dict.fromkeys(left[3] + right[3]))
+        return left[0], prefixes, left[2] or right[2], suffixes
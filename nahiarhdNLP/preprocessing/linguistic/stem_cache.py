@@ -0,0 +1,163 @@
+"""
+Cache hasil stemming per token dengan batas ukuran (LRU).
+
+Sastrawi menyimpan hasil stemming di dict tanpa batas, sehingga memori service
+yang berjalan lama terus bertambah. `StemCache` membatasi jumlah entri, mencatat
+hit/miss, dan bisa disimpan ke disk agar proses baru langsung mulai "hangat".
+"""
+
+import marshal
+import os
+import threading
+from collections import OrderedDict
+
+# Naikkan jika format file cache berubah
+CACHE_VERSION = 2
+
+DEFAULT_MAXSIZE = 100_000
+
+
+class StemCache:
+    """LRU cache kata -> kata dasar, aman dipakai bersama oleh banyak thread.
+
+    Example:
+        >>> cache = StemCache(maxsize=2)
+        >>> cache.set("memakan", "makan")
+        >>> cache.get("memakan")
+        'makan'
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_MAXSIZE, path: str = None, namespace: str = ""
+    ):
+        """Inisialisasi cache.
+
+        Args:
+            maxsize: Jumlah entri maksimum (0 untuk menonaktifkan cache).
+                Satu entri kira-kira 150-200 byte.
+            path: File untuk `save`/`load`; jika ada, langsung dimuat
+            namespace: Penanda sumber hasil (mis. engine stemmer); file dengan
+                namespace lain diabaikan saat `load`
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.path = os.path.expanduser(path) if path else None
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        # Urutan LRU diubah oleh get maupun set, jadi keduanya perlu dikunci
+        self._lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._data
+
+    def get(self, word: str):
+        """Ambil kata dasar dari cache; None jika belum ada (miss)."""
+        with self._lock:
+            try:
+                root = self._data[word]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(word)
+            self.hits += 1
+            return root
+
+    def set(self, word: str, root: str) -> None:
+        """Simpan hasil stemming, membuang entri paling lama jika penuh."""
+        if not self.maxsize:
+            return
+        with self._lock:
+            data = self._data
+            data[word] = root
+            data.move_to_end(word)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Kosongkan cache dan reset statistik."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Statistik cache: size, maxsize, hits, misses, evictions, hit_rate."""
+        with self._lock:
+            hits, misses, size = self.hits, self.misses, len(self._data)
+            evictions = self.evictions
+        lookups = hits + misses
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path: str = None) -> None:
+        """Simpan isi cache ke file secara atomik (urutan LRU dipertahankan).
+
+        Args:
+            path: Tujuan (default: `self.path`)
+        """
+        path = os.path.expanduser(path) if path else self.path
+        if not path:
+            raise ValueError("No cache path given")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            payload = (CACHE_VERSION, self.namespace, list(self._data.items()))
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(payload))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def load(self, path: str = None) -> int:
+        """Muat entri dari file hasil `save`.
+
+        File rusak, versi lain, atau namespace lain diabaikan.
+
+        Args:
+            path: Sumber (default: `self.path`)
+
+        Returns:
+            Jumlah entri yang dimuat
+        """
+        path = os.path.expanduser(path) if path else self.path
+        try:
+            with open(path, "rb") as f:
+                payload = marshal.loads(f.read())
+            version = payload[0]
+        except (OSError, EOFError, ValueError, TypeError, IndexError) as e:
+            print(f"Warning: Error loading stem cache from {path}: {e}")
+            return 0
+        if version != CACHE_VERSION:
+            return 0
+        _, namespace, items = payload
+        if namespace != self.namespace:
+            return 0
+
+        # Entri terbaru ada di akhir; jika melebihi maxsize, ambil yang terbaru
+        if self.maxsize:
+            items = items[-self.maxsize :]
+        else:
+            items = []
+        for word, root in items:
+            self.set(word, root)
+        return len(items)
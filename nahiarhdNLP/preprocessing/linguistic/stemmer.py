@@ -1,7 +1,15 @@
 """
-Stemmer for Indonesian text (menggunakan Sastrawi).
+Stemmer for Indonesian text (menggunakan Sastrawi atau kamus kata dasar KBBI).
 """
 
+import atexit
+import os
+import re
+from typing import Iterable, List
+
+from ..patterns import register_pattern
+from .stem_cache import DEFAULT_MAXSIZE, StemCache
+
 try:
     from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
 
@@ -9,17 +17,141 @@ try:
 except ImportError:
     _sastrawi_available = False
 
+# Batas & lokasi cache default bisa diatur lewat environment (mis. di produksi)
+CACHE_SIZE_ENV_VAR = "NAHIARHDNLP_STEM_CACHE_SIZE"
+CACHE_PATH_ENV_VAR = "NAHIARHDNLP_STEM_CACHE_PATH"
+ENGINE_ENV_VAR = "NAHIARHDNLP_STEMMER_ENGINE"
+
+# "sastrawi": Sastrawi apa adanya, "dictionary": DictionaryStemmer + kamus KBBI
+ENGINES = ("sastrawi", "dictionary")
+DEFAULT_ENGINE = "sastrawi"
+# Kata dasar KBBI yang lebih pendek (nama huruf) diabaikan engine "dictionary"
+MIN_ROOT_LENGTH = 3
+
+# Sama dengan Sastrawi.Stemmer.Filter.TextNormalizer.normalize_text
+NON_WORD_PATTERN = register_pattern(
+    "stemmer.non_word", r"[^a-z0-9 -]", re.IGNORECASE | re.MULTILINE
+)
+
 
 class Stemmer:
-    """Stemming kata bahasa Indonesia menggunakan Sastrawi."""
+    """Stemming kata bahasa Indonesia menggunakan Sastrawi atau kamus KBBI.
+
+    Engine "sastrawi" memakai Sastrawi apa adanya. Engine "dictionary" memakai
+    algoritma yang sama dengan kamus `kata_dasar_kbbi.csv` di hash index (lihat
+    `DictionaryStemmer`), jauh lebih cepat per token dan tidak butuh Sastrawi;
+    hasilnya bisa berbeda untuk kata yang kata dasarnya hanya ada di salah
+    satu kamus.
+
+    Hasil stemming disimpan per token di `StemCache` yang ukurannya dibatasi,
+    jadi token yang sudah pernah dilihat tidak diproses ulang.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = None,
+        cache_path: str = None,
+        engine: str = None,
+        dictionary: Iterable[str] = None,
+    ):
+        """Inisialisasi stemmer.
+
+        Args:
+            cache_size: Jumlah token maksimum di cache (default: env
+                NAHIARHDNLP_STEM_CACHE_SIZE atau 100.000; 0 = tanpa cache)
+            cache_path: File cache di disk; dimuat saat init dan disimpan saat
+                proses keluar (default: env NAHIARHDNLP_STEM_CACHE_PATH)
+            engine: "sastrawi" atau "dictionary" (default: env
+                NAHIARHDNLP_STEMMER_ENGINE atau "sastrawi")
+            dictionary: Kata dasar untuk engine "dictionary", dipakai apa adanya
+                (default: kamus KBBI bawaan, tanpa kata dasar di bawah 3 huruf)
+        """
+        if engine is None:
+            engine = os.environ.get(ENGINE_ENV_VAR) or DEFAULT_ENGINE
+        engine = engine.strip().lower()
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown stemmer engine '{engine}', expected one of {ENGINES}"
+            )
+        self.engine = engine
 
-    def __init__(self):
-        if not _sastrawi_available:
-            raise ImportError(
-                "Sastrawi belum terinstall. Install dengan: pip install Sastrawi"
+        if engine == "dictionary":
+            namespace = self._init_dictionary(dictionary)
+        else:
+            if not _sastrawi_available:
+                raise ImportError(
+                    "Sastrawi belum terinstall. Install dengan: pip install Sastrawi"
+                )
+            factory = StemmerFactory()
+            self.stemmer = factory.create_stemmer()
+            # Stemmer Sastrawi tanpa cache bawaannya (dict yang tidak dibatasi)
+            self._stem_word = self.stemmer.delegatedStemmer.stem_word
+            namespace = engine
+
+        if cache_size is None:
+            cache_size = int(os.environ.get(CACHE_SIZE_ENV_VAR, DEFAULT_MAXSIZE))
+        if cache_path is None:
+            cache_path = os.environ.get(CACHE_PATH_ENV_VAR) or None
+        # Namespace mencegah file cache hasil engine/kamus lain ikut dimuat
+        self.cache = StemCache(maxsize=cache_size, path=cache_path, namespace=namespace)
+        if cache_path:
+            atexit.register(self._save_cache_at_exit)
+
+    def _init_dictionary(self, dictionary) -> str:
+        from nahiarhdNLP.datasets.cache import text_digest
+        from nahiarhdNLP.datasets.loaders import DatasetLoader
+
+        from .dictionary_stemmer import DictionaryStemmer
+
+        if dictionary is None:
+            loader = DatasetLoader()
+            self.stemmer = DictionaryStemmer(
+                loader.load_root_words_dataset(), min_length=MIN_ROOT_LENGTH
             )
-        factory = StemmerFactory()
-        self.stemmer = factory.create_stemmer()
+            digest = loader.dataset_digest("root_words")
+        else:
+            self.stemmer = DictionaryStemmer(dictionary)
+            digest = text_digest(sorted(self.stemmer.roots))
+        if not self.stemmer.roots:
+            print("Warning: Root word dictionary is empty, stemming is a no-op")
+        self._stem_word = self.stemmer.stem_word
+        return f"dictionary:{digest}"
+
+    def stem_word(self, word: str) -> str:
+        """Stem satu token yang sudah dinormalisasi (huruf kecil, a-z0-9-)."""
+        root = self.cache.get(word)
+        if root is None:
+            root = self._stem_word(word)
+            self.cache.set(word, root)
+        return root
 
     def stem(self, text: str) -> str:
-        return self.stemmer.stem(text) if text else text
+        if not text:
+            return text
+        return " ".join(self.stem_tokens(text.split()))
+
+    def stem_tokens(self, tokens: List[str]) -> List[str]:
+        """Stem daftar token (hasil `str.split()`).
+
+        Tanda baca di dalam token ikut memecah token (sama seperti Sastrawi),
+        jadi jumlah hasil bisa berbeda dengan jumlah input.
+        """
+        if not tokens:
+            return []
+        words = NON_WORD_PATTERN.sub(" ", " ".join(tokens).lower()).split()
+        stem_word = self.stem_word
+        return [stem_word(word) for word in words]
+
+    def cache_stats(self) -> dict:
+        """Statistik cache stemming (lihat `StemCache.stats`)."""
+        return self.cache.stats()
+
+    def save_cache(self, path: str = None) -> None:
+        """Simpan cache stemming ke disk (default: `cache_path`)."""
+        self.cache.save(path)
+
+    def _save_cache_at_exit(self) -> None:
+        try:
+            self.cache.save()
+        except OSError as e:
+            print(f"Warning: Error saving stem cache: {e}")
@@ -2,58 +2,111 @@
 Stopword remover for Indonesian text processing.
 """
 
-import re
-from typing import List
+from typing import FrozenSet, List, Sequence
 
 from nahiarhdNLP.datasets.loaders import DatasetLoader
+from nahiarhdNLP.datasets.shared import (
+    KIND_SET,
+    shared_dictionaries_enabled,
+    shared_table,
+)
+
+from ..patterns import register_pattern
+
+# Pola regex dikompilasi sekali saat import modul (lihat preprocessing.patterns)
+PUNCTUATION_PATTERN = register_pattern("stopword.punctuation", r"[^\w\s]")
+WHITESPACE_PATTERN = register_pattern("stopword.whitespace", r"\s+")
 
 
 class StopwordRemover:
     """Remove stopwords from Indonesian text."""
 
-    def __init__(self, language: str = "indonesian", **kwargs):
+    def __init__(self, language: str = "indonesian", shared: bool = None, **kwargs):
         """Initialize stopword remover.
 
         Args:
             language: Language code
+            shared: Simpan stopword sebagai SharedTable memory-mapped yang
+                dipakai bersama semua proses (default: lihat
+                `datasets.shared.shared_dictionaries_enabled`)
             **kwargs: Additional arguments
         """
         self.language = language
-        self.stopwords: List[str] = []
+        self.shared = shared_dictionaries_enabled() if shared is None else shared
+        self._stopword_list: Sequence[str] = []
+        self._stopword_set: FrozenSet[str] = frozenset()
+
+    @property
+    def stopwords(self) -> Sequence[str]:
+        """Daftar stopword (dipertahankan untuk kompatibilitas).
+
+        Pengecekan keanggotaan memakai frozenset internal, jadi ubah daftar
+        ini lewat assignment (bukan `append`) agar set ikut diperbarui.
+        Dalam mode biasa berupa `list`; dalam mode shared berupa `KeySequence`
+        read-only di atas SharedTable, jadi pakai `list(...)` jika butuh list
+        yang bisa diubah.
+        """
+        return self._stopword_list
+
+    @stopwords.setter
+    def stopwords(self, words: List[str]) -> None:
+        self._stopword_list = list(words)
+        self._stopword_set = frozenset(self._stopword_list)
+
+    @property
+    def stopword_set(self) -> FrozenSet[str]:
+        """Stopword dalam frozenset (SharedTable dalam mode shared)."""
+        return self._stopword_set
 
     def _load_data(self):
         """Load stopwords data dari CSV."""
         try:
             loader = DatasetLoader()
+            if self.shared:
+                table = shared_table(
+                    "stopwords-set",
+                    loader.dataset_digest("stopwords"),
+                    lambda: loader.load_stopwords_dataset(language=self.language),
+                    KIND_SET,
+                    loader.cache,
+                )
+                self._stopword_list = table.keys_view()
+                self._stopword_set = table
+                return
             dataset = loader.load_stopwords_dataset(language=self.language)
             self.stopwords = dataset
         except Exception as e:
             print(f"Warning: Could not load stopwords dataset: {e}")
             self.stopwords = []
 
+    @classmethod
+    def build_shared_tables(cls) -> None:
+        """Bangun file SharedTable stopword jika belum ada."""
+        cls(shared=True)._load_data()
+
     def is_stopword(self, word: str) -> bool:
         """Check if a word is a stopword."""
-        return word.lower() in self.stopwords
+        return word.lower() in self._stopword_set
 
     def remove_stopwords(self, text: str) -> str:
         """Remove stopwords from text."""
         if not text:
             return text
 
-        # Split text into words
-        words = text.split()
+        # Token tidak mengandung spasi, jadi hasil join sudah rapi
+        return " ".join(self.remove_stopwords_tokens(text.split()))
+
+    def remove_stopwords_tokens(self, tokens: List[str]) -> List[str]:
+        """Remove stopwords dari daftar token (hasil `str.split()`).
 
-        # Filter out stopwords
+        Token tanda baca saja tetap dipertahankan.
+        """
+        stopword_set = self._stopword_set
         filtered_words = []
-        for word in words:
-            # Clean word (remove punctuation)
-            clean_word = re.sub(r"[^\w\s]", "", word)
-            if clean_word and not self.is_stopword(clean_word):
-                filtered_words.append(word)
-            elif not clean_word:  # Keep punctuation-only words
+        for word in tokens:
+            # Clean word (remove punctuation); token alfanumerik (mis. hasil
+            # Tokenizer) tidak punya tanda baca sehingga regex dilewati
+            clean_word = word if word.isalnum() else PUNCTUATION_PATTERN.sub("", word)
+            if not clean_word or clean_word.lower() not in stopword_set:
                 filtered_words.append(word)
-
-        result = " ".join(filtered_words)
-        # Bersihkan spasi ganda
-        result = re.sub(r"\s+", " ", result).strip()
-        return result
+        return filtered_words
@@ -1,16 +1,19 @@
 """
 Main functions for preprocessing Indonesian text.
+
+Modul step (cleaning, Sastrawi, dataset, dll.) baru di-import saat Pipeline
+yang memakainya dibuat, jadi pipeline cleaning saja tidak ikut memuat
+Sastrawi maupun dataset loader.
 """
 
-# Import kelas-kelas yang sudah ada
-from .cleaning.text_cleaner import TextCleaner
-from .cleaning.text_cleaner_word import TextCleanerWord as WordTextCleaner
-from .cleaning.text_replace import TextReplace
-from .linguistic.stemmer import Stemmer
-from .linguistic.stopword import StopwordRemover
-from .normalization.emoji import EmojiConverter
-from .normalization.spell_corrector import SpellCorrector
-from .tokenization.tokenizer import Tokenizer
+import os
+import sys
+import threading
+from collections import deque
+from functools import partial
+from importlib import import_module
+from itertools import islice
+from time import perf_counter
 
 # Inisialisasi instance global untuk fungsi-fungsi utility (lazy loading)
 _text_cleaner = None
@@ -22,65 +25,270 @@ _emoji = None
 _spell_corrector = None
 _tokenizer = None
 
+# Nama kelas resource -> waktu load (detik), lihat Pipeline.stats()
+_resource_load_times = {}
+
+# Melindungi pembuatan resource global: setiap resource dimuat tepat sekali
+# dan baru terlihat oleh thread lain setelah selesai dimuat
+_resource_lock = threading.Lock()
+
+
+def _load_resource(cls, *loaders):
+    """Buat & muat instance resource lalu catat waktu load-nya.
+
+    Dipanggil oleh getter di bawah `_resource_lock`; instance baru di-assign ke
+    variabel global setelah semua loader selesai.
+    """
+    start = perf_counter()
+    instance = cls()
+    for loader in loaders:
+        getattr(instance, loader)()
+    _resource_load_times[cls.__name__] = perf_counter() - start
+    return instance
+
 
 def _get_text_cleaner():
     global _text_cleaner
     if _text_cleaner is None:
-        _text_cleaner = TextCleaner()
+        with _resource_lock:
+            if _text_cleaner is None:
+                from .cleaning.text_cleaner import TextCleaner
+
+                _text_cleaner = _load_resource(TextCleaner)
     return _text_cleaner
 
 
 def _get_text_cleaner_word():
     global _text_cleaner_word
     if _text_cleaner_word is None:
-        _text_cleaner_word = WordTextCleaner()
+        with _resource_lock:
+            if _text_cleaner_word is None:
+                from .cleaning.text_cleaner_word import TextCleanerWord
+
+                _text_cleaner_word = _load_resource(TextCleanerWord)
     return _text_cleaner_word
 
 
 def _get_text_replace():
     global _text_replace
     if _text_replace is None:
-        _text_replace = TextReplace()
+        with _resource_lock:
+            if _text_replace is None:
+                from .cleaning.text_replace import TextReplace
+
+                _text_replace = _load_resource(TextReplace)
     return _text_replace
 
 
 def _get_stemmer():
     global _stemmer
     if _stemmer is None:
-        _stemmer = Stemmer()
+        with _resource_lock:
+            if _stemmer is None:
+                from .linguistic.stemmer import Stemmer
+
+                _stemmer = _load_resource(Stemmer)
     return _stemmer
 
 
 def _get_stopword():
     global _stopword
     if _stopword is None:
-        _stopword = StopwordRemover()
-        _stopword._load_data()
+        with _resource_lock:
+            if _stopword is None:
+                from .linguistic.stopword import StopwordRemover
+
+                _stopword = _load_resource(StopwordRemover, "_load_data")
     return _stopword
 
 
 def _get_emoji():
     global _emoji
     if _emoji is None:
-        _emoji = EmojiConverter()
-        _emoji._load_data()
+        with _resource_lock:
+            if _emoji is None:
+                from .normalization.emoji import EmojiConverter
+
+                _emoji = _load_resource(EmojiConverter, "_load_data")
     return _emoji
 
 
 def _get_spell_corrector():
     global _spell_corrector
     if _spell_corrector is None:
-        _spell_corrector = SpellCorrector()
+        with _resource_lock:
+            if _spell_corrector is None:
+                from .normalization.spell_corrector import SpellCorrector
+
+                _spell_corrector = _load_resource(SpellCorrector)
     return _spell_corrector
 
 
 def _get_tokenizer():
     global _tokenizer
     if _tokenizer is None:
-        _tokenizer = Tokenizer()
+        with _resource_lock:
+            if _tokenizer is None:
+                from .tokenization.tokenizer import Tokenizer
+
+                _tokenizer = _load_resource(Tokenizer)
     return _tokenizer
 
 
+class _LazyMethod:
+    """Referensi `Kelas.method` yang modulnya baru di-import saat dibutuhkan."""
+
+    __slots__ = ("module", "qualname", "_func")
+
+    def __init__(self, module: str, qualname: str):
+        self.module = module
+        self.qualname = qualname
+        self._func = None
+
+    def resolve(self):
+        if self._func is None:
+            cls_name, method_name = self.qualname.split(".")
+            cls = getattr(import_module(self.module, __package__), cls_name)
+            self._func = getattr(cls, method_name)
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self.module}.{self.qualname}>"
+
+
+def _step(getter, method, **kwargs):
+    """Buat callable satu-teks; instance di-resolve saat dipanggil (lazy)."""
+    method = method.resolve()
+
+    def func(text):
+        return method(getter(), text, **kwargs)
+
+    return func
+
+
+def _batch_step(getter, method, **kwargs):
+    """Buat callable batch; instance & method di-resolve sekali per chunk."""
+    method = method.resolve()
+
+    def func(texts):
+        return list(map(partial(method, getter(), **kwargs), texts))
+
+    return func
+
+
+_CLEANER = ".cleaning.text_cleaner"
+_CLEANER_WORD = ".cleaning.text_cleaner_word"
+_REPLACE = ".cleaning.text_replace"
+
+
+def _cleaner(name):
+    return _LazyMethod(_CLEANER, f"TextCleaner.{name}")
+
+
+def _cleaner_word(name):
+    return _LazyMethod(_CLEANER_WORD, f"TextCleanerWord.{name}")
+
+
+def _replace(name):
+    return _LazyMethod(_REPLACE, f"TextReplace.{name}")
+
+
+# mapping step -> (getter instance, method kelas, kwargs)
+# Use class methods bound at call-time to avoid instance attributes shadowing methods
+_STEP_SPECS = {
+    "remove_html": (_get_text_cleaner, _cleaner("remove_html"), {}),
+    "remove_urls": (_get_text_cleaner, _cleaner("remove_urls"), {}),
+    "remove_mentions": (_get_text_cleaner, _cleaner("remove_mentions"), {}),
+    "remove_hashtags": (_get_text_cleaner, _cleaner("remove_hashtags"), {}),
+    "remove_punctuation": (
+        _get_text_cleaner,
+        _cleaner("remove_punctuation"),
+        {"force": True},
+    ),
+    "remove_emoji": (_get_text_cleaner, _cleaner("remove_emoji"), {"force": True}),
+    "remove_lowercase": (_get_text_cleaner, _cleaner("remove_lowercase"), {}),
+    "remove_extra_spaces": (_get_text_cleaner, _cleaner("remove_extra_spaces"), {}),
+    "remove_repeated_chars": (
+        _get_text_cleaner,
+        _cleaner("remove_repeated_chars"),
+        {},
+    ),
+    "remove_special_chars": (_get_text_cleaner, _cleaner("remove_special_chars"), {}),
+    "remove_whitespace": (_get_text_cleaner, _cleaner("remove_whitespace"), {}),
+    "remove_emails": (
+        _get_text_cleaner,
+        _cleaner("remove_emails"),
+        {"keep_text": False, "force": True},
+    ),
+    "remove_phones": (
+        _get_text_cleaner,
+        _cleaner("remove_phones"),
+        {"keep_numbers": False, "force": True},
+    ),
+    "remove_currency": (
+        _get_text_cleaner,
+        _cleaner("remove_currency"),
+        {"keep_numbers": False, "force": True},
+    ),
+    "remove_numbers": (_get_text_cleaner, _cleaner("remove_numbers"), {"force": True}),
+    "clean_urls": (_get_text_cleaner_word, _cleaner_word("clean_urls"), {}),
+    "clean_mentions": (_get_text_cleaner_word, _cleaner_word("clean_mentions"), {}),
+    "clean_hashtags": (_get_text_cleaner_word, _cleaner_word("clean_hashtags"), {}),
+    "clean_html": (_get_text_cleaner_word, _cleaner_word("clean_html"), {}),
+    "replace_email": (_get_text_replace, _replace("replace_email"), {}),
+    "replace_link": (_get_text_replace, _replace("replace_link"), {}),
+    "replace_user": (_get_text_replace, _replace("replace_user"), {}),
+    "stem": (_get_stemmer, _LazyMethod(".linguistic.stemmer", "Stemmer.stem"), {}),
+    "stopword": (
+        _get_stopword,
+        _LazyMethod(".linguistic.stopword", "StopwordRemover.remove_stopwords"),
+        {},
+    ),
+    "emoji_to_text": (
+        _get_emoji,
+        _LazyMethod(".normalization.emoji", "EmojiConverter.emoji_to_text_convert"),
+        {},
+    ),
+    "text_to_emoji": (
+        _get_emoji,
+        _LazyMethod(".normalization.emoji", "EmojiConverter.text_to_emoji_convert"),
+        {},
+    ),
+    "spell_corrector_word": (
+        _get_spell_corrector,
+        _LazyMethod(".normalization.spell_corrector", "SpellCorrector.correct_word"),
+        {},
+    ),
+    "spell_corrector_sentence": (
+        _get_spell_corrector,
+        _LazyMethod(
+            ".normalization.spell_corrector", "SpellCorrector.correct_sentence"
+        ),
+        {},
+    ),
+    "tokenizer": (
+        _get_tokenizer,
+        _LazyMethod(".tokenization.tokenizer", "Tokenizer.tokenize"),
+        {},
+    ),
+}
+
+# Semua step cleaning bisa difusikan (lihat cleaning.fusion.CLEANING_OPS)
+_FUSABLE_MODULES = frozenset({_CLEANER, _CLEANER_WORD, _REPLACE})
+
+# Step level-token: step -> (method versi token, hasil selalu token bersih,
+# hasil akhir berupa list token). Lihat tokenization.token_stream.
+_TOKEN_STEPS = {
+    "stopword": ("StopwordRemover.remove_stopwords_tokens", True, False),
+    "spell_corrector_sentence": ("SpellCorrector.correct_tokens", False, False),
+    "stem": ("Stemmer.stem_tokens", False, False),
+    "tokenizer": ("Tokenizer.tokenize_tokens", True, True),
+}
+
+
 class Pipeline:
     """
     Pipeline config-only: hanya menerima dict config {step_name: True/False}.
@@ -91,134 +299,579 @@ class Pipeline:
             raise TypeError("config must be a dict of {step_name: True/False}")
         self.config = config
         self.functions = tuple()
+        self.batch_functions = tuple()
+        # Profiler opsional (lihat enable_profiling); None = tanpa overhead
+        self.profiler = None
+        # Rencana eksekusi (lihat explain), disusun ulang setiap config berubah
+        self.plan = None
+        # Cache hasil opsional (lihat enable_result_cache); None = tanpa overhead
+        self.result_cache = None
         self._build_functions_from_config()
+        # State API async (aprocess), dibuat saat pertama kali dipakai
+        self._async_options = dict(_ASYNC_DEFAULTS)
+        self._async_executor = None
+        self._async_batcher = None
 
     def _build_functions_from_config(self):
+        from .planner import compile_plan
 
-        # mapping step -> callable (internal only)
-        # Use class methods bound at call-time to avoid instance attributes shadowing methods
-        function_mapping = {
-            "remove_html": lambda t, _m=TextCleaner.remove_html: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_urls": lambda t, _m=TextCleaner.remove_urls: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_mentions": lambda t, _m=TextCleaner.remove_mentions: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_hashtags": lambda t, _m=TextCleaner.remove_hashtags: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_punctuation": lambda t, _m=TextCleaner.remove_punctuation: _m(
-                _get_text_cleaner(), t, force=True
-            ),
-            "remove_emoji": lambda t, _m=TextCleaner.remove_emoji: _m(
-                _get_text_cleaner(), t, force=True
-            ),
-            "remove_lowercase": lambda t, _m=TextCleaner.remove_lowercase: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_extra_spaces": lambda t, _m=TextCleaner.remove_extra_spaces: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_repeated_chars": lambda t, _m=TextCleaner.remove_repeated_chars: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_special_chars": lambda t, _m=TextCleaner.remove_special_chars: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_whitespace": lambda t, _m=TextCleaner.remove_whitespace: _m(
-                _get_text_cleaner(), t
-            ),
-            "remove_emails": lambda t, _m=TextCleaner.remove_emails: _m(
-                _get_text_cleaner(), t, keep_text=False, force=True
-            ),
-            "remove_phones": lambda t, _m=TextCleaner.remove_phones: _m(
-                _get_text_cleaner(), t, keep_numbers=False, force=True
-            ),
-            "remove_currency": lambda t, _m=TextCleaner.remove_currency: _m(
-                _get_text_cleaner(), t, keep_numbers=False, force=True
-            ),
-            "remove_numbers": lambda t, _m=TextCleaner.remove_numbers: _m(
-                _get_text_cleaner(), t, force=True
-            ),
-            "clean_urls": lambda t, _m=WordTextCleaner.clean_urls: _m(
-                _get_text_cleaner_word(), t
-            ),
-            "clean_mentions": lambda t, _m=WordTextCleaner.clean_mentions: _m(
-                _get_text_cleaner_word(), t
-            ),
-            "clean_hashtags": lambda t, _m=WordTextCleaner.clean_hashtags: _m(
-                _get_text_cleaner_word(), t
-            ),
-            "clean_html": lambda t, _m=WordTextCleaner.clean_html: _m(
-                _get_text_cleaner_word(), t
-            ),
-            "replace_email": lambda t, _m=TextReplace.replace_email: _m(
-                _get_text_replace(), t
-            ),
-            "replace_link": lambda t, _m=TextReplace.replace_link: _m(
-                _get_text_replace(), t
-            ),
-            "replace_user": lambda t, _m=TextReplace.replace_user: _m(
-                _get_text_replace(), t
-            ),
-            "stem": lambda t, _m=Stemmer.stem: _m(_get_stemmer(), t),
-            "stopword": lambda t, _m=StopwordRemover.remove_stopwords: _m(
-                _get_stopword(), t
-            ),
-            "emoji_to_text": lambda t, _m=EmojiConverter.emoji_to_text_convert: _m(
-                _get_emoji(), t
-            ),
-            "text_to_emoji": lambda t, _m=EmojiConverter.text_to_emoji_convert: _m(
-                _get_emoji(), t
-            ),
-            "spell_corrector_word": lambda t, _m=SpellCorrector.correct_word: _m(
-                _get_spell_corrector(), t
-            ),
-            "spell_corrector_sentence": lambda t, _m=SpellCorrector.correct_sentence: _m(
-                _get_spell_corrector(), t
-            ),
-            "tokenizer": lambda t, _m=Tokenizer.tokenize: _m(_get_tokenizer(), t),
-        }
-
-        functions = []
+        steps = []
         unknown_steps = []
-
         for key, enabled in self.config.items():
             if not enabled:
                 continue
-
-            func = function_mapping.get(key)
-
-            if func is None:
+            if key in _STEP_SPECS:
+                steps.append(key)
+            else:
                 unknown_steps.append(key)
-                continue
-
-            functions.append(func)
 
         if unknown_steps:
             raise ValueError(
                 f"Unknown preprocessing steps: {unknown_steps}. "
-                f"Available: {sorted(function_mapping.keys())}"
+                f"Available: {sorted(_STEP_SPECS.keys())}"
             )
 
+        profiler = self.profiler
+        # Profiling per step menjalankan setiap step sendiri-sendiri
+        self.plan = compile_plan(
+            steps,
+            fusable={
+                key for key in steps if _STEP_SPECS[key][1].module in _FUSABLE_MODULES
+            },
+            token_steps={key: spec[2] for key, spec in _TOKEN_STEPS.items()},
+            optimize=profiler is None or not profiler.per_step,
+        )
+
+        functions = []
+        batch_functions = []
+        # Nama tahap untuk setiap fungsi (dipakai profiler)
+        names = []
+        for stage in self.plan.stages:
+            if stage.kind == "fused":
+                from .cleaning.fusion import FusedCleaner
+
+                # Step cleaning berurutan difusikan jadi satu fungsi
+                fused = FusedCleaner(stage.steps, stage.trailing_collapse)
+                functions.append(fused)
+                batch_functions.append(fused.process_batch)
+            elif stage.kind == "tokens":
+                from .tokenization.token_stream import TokenOp, TokenStream
+
+                # Step level-token dijalankan atas satu daftar token bersama
+                ops = []
+                for key in stage.steps:
+                    getter, method, _ = _STEP_SPECS[key]
+                    qualname, clean, returns_tokens = _TOKEN_STEPS[key]
+                    token_method = _LazyMethod(method.module, qualname).resolve()
+                    ops.append(TokenOp(getter, token_method, clean, returns_tokens))
+                stream = TokenStream(stage.steps, ops)
+                functions.append(stream)
+                batch_functions.append(stream.process_batch)
+            else:
+                (key,) = stage.steps
+                getter, method, kwargs = _STEP_SPECS[key]
+                functions.append(_step(getter, method, **kwargs))
+                batch_functions.append(_batch_step(getter, method, **kwargs))
+            names.append("+".join(stage.steps))
+
+        if profiler is not None:
+            functions = [profiler.wrap(n, f) for n, f in zip(names, functions)]
+            batch_functions = [
+                profiler.wrap(n, f, batch=True) for n, f in zip(names, batch_functions)
+            ]
+
         self.functions = tuple(functions)
+        self.batch_functions = tuple(batch_functions)
+        # Kunci ResultCache mengikuti config; None selama cache tidak aktif
+        self._cache_key = None
+        if self.result_cache is not None:
+            self._cache_key = _result_cache_key(self.plan)
+
+    def explain(self) -> str:
+        """Tampilkan rencana eksekusi hasil optimasi.
+
+        Berisi tahap yang dijalankan (cleaning yang difusikan, token stream,
+        atau step tunggal), step yang dipindah, dan step yang dibuang karena
+        terbukti tidak mengubah hasil (lihat preprocessing.planner).
+
+        Returns:
+            str: Ringkasan rencana, satu tahap per baris
+        """
+        return self.plan.explain()
 
     def process(self, text: str):
         if not text:
             return text
+        cache = self.result_cache
+        if cache is not None:
+            key = self._cache_key(text)
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
         result = text
         for func in self.functions:
             result = func(result)
+        if cache is not None:
+            cache.set(key, result)
+        return result
+
+    def process_batch(self, texts) -> list:
+        """Proses banyak teks sekaligus, step demi step untuk seluruh batch.
+
+        Setiap step yang aktif dijalankan atas seluruh batch sebelum lanjut ke
+        step berikutnya, sehingga lookup instance dan method hanya terjadi
+        sekali per batch. Hasilnya identik dengan memanggil `process` per teks.
+        Jika result cache aktif, teks duplikat dalam batch dan teks yang sudah
+        ada di cache tidak diproses ulang.
+
+        Args:
+            texts: Iterable berisi teks input
+
+        Returns:
+            list: Hasil preprocessing dengan urutan yang sama dengan input
+        """
+        if self.result_cache is not None:
+            batch = self.result_cache.lookup(texts, self._cache_key)
+            if batch.missing:
+                batch.fill(self._process_batch_uncached(batch.missing))
+            return batch.results
+        return self._process_batch_uncached(texts)
+
+    def _process_batch_uncached(self, texts) -> list:
+        results = list(texts)
+        # Teks kosong/None dikembalikan apa adanya, sama seperti `process`
+        indices = [i for i, text in enumerate(results) if text]
+        if not indices:
+            return results
+
+        batch = [results[i] for i in indices]
+        for func in self.batch_functions:
+            batch = func(batch)
+
+        for i, value in zip(indices, batch):
+            results[i] = value
+        return results
+
+    def process_iter(self, texts, chunk_size: int = 1000):
+        """Proses iterable (mis. stream/file) secara bertahap per chunk.
+
+        Args:
+            texts: Iterable berisi teks input, boleh berupa generator
+            chunk_size: Jumlah teks yang diproses per batch
+
+        Yields:
+            Hasil preprocessing per teks dengan urutan yang sama dengan input
+        """
+        for chunk in _iter_chunks(texts, chunk_size):
+            yield from self.process_batch(chunk)
+
+    def process_series(self, series):
+        """Proses kolom pandas Series (pengganti `series.apply(pipeline)`).
+
+        Tahap cleaning dijalankan dengan kernel string pyarrow atas seluruh
+        kolom jika hasilnya dijamin identik, sisanya per elemen (lihat
+        preprocessing.columnar). Result cache tidak dipakai.
+
+        Args:
+            series: pandas Series berisi teks; None/NaN/pd.NA dipertahankan
+
+        Returns:
+            pandas.Series: Hasil dengan index dan nama yang sama
+        """
+        from .columnar import process_series
+
+        return process_series(self, series)
+
+    def process_arrow(self, array):
+        """Proses kolom teks pyarrow (Array atau ChunkedArray, mis. dari Parquet).
+
+        Sama seperti `process_series`; null tetap null. Jika step terakhir
+        tokenizer, hasilnya list<string> dan teks kosong menjadi list kosong.
+        """
+        from .columnar import process_arrow
+
+        return process_arrow(self, array)
+
+    def process_parallel(
+        self,
+        texts,
+        workers: int = None,
+        chunk_size: int = 1000,
+        max_pending: int = None,
+        executor: str = "process",
+    ):
+        """Proses iterable secara paralel memakai process pool atau thread pool.
+
+        Dengan executor "process", setiap worker membuat ulang Pipeline dari
+        config dan memuat resource (dataset, Sastrawi) sekali saja lewat
+        initializer; dictionary spell corrector, stopword, dan emoji dibaca
+        dari tabel memory-mapped yang dipakai bersama semua worker (lihat
+        `nahiarhdNLP.datasets.shared`). Dengan executor "thread", resource
+        dimuat sekali di proses ini lalu dipakai bersama semua thread; ini
+        hanya mempercepat proses di CPython free-threaded (3.13t dengan GIL
+        nonaktif), tapi tanpa biaya start worker dan serialisasi antarproses.
+        Input dibaca per chunk dan jumlah chunk yang sedang diproses dibatasi,
+        jadi memori tetap terkendali walau inputnya berupa stream besar.
+        Jika result cache aktif (lihat `enable_result_cache`), lookup dan
+        deduplikasi dilakukan di proses ini per chunk; worker hanya menerima
+        teks unik yang belum ada di cache.
+
+        Args:
+            texts: Iterable berisi teks input, boleh berupa generator
+            workers: Jumlah worker (default: jumlah CPU)
+            chunk_size: Jumlah teks per chunk yang dikirim ke worker
+            max_pending: Batas chunk yang sedang diproses (default: 2x workers)
+            executor: "process" atau "thread"
+
+        Yields:
+            Hasil preprocessing per teks dengan urutan yang sama dengan input
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError("executor must be 'process' or 'thread'")
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if workers == 1:
+            yield from self.process_iter(texts, chunk_size=chunk_size)
+            return
+
+        if executor == "thread":
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Muat resource sebelum thread mulai, bukan serentak oleh tiap thread
+            self.warm_up()
+            pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="nahiarhdNLP"
+            )
+            job = self._process_batch_uncached
+        else:
+            pool = _process_pool(self.config, workers)
+            job = _process_chunk_in_worker
+
+        max_pending = max_pending or workers * 2
+        chunks = _iter_chunks(texts, chunk_size)
+        cache = self.result_cache
+        if cache is not None:
+            # Cache & deduplikasi di proses ini; worker hanya menerima teks unik
+            chunks = (cache.lookup(chunk, self._cache_key) for chunk in chunks)
+        pending = deque()
+
+        def collect(future, batch):
+            if batch is None:
+                return future.result()
+            if future is not None:
+                batch.fill(future.result())
+            return batch.results
+
+        with pool:
+            try:
+                for chunk in chunks:
+                    if cache is None:
+                        pending.append((pool.submit(job, chunk), None))
+                    elif chunk.missing:
+                        pending.append((pool.submit(job, chunk.missing), chunk))
+                    else:
+                        pending.append((None, chunk))
+                    if len(pending) >= max_pending:
+                        yield from collect(*pending.popleft())
+                while pending:
+                    yield from collect(*pending.popleft())
+            finally:
+                # Konsumen berhenti lebih awal: batalkan chunk yang belum jalan
+                for future, _ in pending:
+                    if future is not None:
+                        future.cancel()
+
+    def warm_up(self) -> None:
+        """Load semua resource yang dibutuhkan step aktif (dataset, Sastrawi).
+
+        Berguna untuk memindahkan biaya lazy loading ke saat startup, misalnya
+        di initializer worker atau sebelum service mulai menerima request.
+        """
+        for key in self.get_enabled_steps():
+            resource = _STEP_SPECS[key][0]()
+            # Resource dengan struktur turunan (mis. indeks SpellCorrector)
+            warm_up = getattr(resource, "warm_up", None)
+            if callable(warm_up):
+                start = perf_counter()
+                warm_up()
+                name = f"{type(resource).__name__}.warm_up"
+                _resource_load_times.setdefault(name, perf_counter() - start)
+
+    def enable_profiling(
+        self,
+        per_step: bool = True,
+        hooks: list = None,
+        sample_size: int = None,
+    ):
+        """Aktifkan pencatatan statistik per step (lihat `stats`).
+
+        Args:
+            per_step: True untuk mengukur setiap step sendiri; fusi cleaning dan
+                token stream dimatikan selama profiling (hasil tetap sama).
+                False untuk mengukur tahap eksekusi apa adanya, mis.
+                "remove_urls+remove_mentions" untuk step yang difusikan.
+            hooks: Callback `hook(event: StepEvent)` untuk setiap pemanggilan
+            sample_size: Jumlah sampel latency per step untuk persentil
+
+        Returns:
+            PipelineProfiler: Profiler aktif (mis. untuk `add_hook`)
+
+        Note:
+            Statistik hanya dicatat di proses ini; worker `process_parallel` dan
+            executor "process" milik `aprocess` tidak ikut tercatat.
+        """
+        from .profiling import DEFAULT_SAMPLE_SIZE, PipelineProfiler
+
+        self.profiler = PipelineProfiler(
+            per_step=per_step,
+            hooks=hooks,
+            sample_size=sample_size or DEFAULT_SAMPLE_SIZE,
+        )
+        self._build_functions_from_config()
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Matikan profiling dan kembalikan fungsi step tanpa pembungkus."""
+        self.profiler = None
+        self._build_functions_from_config()
+
+    def stats(self) -> dict:
+        """Statistik profiling, waktu load resource, dan result cache.
+
+        Returns:
+            dict: {"steps": {step: {calls, texts, total_s, mean_ms, p50_ms,
+            p95_ms, p99_ms, chars_in, chars_out}}, "resources": {kelas: detik},
+            "result_cache": ResultCache.stats()}. "steps" kosong jika profiling
+            tidak aktif, "result_cache" kosong jika cache tidak aktif.
+        """
+        cache = self.result_cache
+        return {
+            "steps": self.profiler.step_stats() if self.profiler else {},
+            "resources": dict(_resource_load_times),
+            "result_cache": cache.stats() if cache is not None else {},
+        }
+
+    def export_flamegraph(self, path: str = None) -> str:
+        """Ekspor `stats()` dalam format folded stacks untuk flamegraph.
+
+        Args:
+            path: File tujuan (opsional)
+
+        Returns:
+            str: Isi laporan, satu baris `pipeline;step mikrodetik` per frame
+        """
+        from .profiling import to_folded
+
+        report = to_folded(self.stats())
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(report)
+        return report
+
+    def enable_result_cache(
+        self,
+        maxsize: int = None,
+        max_bytes: int = None,
+        ttl: float = None,
+        cache=None,
+    ):
+        """Aktifkan cache hasil per teks dan deduplikasi dalam batch.
+
+        Teks yang sama (atau hanya beda spasi, jika step pertama merapikan
+        spasi / memecah teks) cukup diproses sekali: `process`, `process_batch`,
+        `process_iter`, `process_parallel`, dan API async memakai hasil dari
+        cache, dan duplikat dalam satu batch hanya diproses sekali. Kunci cache
+        memuat fingerprint config, jadi `update_config` tidak pernah memakai
+        hasil config lama.
+
+        Args:
+            maxsize: Jumlah entri maksimum (default: 100.000)
+            max_bytes: Batas perkiraan memori hasil (default: 64 MiB)
+            ttl: Umur entri dalam detik (default: tidak kedaluwarsa)
+            cache: ResultCache yang sudah ada, mis. dipakai bersama beberapa
+                Pipeline (argumen lain diabaikan)
+
+        Returns:
+            ResultCache: Cache aktif (lihat `stats()["result_cache"]`)
+
+        Note:
+            Hasil tokenizer (list) disalin untuk setiap pemanggil. Kosongkan
+            cache (`clear()`) setelah mengubah dataset/kamus resource global.
+        """
+        from .result_cache import DEFAULT_MAX_BYTES, DEFAULT_MAXSIZE, ResultCache
+
+        if cache is None:
+            cache = ResultCache(
+                maxsize=DEFAULT_MAXSIZE if maxsize is None else maxsize,
+                max_bytes=DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+                ttl=ttl,
+            )
+        self.result_cache = cache
+        self._cache_key = _result_cache_key(self.plan)
+        return cache
+
+    def disable_result_cache(self) -> None:
+        """Matikan result cache; setiap teks kembali diproses apa adanya."""
+        self.result_cache = None
+        self._cache_key = None
+
+    def configure_async(
+        self,
+        executor="thread",
+        max_workers: int = None,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+        max_pending: int = 10_000,
+        max_concurrency: int = None,
+    ) -> None:
+        """Atur executor dan micro-batching untuk `aprocess`/`aprocess_batch`.
+
+        Args:
+            executor: "thread", "process", atau instance
+                `concurrent.futures.Executor` milik pemanggil (tidak ditutup
+                oleh `aclose`)
+            max_workers: Jumlah worker (default: jumlah CPU; untuk thread
+                hanya 1 jika GIL aktif)
+            max_batch_size: Jumlah teks maksimum per batch
+            max_delay: Waktu tunggu maksimum (detik) untuk mengumpulkan batch
+            max_pending: Jumlah teks maksimum yang menunggu hasil; `aprocess`
+                berikutnya menunggu sampai ada slot kosong
+            max_concurrency: Jumlah batch maksimum di executor (default: 2x
+                max_workers)
+        """
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread', 'process' or an Executor")
+        self._shutdown_async_executor()
+        self._async_options = {
+            "executor": executor,
+            "max_workers": max_workers,
+            "max_batch_size": max_batch_size,
+            "max_delay": max_delay,
+            "max_pending": max_pending,
+            "max_concurrency": max_concurrency,
+        }
+
+    async def aprocess(self, text: str):
+        """Versi async `process` yang tidak memblokir event loop.
+
+        Panggilan yang datang bersamaan digabung menjadi micro-batch lalu
+        diproses di executor (lihat `configure_async`).
+        """
+        if not text:
+            return text
+        cache = self.result_cache
+        if cache is None:
+            return await self._get_batcher().submit(text)
+        key = self._cache_key(text)
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = await self._get_batcher().submit(text)
+            cache.set(key, result)
         return result
 
+    async def aprocess_batch(self, texts) -> list:
+        """Versi async `process_batch`; batch dipecah sesuai `max_batch_size`."""
+        if self.result_cache is not None:
+            batch = self.result_cache.lookup(texts, self._cache_key)
+            if batch.missing:
+                batch.fill(await self._get_batcher().map(batch.missing))
+            return batch.results
+
+        results = list(texts)
+        indices = [i for i, text in enumerate(results) if text]
+        if not indices:
+            return results
+
+        batch = await self._get_batcher().map([results[i] for i in indices])
+        for i, value in zip(indices, batch):
+            results[i] = value
+        return results
+
+    async def aclose(self) -> None:
+        """Tutup executor yang dibuat oleh API async tanpa memblokir loop."""
+        import asyncio
+
+        state, self._async_executor = self._async_executor, None
+        self._async_batcher = None
+        if state is not None and state[2]:
+            await asyncio.get_running_loop().run_in_executor(None, state[0].shutdown)
+
+    def _get_batcher(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        batcher = self._async_batcher
+        if batcher is not None and batcher.loop is loop:
+            return batcher
+
+        from .async_batching import MicroBatcher
+
+        if self._async_executor is None:
+            self._async_executor = self._create_async_executor()
+        executor, func, _, workers, ready = self._async_executor
+
+        async def run_batch(items):
+            if ready is not None and not ready.done():
+                await asyncio.wrap_future(ready)
+            return await loop.run_in_executor(executor, func, items)
+
+        options = self._async_options
+        batcher = MicroBatcher(
+            run_batch,
+            max_batch_size=options["max_batch_size"],
+            max_delay=options["max_delay"],
+            max_pending=options["max_pending"],
+            max_concurrency=options["max_concurrency"] or workers * 2,
+        )
+        self._async_batcher = batcher
+        return batcher
+
+    def _create_async_executor(self) -> tuple:
+        """Buat (executor, fungsi batch, milik sendiri, workers, future warm-up)."""
+        options = self._async_options
+        executor = options["executor"]
+        workers = options["max_workers"]
+
+        if executor == "process":
+            workers = workers or os.cpu_count() or 1
+            # Worker memuat resource sendiri lewat initializer
+            pool = _process_pool(self.config, workers)
+            return pool, _process_chunk_in_worker, True, workers, None
+
+        if executor == "thread":
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Dengan GIL, thread tambahan tidak menambah throughput CPU
+            workers = workers or (1 if _gil_enabled() else os.cpu_count() or 1)
+            pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="nahiarhdNLP"
+            )
+            owned = True
+        else:
+            pool, owned = executor, False
+            workers = workers or getattr(executor, "_max_workers", 1)
+
+        # Resource dimuat sekali sebelum batch pertama, bukan oleh tiap thread;
+        # result cache sudah dicek di aprocess/aprocess_batch
+        ready = pool.submit(self.warm_up)
+        return pool, self._process_batch_uncached, owned, workers, ready
+
+    def _shutdown_async_executor(self) -> None:
+        state, self._async_executor = self._async_executor, None
+        self._async_batcher = None
+        if state is not None and state[2]:
+            state[0].shutdown(wait=False)
+
     def update_config(self, new_config: dict) -> None:
         if not isinstance(new_config, dict):
             raise TypeError("new_config must be dict {step_name: True/False}")
         self.config.update(new_config)
         self._build_functions_from_config()
+        # Worker process masih memegang config lama
+        state = self._async_executor
+        if state is not None and state[1] is _process_chunk_in_worker:
+            self._shutdown_async_executor()
 
     def get_enabled_steps(self) -> list:
         return [k for k, v in self.config.items() if v]
@@ -313,5 +966,111 @@ class Pipeline:
     def __call__(self, text: str):
         return self.process(text)
 
+    def __reduce__(self):
+        # Pickle cukup lewat config; fungsi step dibangun ulang saat unpickle
+        return (self.__class__, (dict(self.config),))
+
     def __repr__(self) -> str:
         return f"Pipeline(config={self.get_enabled_steps()})"
+
+
+def _result_cache_key(plan):
+    """Fungsi teks -> kunci ResultCache untuk rencana eksekusi ini."""
+    from .result_cache import config_fingerprint, text_key
+
+    return partial(
+        text_key,
+        fingerprint=config_fingerprint(plan.configured),
+        collapse=plan.ignores_spacing,
+    )
+
+
+def _gil_enabled() -> bool:
+    """False di CPython free-threaded (3.13t) yang berjalan tanpa GIL."""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _iter_chunks(iterable, chunk_size: int):
+    """Pecah iterable menjadi list berukuran maksimal chunk_size."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Default `Pipeline.configure_async`
+_ASYNC_DEFAULTS = {
+    "executor": "thread",
+    "max_workers": None,
+    "max_batch_size": 64,
+    "max_delay": 0.002,
+    "max_pending": 10_000,
+    "max_concurrency": None,
+}
+
+# Penanda "tidak ada di cache" (None bisa jadi hasil yang sah)
+_MISSING = object()
+
+# Pipeline milik proses worker, dibuat sekali oleh _init_worker
+_worker_pipeline = None
+
+
+# Resource global yang bisa memakai SharedTable (lihat datasets.shared)
+_SHARED_RESOURCES = ("_spell_corrector", "_stopword", "_emoji")
+
+
+def _process_pool(config: dict, workers: int):
+    """ProcessPoolExecutor yang setiap worker-nya membuat Pipeline dari config.
+
+    Worker memakai dictionary SharedTable memory-mapped (kecuali dimatikan
+    lewat `use_shared_dictionaries(False)` / NAHIARHDNLP_SHARED_DICTS=0), jadi
+    RSS per worker tambahan hampir tidak bertambah. File tabel dibangun di
+    sini lebih dulu agar worker tidak membangunnya serentak.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from nahiarhdNLP.datasets.shared import shared_dictionaries_enabled
+
+    shared = shared_dictionaries_enabled(default=True)
+    if shared:
+        built = set()
+        for key, enabled in config.items():
+            spec = _STEP_SPECS.get(key)
+            if not enabled or spec is None:
+                continue
+            method = spec[1]
+            module = import_module(method.module, __package__)
+            cls = getattr(module, method.qualname.split(".")[0])
+            if cls not in built and hasattr(cls, "build_shared_tables"):
+                cls.build_shared_tables()
+                built.add(cls)
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(dict(config), shared),
+    )
+
+
+def _init_worker(config: dict, shared: bool = False) -> None:
+    global _worker_pipeline
+    if shared:
+        from nahiarhdNLP.datasets.shared import use_shared_dictionaries
+
+        use_shared_dictionaries(True)
+        # Resource warisan fork berisi dict biasa dimuat ulang versi shared
+        for name in _SHARED_RESOURCES:
+            resource = globals()[name]
+            if resource is not None and not resource.shared:
+                globals()[name] = None
+    _worker_pipeline = Pipeline(config)
+    _worker_pipeline.warm_up()
+
+
+def _process_chunk_in_worker(chunk: list) -> list:
+    return _worker_pipeline.process_batch(chunk)
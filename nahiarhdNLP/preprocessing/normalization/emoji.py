@@ -3,76 +3,333 @@ Emoji normalizer for Indonesian text processing.
 """
 
 import re
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional
 
 from nahiarhdNLP.datasets.loaders import DatasetLoader
+from nahiarhdNLP.datasets.shared import (
+    KIND_STR,
+    shared_dictionaries_enabled,
+    shared_table,
+)
+
+from ..patterns import compile_pattern
+
+# Kunci penanda akhir emoji di trie; string kosong tidak mungkin jadi karakter
+_TRIE_END = ""
+
+
+def _trie_regex(words) -> str:
+    """Susun pola regex berbentuk trie dari daftar kata.
+
+    Cabang dengan prefix yang sama digabung sehingga regex engine cukup
+    menelusuri satu jalur per posisi, bukan mencoba ribuan alternatif. Akhiran
+    opsional bersifat greedy, jadi kata yang lebih panjang dicoba lebih dulu.
+    """
+    trie: Dict = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = True
+
+    def build(node: Dict) -> str:
+        chars = sorted(c for c in node if c != _TRIE_END)
+        if not chars:
+            return ""
+
+        leaves = [c for c in chars if list(node[c]) == [_TRIE_END]]
+        branches = [re.escape(c) + build(node[c]) for c in chars if c not in leaves]
+        if len(leaves) == 1:
+            branches.append(re.escape(leaves[0]))
+        elif leaves:
+            branches.append("[" + "".join(re.escape(c) for c in leaves) + "]")
+
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if _TRIE_END in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class EmojiMatcher:
+    """Pencocok emoji satu kali jalan (trie) dengan prioritas match terpanjang.
+
+    Sekuens multi-codepoint (skin tone, ZWJ, keycap) selalu menang atas
+    prefixnya, misalnya 👍🏽 tidak akan dipecah menjadi 👍 + 🏽.
+    """
+
+    def __init__(self, mapping: Dict[str, str], trie: bool = True):
+        """Bangun trie dari mapping emoji -> teks.
+
+        Args:
+            mapping: Dictionary emoji ke teks pengganti
+            trie: False untuk mencari langsung di `mapping` (mis. SharedTable)
+                tanpa membuat trie berisi salinan semua emoji; per karakter
+                pembuka hanya panjang emoji yang ada yang dicoba
+        """
+        self.trie: Optional[Dict] = None
+        self.mapping = mapping
+        # Karakter pembuka -> panjang emoji (terpanjang dulu), untuk mode tanpa trie
+        self._lengths: Dict[str, List[int]] = {}
+        if trie:
+            self.trie = {}
+            for emoji, value in mapping.items():
+                if not emoji:
+                    continue
+                node = self.trie
+                for char in emoji:
+                    node = node.setdefault(char, {})
+                node[_TRIE_END] = value
+            starts = "".join(sorted(self.trie))
+        else:
+            for emoji in mapping:
+                if emoji:
+                    self._lengths.setdefault(emoji[0], set()).add(len(emoji))
+            self._lengths = {
+                char: sorted(lengths, reverse=True)
+                for char, lengths in self._lengths.items()
+            }
+            starts = "".join(sorted(self._lengths))
+
+        # Karakter pembuka emoji, dipakai untuk melompat langsung ke kandidat
+        self._start_pattern: Optional[re.Pattern] = (
+            compile_pattern("[" + "".join(re.escape(c) for c in starts) + "]")
+            if starts
+            else None
+        )
+
+    def sub(self, text: str, template: str = " {} ") -> str:
+        """Ganti setiap emoji di `text` dengan `template` berisi teksnya.
+
+        Args:
+            text: Teks input
+            template: Format pengganti, `{}` diisi teks emoji
+
+        Returns:
+            Teks dengan emoji yang sudah diganti
+        """
+        # Semua emoji memuat minimal satu karakter non-ASCII
+        if self._start_pattern is None or text.isascii():
+            return text
+
+        search = self._start_pattern.search
+        trie = self.trie
+        length = len(text)
+        parts = []
+        pos = 0
+        match = search(text, pos)
+        while match:
+            start = match.start()
+            end = -1
+            value = None
+            if trie is None:
+                get = self.mapping.get
+                for size in self._lengths[text[start]]:
+                    if start + size <= length:
+                        value = get(text[start : start + size])
+                        if value is not None:
+                            end = start + size
+                            break
+            else:
+                node = trie
+                i = start
+                while i < length:
+                    node = node.get(text[i])
+                    if node is None:
+                        break
+                    i += 1
+                    if _TRIE_END in node:
+                        end = i
+                        value = node[_TRIE_END]
+
+            if end < 0:
+                # Karakter pembuka tanpa emoji lengkap, lanjut dari karakter berikutnya
+                match = search(text, start + 1)
+                continue
+
+            parts.append(text[pos:start])
+            parts.append(template.format(value))
+            pos = end
+            match = search(text, pos)
+
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return "".join(parts)
 
 
 class EmojiConverter:
     """Converter for emoji to Indonesian text and vice versa."""
 
-    def __init__(self, language: str = "indonesian", **kwargs):
+    def __init__(self, language: str = "indonesian", shared: bool = None, **kwargs):
         """Initialize emoji converter.
 
         Args:
             language: Language code
+            shared: Simpan mapping emoji sebagai SharedTable memory-mapped yang
+                dipakai bersama semua proses (default: lihat
+                `datasets.shared.shared_dictionaries_enabled`). Regex
+                `text_pattern` tetap dikompilasi per proses.
             **kwargs: Additional arguments
         """
         self.language = language
+        self.shared = shared_dictionaries_enabled() if shared is None else shared
         self.emoji_to_text: Dict[str, str] = {}
         self.text_to_emoji: Dict[str, str] = {}
-        self.emoji_data: List[Dict] = []
+        # None = belum dimuat (mode shared memuatnya saat pertama diakses)
+        self._emoji_data: Optional[List[Dict]] = []
+        self._emoji_matcher: Optional[EmojiMatcher] = None
+        self._text_pattern: Optional[re.Pattern] = None
+        self._build_lock = threading.Lock()
+
+    @property
+    def emoji_data(self) -> List[Dict]:
+        """Baris dataset emoji; dalam mode shared baru dimuat saat diakses."""
+        if self._emoji_data is None:
+            self._emoji_data = DatasetLoader().load_emoji_dataset(
+                language=self.language
+            )
+        return self._emoji_data
+
+    @emoji_data.setter
+    def emoji_data(self, data: List[Dict]) -> None:
+        self._emoji_data = data
+
+    @staticmethod
+    def _build_mappings(dataset: List[Dict]):
+        """Susun (emoji_to_text, text_to_emoji) dari baris dataset."""
+        emoji_to_text = {}
+        text_to_emoji = {}
+        for item in dataset:
+            emoji = item.get("emoji", "")
+            name_id = item.get("name_id", "")
+            alias = item.get("alias", "")
+
+            if emoji and name_id:
+                emoji_to_text[emoji] = name_id
+
+            # Also map alias to emoji for reverse conversion
+            if emoji and alias:
+                text_to_emoji[alias.lower()] = emoji
+
+            # Add name_id to reverse mapping
+            if emoji and name_id:
+                text_to_emoji[name_id.lower()] = emoji
+
+            # Add individual alias words
+            aliases = item.get("aliases", [])
+            if isinstance(aliases, list):
+                for alias_word in aliases:
+                    if alias_word and emoji:
+                        text_to_emoji[alias_word.lower()] = emoji
+        return emoji_to_text, text_to_emoji
 
     def _load_data(self):
         """Load emoji data dari CSV."""
         try:
             loader = DatasetLoader()
-            dataset = loader.load_emoji_dataset(language=self.language)
+            if self.shared:
+                self._load_shared(loader)
+                return
 
+            dataset = loader.load_emoji_dataset(language=self.language)
             self.emoji_data = dataset
+            emoji_to_text, text_to_emoji = self._build_mappings(dataset)
+            self.emoji_to_text.update(emoji_to_text)
+            self.text_to_emoji.update(text_to_emoji)
 
-            # Build emoji to text mapping
-            for item in dataset:
-                emoji = item.get("emoji", "")
-                name_id = item.get("name_id", "")
-                alias = item.get("alias", "")
-
-                if emoji and name_id:
-                    self.emoji_to_text[emoji] = name_id
-
-                # Also map alias to emoji for reverse conversion
-                if emoji and alias:
-                    self.text_to_emoji[alias.lower()] = emoji
-
-                # Add name_id to reverse mapping
-                if emoji and name_id:
-                    self.text_to_emoji[name_id.lower()] = emoji
-
-                # Add individual alias words
-                aliases = item.get("aliases", [])
-                if isinstance(aliases, list):
-                    for alias_word in aliases:
-                        if alias_word and emoji:
-                            self.text_to_emoji[alias_word.lower()] = emoji
+            self._emoji_matcher = EmojiMatcher(self.emoji_to_text)
+            self._text_pattern = None
 
         except Exception as e:
             print(f"Warning: Could not load emoji dataset: {e}")
             self.emoji_data = []
             self.emoji_to_text = {}
             self.text_to_emoji = {}
+            self._emoji_matcher = None
+            self._text_pattern = None
+
+    def _load_shared(self, loader: DatasetLoader) -> None:
+        """Buka kedua mapping sebagai SharedTable (dibangun sekali per mesin)."""
+        digest = loader.dataset_digest("emoji")
+        mappings = []
+
+        def build(position):
+            if not mappings:
+                dataset = loader.load_emoji_dataset(language=self.language)
+                mappings.extend(self._build_mappings(dataset))
+            return mappings[position]
+
+        self.emoji_to_text = shared_table(
+            "emoji-to-text", digest, lambda: build(0), KIND_STR, loader.cache
+        )
+        self.text_to_emoji = shared_table(
+            "text-to-emoji", digest, lambda: build(1), KIND_STR, loader.cache
+        )
+        self._emoji_data = None
+        self._emoji_matcher = EmojiMatcher(self.emoji_to_text, trie=False)
+        self._text_pattern = None
+
+    @classmethod
+    def build_shared_tables(cls) -> None:
+        """Bangun file SharedTable mapping emoji jika belum ada."""
+        cls(shared=True)._load_data()
+
+    @property
+    def emoji_matcher(self) -> EmojiMatcher:
+        """Matcher emoji -> teks; dibangun ulang oleh `_load_data`.
+
+        Jika `emoji_to_text` diubah manual setelah matcher dibuat, set
+        `_emoji_matcher = None` agar matcher dibangun ulang.
+        """
+        matcher = self._emoji_matcher
+        if matcher is None:
+            with self._build_lock:
+                matcher = self._emoji_matcher
+                if matcher is None:
+                    matcher = self._emoji_matcher = EmojiMatcher(
+                        self.emoji_to_text, trie=not self.shared
+                    )
+        return matcher
+
+    @property
+    def text_pattern(self) -> re.Pattern:
+        """Regex tunggal (trie) untuk semua kunci `text_to_emoji`.
+
+        Dikompilasi sekali saat pertama dipakai. Jika `text_to_emoji` diubah
+        manual, set `_text_pattern = None` agar pola dibangun ulang.
+        """
+        pattern = self._text_pattern
+        if pattern is None:
+            with self._build_lock:
+                pattern = self._text_pattern
+                if pattern is None:
+                    body = _trie_regex(self.text_to_emoji)
+                    # (?!x)x tidak pernah match, dipakai saat dictionary kosong
+                    pattern = self._text_pattern = compile_pattern(
+                        r"\b(?:" + (body or "(?!x)x") + r")\b", re.IGNORECASE
+                    )
+        return pattern
+
+    def warm_up(self) -> None:
+        """Bangun matcher emoji dan regex teks sekarang, bukan saat pertama dipakai."""
+        _ = self.emoji_matcher
+        _ = self.text_pattern
 
     def emoji_to_text_convert(self, text: str) -> str:
         """Convert emoji to Indonesian text."""
         if not text:
             return text
 
-        result = text
-        for emoji, indonesia_text in self.emoji_to_text.items():
-            # Replace emoji with Indonesian text
-            result = result.replace(emoji, f" {indonesia_text} ")
+        # Satu kali jalan, emoji terpanjang menang (mis. skin tone / ZWJ)
+        result = self.emoji_matcher.sub(text)
 
         # Clean up extra spaces
-        result = re.sub(r"\s+", " ", result).strip()
+        result = " ".join(result.split())
         return result
 
     def text_to_emoji_convert(self, text: str) -> str:
@@ -87,15 +344,8 @@ class EmojiConverter:
         if not text:
             return text
 
-        result = text
-        # Sort by length (longest first) to avoid partial matches
-        sorted_texts = sorted(
-            self.text_to_emoji.items(), key=lambda x: len(x[0]), reverse=True
+        # Satu regex untuk semua kunci; kunci terpanjang dicoba lebih dulu
+        mapping = self.text_to_emoji
+        return self.text_pattern.sub(
+            lambda match: mapping.get(match.group(0).lower(), match.group(0)), text
         )
-
-        for indonesia_text, emoji in sorted_texts:
-            # Case insensitive replacement
-            pattern = r"\b" + re.escape(indonesia_text) + r"\b"
-            result = re.sub(pattern, emoji, result, flags=re.IGNORECASE)
-
-        return result
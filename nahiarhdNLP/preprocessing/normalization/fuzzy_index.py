@@ -0,0 +1,281 @@
+"""
+Indeks pencarian kata mirip (fuzzy lookup) berbasis symmetric delete (SymSpell).
+"""
+
+import difflib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Union
+
+# Panjang prefix kata yang diindeks secara default
+DEFAULT_PREFIX_LENGTH = 7
+
+
+def _deletes(word: str, max_distance: int) -> set:
+    """Semua string hasil menghapus 0..max_distance karakter dari `word`."""
+    result = {word}
+    frontier = [word]
+    for _ in range(max_distance):
+        next_frontier = []
+        for item in frontier:
+            if len(item) <= 1:
+                continue
+            for i in range(len(item)):
+                deleted = item[:i] + item[i + 1 :]
+                if deleted not in result:
+                    result.add(deleted)
+                    next_frontier.append(deleted)
+        frontier = next_frontier
+    return result
+
+
+def _within_one_edit(source: str, target: str) -> bool:
+    """Cek cepat apakah jarak Damerau-Levenshtein dua kata <= 1."""
+    len_source, len_target = len(source), len(target)
+    if abs(len_source - len_target) > 1:
+        return False
+
+    i = 0
+    limit = min(len_source, len_target)
+    while i < limit and source[i] == target[i]:
+        i += 1
+
+    if len_source == len_target:
+        return source[i + 1 :] == target[i + 1 :] or (
+            i + 1 < len_source
+            and source[i] == target[i + 1]
+            and source[i + 1] == target[i]
+            and source[i + 2 :] == target[i + 2 :]
+        )
+    if len_source > len_target:
+        return source[i + 1 :] == target[i:]
+    return source[i:] == target[i + 1 :]
+
+
+def edit_distance(source: str, target: str, max_distance: int) -> int:
+    """Hitung jarak Damerau-Levenshtein (optimal string alignment).
+
+    Args:
+        source: Kata pertama
+        target: Kata kedua
+        max_distance: Batas jarak; perhitungan berhenti lebih awal jika terlewati
+
+    Returns:
+        Jarak edit, atau max_distance + 1 jika melebihi batas
+    """
+    if source == target:
+        return 0
+
+    len_source, len_target = len(source), len(target)
+    if abs(len_source - len_target) > max_distance:
+        return max_distance + 1
+
+    # Buang prefix & suffix yang sama; DP cukup dijalankan di bagian yang berbeda
+    start = 0
+    limit = min(len_source, len_target)
+    while start < limit and source[start] == target[start]:
+        start += 1
+    while (
+        len_source > start
+        and len_target > start
+        and source[len_source - 1] == target[len_target - 1]
+    ):
+        len_source -= 1
+        len_target -= 1
+    if start or len_source < len(source) or len_target < len(target):
+        # Sisakan satu karakter konteks agar transposisi di batas tetap terdeteksi
+        start = max(start - 1, 0)
+        source = source[start : len_source + 1]
+        target = target[start : len_target + 1]
+        len_source, len_target = len(source), len(target)
+    if not len_source or not len_target:
+        distance = len_source or len_target
+        return distance if distance <= max_distance else max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len_target + 1))
+    for i in range(1, len_source + 1):
+        current = [i] + [0] * len_target
+        source_char = source[i - 1]
+        row_min = i
+        for j in range(1, len_target + 1):
+            cost = 0 if source_char == target[j - 1] else 1
+            value = min(
+                previous[j] + 1,  # hapus
+                current[j - 1] + 1,  # sisip
+                previous[j - 1] + cost,  # ganti
+            )
+            if (
+                previous_previous is not None
+                and j > 1
+                and source_char == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                value = min(value, previous_previous[j - 2] + 1)  # tukar
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    distance = previous[len_target]
+    return distance if distance <= max_distance else max_distance + 1
+
+
+class SymSpellIndex:
+    """Indeks kata untuk mencari kata terdekat dalam batas jarak edit.
+
+    Setiap kata (dipotong ke `prefix_length` karakter) diindeks bersama semua
+    variasi hasil penghapusan hingga `max_distance` karakter. Saat lookup,
+    variasi penghapusan dari kata input dicocokkan ke indeks sehingga hanya
+    segelintir kandidat yang perlu dihitung jarak editnya, bukan seluruh kamus.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        max_distance: int = 2,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+        cache_size: int = 100_000,
+    ):
+        """Bangun indeks.
+
+        Args:
+            words: Daftar kata kamus
+            max_distance: Jarak edit maksimum yang didukung indeks
+            prefix_length: Panjang prefix kata yang diindeks
+            cache_size: Jumlah hasil lookup yang disimpan (LRU; 0 untuk
+                menonaktifkan)
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must be >= 0")
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be greater than max_distance")
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.cache_size = cache_size
+        self.words: List[str] = list(dict.fromkeys(words))
+        self._cache: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+        # delete -> id kata (int) atau list id kata bila lebih dari satu
+        self._deletes: Dict[str, Union[int, List[int]]] = {}
+
+        index = self._deletes
+        for word_id, word in enumerate(self.words):
+            for deleted in _deletes(word[:prefix_length], max_distance):
+                existing = index.get(deleted)
+                if existing is None:
+                    index[deleted] = word_id
+                elif isinstance(existing, int):
+                    index[deleted] = [existing, word_id]
+                else:
+                    existing.append(word_id)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def to_state(self) -> tuple:
+        """Isi indeks dalam tipe bawaan saja (bisa disimpan dengan marshal)."""
+        return (self.max_distance, self.prefix_length, self.words, self._deletes)
+
+    @classmethod
+    def from_state(cls, state: tuple, cache_size: int = 100_000) -> "SymSpellIndex":
+        """Bangun kembali indeks dari hasil `to_state` tanpa menghitung ulang."""
+        max_distance, prefix_length, words, deletes = state
+        index = cls(
+            (),
+            max_distance=max_distance,
+            prefix_length=prefix_length,
+            cache_size=cache_size,
+        )
+        index.words = words
+        index._deletes = deletes
+        return index
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Cari kata kamus terdekat dari `word`.
+
+        Kandidat diurutkan berdasarkan jarak edit terkecil; jika seri, dipilih
+        yang paling mirip menurut `difflib.SequenceMatcher.ratio`. Hasil
+        lookup disimpan di cache sehingga kata yang berulang langsung dijawab.
+
+        Args:
+            word: Kata yang dicari
+            max_distance: Jarak edit maksimum (default: batas indeks)
+
+        Returns:
+            Kata terdekat, atau None jika tidak ada dalam batas jarak
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        if not word:
+            return None
+
+        key = (word, max_distance)
+        cache = self._cache
+        try:
+            result = cache[key]
+            cache.move_to_end(key)
+            return result
+        except KeyError:
+            pass
+
+        result = self._lookup(word, max_distance)
+        if self.cache_size:
+            cache[key] = result
+            # Buang satu entri paling lama dipakai, bukan seluruh cache
+            if len(cache) > self.cache_size:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    pass
+        return result
+
+    def _lookup(self, word: str, max_distance: int) -> Optional[str]:
+        candidate_ids = set()
+        index = self._deletes
+        for deleted in _deletes(word[: self.prefix_length], max_distance):
+            found = index.get(deleted)
+            if found is None:
+                continue
+            if isinstance(found, int):
+                candidate_ids.add(found)
+            else:
+                candidate_ids.update(found)
+
+        words = self.words
+        word_length = len(word)
+        candidates = [
+            words[word_id]
+            for word_id in candidate_ids
+            if abs(len(words[word_id]) - word_length) <= max_distance
+        ]
+        if word in candidates:
+            return word
+
+        # Tahap 1: cek cepat kandidat berjarak 1 tanpa DP
+        best = []
+        if max_distance >= 1:
+            best = [c for c in candidates if _within_one_edit(word, c)]
+
+        # Tahap 2: hitung jarak penuh hanya jika belum ada kandidat berjarak 1
+        if not best and max_distance >= 2:
+            best_distance = max_distance + 1
+            for candidate in candidates:
+                distance = edit_distance(word, candidate, best_distance)
+                if distance < best_distance:
+                    best_distance = distance
+                    best = [candidate]
+                elif distance == best_distance and distance <= max_distance:
+                    best.append(candidate)
+
+        if not best:
+            return None
+        if len(best) == 1:
+            return best[0]
+        return max(
+            sorted(best),
+            key=lambda candidate: difflib.SequenceMatcher(
+                None, word, candidate
+            ).ratio(),
+        )
@@ -2,23 +2,76 @@
 Spell corrector untuk Bahasa Indonesia menggunakan DatasetLoader.
 """
 
-import difflib
+import threading
+from typing import FrozenSet, List, Sequence
 
+from nahiarhdNLP.datasets.cache import DatasetCache, text_digest
 from nahiarhdNLP.datasets.loaders import DatasetLoader
+from nahiarhdNLP.datasets.shared import (
+    KIND_INTS,
+    KIND_SET,
+    KIND_STR,
+    shared_dictionaries_enabled,
+    shared_table,
+)
+
+from .fuzzy_index import DEFAULT_PREFIX_LENGTH, SymSpellIndex
 
 
 class SpellCorrector:
     """Spell correction untuk bahasa Indonesia menggunakan DatasetLoader."""
 
-    def __init__(self):
+    def __init__(self, max_edit_distance: int = 2, shared: bool = None):
+        """Initialize spell corrector.
+
+        Args:
+            max_edit_distance: Jarak edit maksimum saat mencari kata mirip
+            shared: Simpan slang, wordlist, dan indeks kata mirip sebagai
+                SharedTable memory-mapped yang dipakai bersama semua proses
+                (default: lihat `datasets.shared.shared_dictionaries_enabled`)
+        """
+        self.max_edit_distance = max_edit_distance
+        self.shared = shared_dictionaries_enabled() if shared is None else shared
         self.slang_dict = {}
-        self.wordlist = []
+        self._wordlist: Sequence[str] = []
+        self._wordset: FrozenSet[str] = frozenset()
+        # Hash wordlist bawaan jika wordlist berupa SharedTable
+        self._shared_digest = None
+        self._fuzzy_index = None
+        self._index_lock = threading.Lock()
         self._load_data()
 
+    @property
+    def wordlist(self) -> Sequence[str]:
+        """Daftar kata baku (dipertahankan untuk kompatibilitas).
+
+        Pengecekan keanggotaan memakai frozenset internal, jadi ubah daftar
+        ini lewat assignment (bukan `append`) agar set dan indeks ikut diperbarui.
+        Dalam mode biasa berupa `list`; dalam mode shared berupa `KeySequence`
+        read-only di atas SharedTable, jadi pakai `list(...)` jika butuh list
+        yang bisa diubah.
+        """
+        return self._wordlist
+
+    @wordlist.setter
+    def wordlist(self, words: List[str]) -> None:
+        self._wordlist = list(words)
+        self._wordset = frozenset(self._wordlist)
+        self._shared_digest = None
+        self._fuzzy_index = None
+
+    @property
+    def wordset(self) -> FrozenSet[str]:
+        """Kata baku dalam frozenset (SharedTable dalam mode shared)."""
+        return self._wordset
+
     def _load_data(self):
         """Load slang dictionary dan wordlist menggunakan DatasetLoader."""
         try:
             loader = DatasetLoader()
+            if self.shared:
+                self._load_shared(loader)
+                return
 
             # Load slang dictionary
             slang_data = loader.load_slang_dataset()
@@ -33,6 +86,82 @@ class SpellCorrector:
             self.slang_dict = {}
             self.wordlist = []
 
+    def _load_shared(self, loader: DatasetLoader) -> None:
+        """Buka slang & wordlist sebagai SharedTable (dibangun sekali per mesin)."""
+        self.slang_dict = shared_table(
+            "slang-map",
+            loader.dataset_digest("slang"),
+            lambda: {
+                item["slang"]: item["formal"] for item in loader.load_slang_dataset()
+            },
+            KIND_STR,
+            loader.cache,
+        )
+        digest = loader.dataset_digest("wordlist")
+        words = shared_table(
+            "wordlist-set", digest, loader.load_wordlist_dataset, KIND_SET, loader.cache
+        )
+        self._wordlist = words.keys_view()
+        self._wordset = words
+        self._shared_digest = digest
+        self._fuzzy_index = None
+
+    @classmethod
+    def build_shared_tables(cls) -> None:
+        """Bangun file SharedTable (slang, wordlist, indeks) jika belum ada.
+
+        Dipanggil proses utama sebelum worker dibuat, agar worker cukup
+        membuka file yang sudah jadi.
+        """
+        cls(shared=True).warm_up()
+
+    @property
+    def fuzzy_index(self) -> SymSpellIndex:
+        """Indeks kata mirip atas wordlist, dibangun sekali saat pertama dipakai.
+
+        Indeks disimpan di cache dataset (dengan kunci hash wordlist), jadi
+        proses berikutnya cukup memuatnya dari disk. Dalam mode shared, tabel
+        delete indeks berupa SharedTable yang dipakai bersama antarproses.
+        """
+        index = self._fuzzy_index
+        if index is None:
+            # Thread lain menunggu indeks yang sedang dibangun, bukan membangun ulang
+            with self._index_lock:
+                index = self._fuzzy_index
+                if index is None:
+                    index = self._fuzzy_index = self._load_fuzzy_index()
+        return index
+
+    def _load_fuzzy_index(self) -> SymSpellIndex:
+        distance = self.max_edit_distance
+        if self._shared_digest is not None:
+
+            def build_deletes():
+                index = SymSpellIndex(self.wordlist, max_distance=distance)
+                return index.to_state()[3]
+
+            # Id kata di tabel delete merujuk ke urutan wordlist (sudah unik)
+            deletes = shared_table(
+                f"symspell-d{distance}-p{DEFAULT_PREFIX_LENGTH}",
+                self._shared_digest,
+                build_deletes,
+                KIND_INTS,
+            )
+            return SymSpellIndex.from_state(
+                (distance, DEFAULT_PREFIX_LENGTH, self.wordlist, deletes)
+            )
+
+        state = DatasetCache().load_or_build(
+            f"symspell-d{distance}",
+            text_digest(self.wordlist),
+            lambda: SymSpellIndex(self.wordlist, max_distance=distance).to_state(),
+        )
+        return SymSpellIndex.from_state(state)
+
+    def warm_up(self) -> None:
+        """Bangun indeks kata mirip sekarang, bukan saat kata pertama dikoreksi."""
+        _ = self.fuzzy_index
+
     def correct_word(self, word: str) -> str:
         """Koreksi satu kata."""
         if not word or len(word) < 2:
@@ -45,16 +174,14 @@ class SpellCorrector:
             return self.slang_dict[word_lower]
 
         # 2. Cek apakah kata sudah benar di wordlist
-        if word_lower in self.wordlist:
+        if word_lower in self._wordset:
             return word
 
         # 3. Cari kata yang mirip di wordlist
         if self.wordlist:
-            matches = difflib.get_close_matches(
-                word_lower, self.wordlist, n=1, cutoff=0.6
-            )
-            if matches:
-                return matches[0]
+            match = self.fuzzy_index.lookup(word_lower)
+            if match:
+                return match
 
         # 4. Jika tidak ada yang cocok, kembalikan kata asli
         return word
@@ -64,10 +191,17 @@ class SpellCorrector:
         if not sentence:
             return sentence
 
-        words = sentence.split()
+        return " ".join(self.correct_tokens(sentence.split()))
+
+    def correct_tokens(self, tokens: List[str]) -> List[str]:
+        """Koreksi daftar token (hasil `str.split()`).
+
+        Hasil koreksi slang bisa berisi beberapa kata (mis. "anak jakarta"),
+        jadi satu token input bisa menjadi string dengan spasi.
+        """
         corrected_words = []
 
-        for word in words:
+        for word in tokens:
             # Pisahkan tanda baca dari kata
             punctuation = ""
             clean_word = word
@@ -84,4 +218,4 @@ class SpellCorrector:
             else:
                 corrected_words.append(word)
 
-        return " ".join(corrected_words)
+        return corrected_words
@@ -0,0 +1,85 @@
+"""
+Registry pola regex bersama untuk modul-modul preprocessing.
+
+Semua pola dikompilasi sekali saat modul pemiliknya di-import, sehingga
+pemanggilan method tidak lagi bergantung pada cache internal modul `re`.
+
+Engine regex bisa diganti ke library pihak ketiga `regex` dengan environment
+variable `NAHIARHDNLP_REGEX_ENGINE=regex` (dibaca sekali saat import pertama).
+Jika library `regex` tidak terinstall, engine bawaan `re` tetap dipakai.
+
+Modul ini sengaja tidak meng-import `typing` karena ada di jalur import setiap
+pipeline cleaning.
+"""
+
+import os
+import re
+
+ENGINE_ENV_VAR = "NAHIARHDNLP_REGEX_ENGINE"
+
+
+def _load_engine():
+    name = os.environ.get(ENGINE_ENV_VAR, "re").strip().lower()
+    if name == "regex":
+        try:
+            import regex
+
+            return regex
+        except ImportError:
+            print(
+                f"Warning: {ENGINE_ENV_VAR}=regex tetapi library regex belum "
+                "terinstall, memakai re. Install dengan: pip install regex"
+            )
+    elif name != "re":
+        print(f"Warning: Unknown regex engine '{name}', memakai re")
+    return re
+
+
+# Modul engine yang aktif (`re` atau `regex`)
+engine = _load_engine()
+
+# nama -> (pola, flags, pola terkompilasi)
+_registry = {}
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """Kompilasi pola dengan engine aktif tanpa mendaftarkannya.
+
+    Dipakai untuk pola yang dibangun dinamis (mis. dari dataset).
+    """
+    return engine.compile(pattern, flags)
+
+
+def register_pattern(name: str, pattern: str, flags: int = 0):
+    """Kompilasi dan daftarkan pola dengan nama unik.
+
+    Args:
+        name: Nama pola, format `<modul>.<kegunaan>`
+        pattern: Pola regex
+        flags: Flag regex (mis. re.IGNORECASE)
+
+    Returns:
+        Pola terkompilasi
+    """
+    existing = _registry.get(name)
+    if existing is not None:
+        if existing[:2] != (pattern, flags):
+            raise ValueError(f"Pattern '{name}' already registered differently")
+        return existing[2]
+
+    compiled = compile_pattern(pattern, flags)
+    _registry[name] = (pattern, flags, compiled)
+    return compiled
+
+
+def get_pattern(name: str):
+    """Ambil pola terkompilasi berdasarkan nama."""
+    try:
+        return _registry[name][2]
+    except KeyError:
+        raise KeyError(f"Unknown pattern: {name}") from None
+
+
+def registered_patterns() -> dict:
+    """Daftar semua pola terdaftar: nama -> (pola, flags)."""
+    return {name: (pattern, flags) for name, (pattern, flags, _) in _registry.items()}
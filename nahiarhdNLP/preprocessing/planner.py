@@ -0,0 +1,273 @@
+"""
+Fase compile Pipeline: menyusun rencana eksekusi eksplisit dari config.
+
+Urutan step di config dipetakan menjadi daftar tahap (stage): step cleaning
+berurutan difusikan (lihat cleaning.fusion), step level-token berurutan
+dijalankan sebagai token stream (lihat tokenization.token_stream), sisanya
+dijalankan sendiri-sendiri. Sebelum itu planner menerapkan aturan penulisan
+ulang yang hasilnya terbukti identik untuk semua input:
+
+- Perapian spasi (`remove_extra_spaces`, `remove_whitespace`) dibuang jika
+  inputnya pasti sudah rapi, atau jika step berikutnya memecah teks dengan
+  `split()` (stopword, stem, spell_corrector_sentence, tokenizer) sehingga
+  jumlah spasi tidak berpengaruh.
+- Penghapusan tag HTML kedua (`remove_html` / `clean_html`, pola sama) dibuang:
+  setelah pass pertama tidak ada tag tersisa.
+- `remove_lowercase` tepat sebelum `stem` dibuang: stem sudah me-lowercase
+  inputnya dan `str.lower` idempoten.
+- Penghapusan tag HTML dipindah ke depan `emoji_to_text`: emoji maupun teks
+  penggantinya tidak memuat `<`/`>`, jadi keduanya komutatif, dan
+  `emoji_to_text` menerima teks yang lebih pendek.
+
+Memindah filter murah ke depan stemming, spell corrector, atau stopword tidak
+dilakukan: step tersebut bisa menghapus atau mengubah token yang memuat `<`,
+`>`, URL, maupun mention, sehingga urutannya memengaruhi hasil.
+"""
+
+from collections import namedtuple
+
+# Step yang hanya merapikan spasi (setara `" ".join(text.split())`)
+_WHITESPACE_STEPS = frozenset({"remove_extra_spaces", "remove_whitespace"})
+
+# Step non-cleaning yang hasilnya selalu berspasi rapi
+_COLLAPSING_STEPS = frozenset({"emoji_to_text", "stopword"})
+
+# Step dengan pola tag HTML yang sama (`<[^>]+>` diganti spasi)
+_HTML_STEPS = frozenset({"remove_html", "clean_html"})
+
+# Step yang tidak menambah/menghapus `<` atau `>` maupun karakter di antaranya,
+# sehingga teks tanpa tag HTML tetap tanpa tag
+_TAG_SAFE_STEPS = frozenset({"remove_lowercase"}) | _WHITESPACE_STEPS
+
+# Pasangan (a, b) yang hasilnya sama dijalankan sebagai a->b maupun b->a;
+# b (filter murah yang memperpendek teks) dipindah ke depan a
+_COMMUTES = frozenset(
+    {
+        ("emoji_to_text", "remove_html"),
+        ("emoji_to_text", "clean_html"),
+    }
+)
+
+Stage = namedtuple("Stage", ["kind", "steps", "trailing_collapse"], defaults=(True,))
+Stage.__doc__ = """Satu tahap eksekusi.
+
+Attributes:
+    kind: "fused" (FusedCleaner), "tokens" (TokenStream), atau "step"
+    steps: Nama step di tahap ini, sesuai urutan eksekusi
+    trailing_collapse: Untuk tahap "fused": False jika perapian spasi terakhir
+        dilewati karena tahap berikutnya memecah teks dengan `split()`
+"""
+
+
+class ExecutionPlan:
+    """Rencana eksekusi hasil `compile_plan`.
+
+    Attributes:
+        configured: Step aktif sesuai urutan config
+        stages: Tuple Stage yang dijalankan berurutan
+        moved: Tuple (step, sebelum_step, alasan)
+        dropped: Tuple (step, alasan)
+        ignores_spacing: True jika step pertama merapikan spasi atau memecah
+            teks dengan `split()`, sehingga input yang hanya beda spasi pasti
+            menghasilkan output yang sama (dipakai kunci ResultCache)
+    """
+
+    def __init__(self, configured, stages, moved=(), dropped=(), ignores_spacing=False):
+        self.configured = tuple(configured)
+        self.stages = tuple(stages)
+        self.moved = tuple(moved)
+        self.dropped = tuple(dropped)
+        self.ignores_spacing = ignores_spacing
+
+    @property
+    def steps(self) -> tuple:
+        """Step yang benar-benar dijalankan, sesuai urutan eksekusi."""
+        return tuple(step for stage in self.stages for step in stage.steps)
+
+    def explain(self) -> str:
+        """Ringkasan rencana yang bisa dibaca manusia."""
+        lines = [
+            f"Execution plan: {len(self.configured)} configured steps -> "
+            f"{len(self.stages)} stages"
+        ]
+        for number, stage in enumerate(self.stages, 1):
+            line = f"  {number}. {stage.kind:<6} {' + '.join(stage.steps)}"
+            if not stage.trailing_collapse:
+                line += " (final whitespace pass skipped: next stage splits)"
+            lines.append(line)
+        if self.moved:
+            lines.append("Reordered:")
+            lines.extend(
+                f"  - {step} moved before {before}: {reason}"
+                for step, before, reason in self.moved
+            )
+        if self.dropped:
+            lines.append("Dropped:")
+            lines.extend(f"  - {step}: {reason}" for step, reason in self.dropped)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"ExecutionPlan(stages={len(self.stages)}, moved={len(self.moved)}, "
+            f"dropped={len(self.dropped)})"
+        )
+
+
+def _reorder(steps: list, moved: list) -> list:
+    steps = list(steps)
+    for i in range(len(steps)):
+        step = steps[i]
+        j = i
+        while j > 0 and (steps[j - 1], step) in _COMMUTES:
+            j -= 1
+        if j < i:
+            moved.append(
+                (
+                    step,
+                    steps[j],
+                    f"commutes with {', '.join(steps[j:i])} and shrinks its input",
+                )
+            )
+            steps[j + 1 : i + 1] = steps[j:i]
+            steps[j] = step
+    return steps
+
+
+def _drop_before_split(steps: list, token_steps, dropped: list) -> list:
+    """Buang perapian spasi yang hasilnya langsung dipecah `split()`."""
+    kept = []
+    splitter = None
+    for step in reversed(steps):
+        if step in _WHITESPACE_STEPS and splitter is not None:
+            dropped.append((step, f"{splitter} splits on whitespace anyway"))
+            continue
+        splitter = step if step in token_steps else None
+        kept.append(step)
+    kept.reverse()
+    return kept
+
+
+def _drop_redundant(steps: list, fusable, dropped: list) -> list:
+    """Buang step yang tidak mengubah hasil berdasarkan state teks sejauh ini."""
+    ops = None
+    if any(step in fusable for step in steps):
+        from .cleaning.fusion import CLEANING_OPS
+
+        ops = CLEANING_OPS
+
+    kept = []
+    # Step terakhir yang menjamin spasi sudah rapi / tag HTML sudah terhapus
+    collapsed_by = None
+    html_removed_by = None
+    for step in steps:
+        if step in _WHITESPACE_STEPS and collapsed_by is not None:
+            dropped.append((step, f"whitespace already collapsed by {collapsed_by}"))
+            continue
+        if step in _HTML_STEPS and html_removed_by is not None:
+            dropped.append((step, f"HTML tags already removed by {html_removed_by}"))
+            continue
+        if step == "stem" and kept and kept[-1] == "remove_lowercase":
+            # Lowercase menjaga spasi rapi dan aman untuk tag, state tetap sah
+            dropped.append((kept.pop(), "stem lowercases its input"))
+
+        kept.append(step)
+        if step in fusable:
+            op = ops[step]
+            if op.collapse:
+                collapsed_by = step
+            elif not op.keeps_collapsed:
+                collapsed_by = None
+        elif step in _COLLAPSING_STEPS:
+            collapsed_by = step
+        else:
+            collapsed_by = None
+
+        if step in _HTML_STEPS:
+            html_removed_by = step
+        elif step not in _TAG_SAFE_STEPS:
+            html_removed_by = None
+    return kept
+
+
+def _ignores_spacing(steps: list, token_steps) -> bool:
+    """Step pertama menyamakan semua variasi spasi input."""
+    return bool(steps) and (steps[0] in _WHITESPACE_STEPS or steps[0] in token_steps)
+
+
+def _group(steps: list, fusable, token_steps) -> list:
+    """Kelompokkan step menjadi tahap fused / tokens / step."""
+    stages = []
+    run = []
+    run_kind = None
+
+    def flush():
+        if run:
+            kind = run_kind if run_kind == "fused" or len(run) > 1 else "step"
+            stages.append(Stage(kind, tuple(run)))
+            run.clear()
+
+    for step in steps:
+        if step in fusable:
+            kind = "fused"
+        elif step in token_steps:
+            kind = "tokens"
+        else:
+            kind = None
+        if kind != run_kind or kind is None:
+            flush()
+        run_kind = kind
+        if kind is None:
+            stages.append(Stage("step", (step,)))
+            continue
+        run.append(step)
+        # Tokenizer menghasilkan list, jadi selalu menutup rangkaian
+        if kind == "tokens" and token_steps[step]:
+            flush()
+            run_kind = None
+    flush()
+
+    # Perapian spasi terakhir tidak perlu jika tahap berikutnya memecah teks
+    for i, stage in enumerate(stages[:-1]):
+        if stage.kind == "fused" and stages[i + 1].steps[0] in token_steps:
+            stages[i] = stage._replace(trailing_collapse=False)
+    return stages
+
+
+def compile_plan(
+    steps, fusable=frozenset(), token_steps=None, optimize: bool = True
+) -> ExecutionPlan:
+    """Susun rencana eksekusi untuk daftar step.
+
+    Args:
+        steps: Step aktif sesuai urutan config (semua sudah dikenal)
+        fusable: Step cleaning yang bisa difusikan
+        token_steps: {step level-token: True jika hasilnya list token}
+        optimize: False untuk menjalankan setiap step apa adanya, tanpa fusi
+            maupun penulisan ulang (dipakai profiling per step)
+
+    Returns:
+        ExecutionPlan: Rencana eksekusi
+    """
+    configured = list(steps)
+    token_steps = token_steps or {}
+    if not optimize:
+        return ExecutionPlan(
+            configured,
+            [Stage("step", (s,)) for s in configured],
+            ignores_spacing=_ignores_spacing(configured, token_steps),
+        )
+
+    moved, dropped = [], []
+    planned = _reorder(configured, moved)
+    planned = _drop_before_split(planned, token_steps, dropped)
+    planned = _drop_redundant(planned, fusable, dropped)
+    # Step yang baru dibuang bisa membuat perapian spasi lain jadi berlebih
+    planned = _drop_before_split(planned, token_steps, dropped)
+    stages = _group(planned, fusable, token_steps)
+    return ExecutionPlan(
+        configured,
+        stages,
+        moved,
+        dropped,
+        ignores_spacing=_ignores_spacing(planned, token_steps),
+    )
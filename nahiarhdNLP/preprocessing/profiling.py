@@ -0,0 +1,209 @@
+"""
+Instrumentasi opsional per step untuk Pipeline.
+
+Profiling hanya aktif setelah `Pipeline.enable_profiling()`. Saat nonaktif,
+fungsi step tidak dibungkus sama sekali, jadi tidak ada overhead di jalur
+pemrosesan. Saat aktif, setiap pemanggilan step mencatat jumlah panggilan,
+latency per teks (p50/p95/p99), jumlah karakter input/output, dan meneruskan
+`StepEvent` ke hook yang terdaftar.
+"""
+
+import random
+import threading
+from time import perf_counter
+from typing import Callable, List, NamedTuple
+
+# Jumlah sampel latency per step yang disimpan (reservoir sampling)
+DEFAULT_SAMPLE_SIZE = 10_000
+
+
+class StepEvent(NamedTuple):
+    """Satu pemanggilan step, diteruskan ke setiap hook.
+
+    Attributes:
+        step: Nama step (atau gabungan "a+b" untuk step yang difusikan)
+        seconds: Durasi pemanggilan
+        texts: Jumlah teks yang diproses (1 untuk `process`)
+        chars_in: Jumlah karakter input
+        chars_out: Jumlah karakter output (untuk list token: total panjang token)
+    """
+
+    step: str
+    seconds: float
+    texts: int
+    chars_in: int
+    chars_out: int
+
+
+def _count_chars(value) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, list):
+        return sum(map(_count_chars, value))
+    return 0
+
+
+def _percentile(ordered: list, q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _StepStats:
+    __slots__ = ("calls", "texts", "seconds", "chars_in", "chars_out", "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.texts = 0
+        self.seconds = 0.0
+        self.chars_in = 0
+        self.chars_out = 0
+        self.samples = []
+
+
+class PipelineProfiler:
+    """Pengumpul statistik step milik satu Pipeline.
+
+    Example:
+        >>> pipeline.enable_profiling()
+        >>> pipeline.process_batch(texts)
+        >>> pipeline.stats()["steps"]["stopword"]["p95_ms"]
+        0.012
+    """
+
+    def __init__(
+        self,
+        per_step: bool = True,
+        hooks: List[Callable[[StepEvent], None]] = None,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ):
+        """Inisialisasi profiler.
+
+        Args:
+            per_step: True untuk menjalankan & mengukur setiap step sendiri
+                (fusi cleaning dan token stream dimatikan; hasil tetap sama).
+                False untuk mengukur tahap eksekusi apa adanya.
+            hooks: Callback `hook(event: StepEvent)` untuk setiap pemanggilan
+            sample_size: Jumlah sampel latency per step untuk persentil
+        """
+        if sample_size < 1:
+            raise ValueError("sample_size must be >= 1")
+        self.per_step = per_step
+        self.hooks = list(hooks or [])
+        self.sample_size = sample_size
+        self._steps = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+
+    def add_hook(self, hook: Callable[[StepEvent], None]) -> None:
+        """Daftarkan callback yang dipanggil untuk setiap `StepEvent`."""
+        self.hooks.append(hook)
+
+    def record(self, event: StepEvent) -> None:
+        """Catat satu pemanggilan step lalu teruskan ke hook."""
+        # Latency per teks; untuk batch = durasi batch / jumlah teks
+        latency = event.seconds / event.texts if event.texts else event.seconds
+        with self._lock:
+            stats = self._steps.get(event.step)
+            if stats is None:
+                stats = self._steps[event.step] = _StepStats()
+            stats.calls += 1
+            stats.texts += event.texts
+            stats.seconds += event.seconds
+            stats.chars_in += event.chars_in
+            stats.chars_out += event.chars_out
+            samples = stats.samples
+            if len(samples) < self.sample_size:
+                samples.append(latency)
+            else:
+                index = self._random.randrange(stats.calls)
+                if index < self.sample_size:
+                    samples[index] = latency
+        for hook in self.hooks:
+            hook(event)
+
+    def wrap(self, name: str, func: Callable, batch: bool = False) -> Callable:
+        """Bungkus fungsi step (satu teks atau batch) agar tercatat."""
+        record = self.record
+
+        if batch:
+
+            def profiled_batch(texts):
+                start = perf_counter()
+                result = func(texts)
+                seconds = perf_counter() - start
+                record(
+                    StepEvent(
+                        name,
+                        seconds,
+                        len(texts),
+                        _count_chars(texts),
+                        _count_chars(result),
+                    )
+                )
+                return result
+
+            return profiled_batch
+
+        def profiled(text):
+            start = perf_counter()
+            result = func(text)
+            seconds = perf_counter() - start
+            record(
+                StepEvent(name, seconds, 1, _count_chars(text), _count_chars(result))
+            )
+            return result
+
+        return profiled
+
+    def reset(self) -> None:
+        """Hapus semua statistik step."""
+        with self._lock:
+            self._steps.clear()
+
+    def step_stats(self) -> dict:
+        """Statistik per step, urut sesuai pemanggilan pertama.
+
+        Returns:
+            dict: step -> {calls, texts, total_s, mean_ms, p50_ms, p95_ms,
+            p99_ms, chars_in, chars_out}; latency dihitung per teks
+        """
+        with self._lock:
+            items = [
+                (name, stats, sorted(stats.samples))
+                for name, stats in self._steps.items()
+            ]
+
+        result = {}
+        for name, stats, ordered in items:
+            result[name] = {
+                "calls": stats.calls,
+                "texts": stats.texts,
+                "total_s": stats.seconds,
+                "mean_ms": stats.seconds / stats.texts * 1e3 if stats.texts else 0.0,
+                "p50_ms": _percentile(ordered, 0.50) * 1e3,
+                "p95_ms": _percentile(ordered, 0.95) * 1e3,
+                "p99_ms": _percentile(ordered, 0.99) * 1e3,
+                "chars_in": stats.chars_in,
+                "chars_out": stats.chars_out,
+            }
+        return result
+
+
+def to_folded(stats: dict, root: str = "pipeline") -> str:
+    """Ubah hasil `Pipeline.stats()` ke format "folded stacks" flamegraph.
+
+    Satu baris per frame: `pipeline;step mikrodetik`, bisa dibuka dengan
+    flamegraph.pl, speedscope, atau inferno. Waktu load resource ditulis di
+    bawah frame `load`.
+    """
+    lines = []
+    for name, step in stats.get("steps", {}).items():
+        micros = round(step["total_s"] * 1e6)
+        if micros:
+            lines.append(f"{root};{name} {micros}")
+    for name, seconds in stats.get("resources", {}).items():
+        micros = round(seconds * 1e6)
+        if micros:
+            lines.append(f"{root};load;{name} {micros}")
+    return "\n".join(lines) + "\n" if lines else ""
@@ -0,0 +1,268 @@
+"""
+Cache hasil Pipeline per teks (content-addressed), opsional.
+
+Feed media sosial penuh retweet dan spam copy-paste, jadi banyak dokumen dalam
+satu batch identik. `ResultCache` menyimpan hasil per kunci BLAKE2b dari input
+(dinormalisasi jika aman) yang di-key dengan fingerprint config, sehingga teks
+yang sama cukup diproses sekali. Batch dideduplikasi dulu sebelum diproses lalu
+hasilnya disebar kembali ke semua posisi. Entri dibuang secara LRU, setelah TTL
+habis, atau jika perkiraan memori melewati batas.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+DEFAULT_MAXSIZE = 100_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Perkiraan overhead per entri: node OrderedDict, tuple entri, dan kunci 16 byte
+_ENTRY_OVERHEAD = 200
+# Perkiraan header objek str (`sys.getsizeof("")`)
+_STR_OVERHEAD = 49
+
+_MISSING = object()
+
+
+def config_fingerprint(steps) -> bytes:
+    """Fingerprint 16 byte dari step aktif sesuai urutan eksekusi di config."""
+    return hashlib.blake2b(
+        "\0".join(steps).encode("utf-8"), digest_size=16, person=b"nahiarhdNLP"
+    ).digest()
+
+
+def text_key(text: str, fingerprint: bytes, collapse: bool = False) -> bytes:
+    """Kunci cache: BLAKE2b teks input yang di-key dengan fingerprint config.
+
+    Args:
+        text: Teks input
+        fingerprint: Hasil `config_fingerprint`
+        collapse: True jika spasi input tidak memengaruhi hasil, sehingga teks
+            yang hanya beda spasi memakai kunci yang sama
+    """
+    if collapse:
+        text = " ".join(text.split())
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16, key=fingerprint
+    ).digest()
+
+
+def _copy(value):
+    # Hasil tokenizer berupa list: setiap pemanggil menerima salinan sendiri
+    return list(value) if isinstance(value, list) else value
+
+
+def _size_of(value) -> int:
+    """Perkiraan memori satu entri (teks dihitung 1 byte per karakter)."""
+    if isinstance(value, str):
+        return _ENTRY_OVERHEAD + _STR_OVERHEAD + len(value)
+    if isinstance(value, list):
+        return (
+            _ENTRY_OVERHEAD
+            + sys.getsizeof(value)
+            + sum(_STR_OVERHEAD + len(item) for item in value)
+        )
+    return _ENTRY_OVERHEAD + sys.getsizeof(value)
+
+
+class CachedBatch:
+    """Hasil lookup satu batch: hasil yang sudah ada + teks unik yang belum.
+
+    Example:
+        >>> batch = cache.lookup(texts, key)
+        >>> if batch.missing:
+        ...     batch.fill(process_batch(batch.missing))
+        >>> batch.results
+    """
+
+    def __init__(self, cache, results: list, pending: dict, missing: list):
+        self.cache = cache
+        self.results = results
+        # kunci -> posisi di `results` yang menunggu hasil teks tersebut
+        self._pending = pending
+        self.missing = missing
+
+    def fill(self, values) -> list:
+        """Simpan hasil untuk `missing` (urutan sama) dan sebar ke semua posisi."""
+        results = self.results
+        cache = self.cache
+        for (key, positions), value in zip(self._pending.items(), values):
+            cache.set(key, value)
+            results[positions[0]] = value
+            for position in positions[1:]:
+                results[position] = _copy(value)
+        return results
+
+
+class ResultCache:
+    """LRU cache kunci teks -> hasil Pipeline, aman dipakai banyak thread.
+
+    Satu instance boleh dipakai bersama beberapa Pipeline: kunci sudah memuat
+    fingerprint config masing-masing.
+
+    Example:
+        >>> cache = ResultCache(maxsize=10_000, ttl=3600)
+        >>> cache.set(b"k", "hasil")
+        >>> cache.get(b"k")
+        'hasil'
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = None,
+    ):
+        """Inisialisasi cache.
+
+        Args:
+            maxsize: Jumlah entri maksimum (0 untuk menonaktifkan penyimpanan;
+                deduplikasi dalam batch tetap berjalan)
+            max_bytes: Batas perkiraan memori hasil yang disimpan (byte)
+            ttl: Umur entri dalam detik (None: tidak kedaluwarsa)
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0 or None")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self.evictions = 0
+        self.expired = 0
+        self.bytes = 0
+        # kunci -> (hasil, perkiraan ukuran, waktu kedaluwarsa atau None)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._data
+
+    def get(self, key: bytes, default=None):
+        """Ambil hasil untuk kunci; `default` jika tidak ada atau kedaluwarsa."""
+        with self._lock:
+            value = self._get(key, monotonic() if self.ttl is not None else None)
+        return default if value is _MISSING else _copy(value)
+
+    def _get(self, key: bytes, now):
+        # Dipanggil dengan _lock terkunci; `now` None jika tanpa TTL
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+        value, size, expires = entry
+        if now is not None and now >= expires:
+            del self._data[key]
+            self.bytes -= size
+            self.expired += 1
+            self.misses += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: bytes, value) -> None:
+        """Simpan hasil, membuang entri paling lama jika melewati batas."""
+        if not self.maxsize:
+            return
+        size = _size_of(value)
+        if size > self.max_bytes:
+            return
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            data = self._data
+            old = data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            data[key] = (_copy(value), size, expires)
+            self.bytes += size
+            while len(data) > self.maxsize or self.bytes > self.max_bytes:
+                _, (_, evicted, _) = data.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def lookup(self, texts, key) -> CachedBatch:
+        """Cari hasil untuk satu batch dan deduplikasi teks yang belum ada.
+
+        Teks kosong/None dikembalikan apa adanya, sama seperti
+        `Pipeline.process`.
+
+        Args:
+            texts: Iterable berisi teks input
+            key: Fungsi teks -> kunci cache
+
+        Returns:
+            CachedBatch: `results` (posisi yang belum ada hasilnya masih
+            berisi teks input) dan `missing` (teks unik yang perlu diproses)
+        """
+        results = list(texts)
+        keys = [(position, key(text)) for position, text in enumerate(results) if text]
+        pending = {}
+        missing = []
+        duplicates = 0
+        now = monotonic() if self.ttl is not None else None
+        # Satu kali kunci untuk seluruh batch
+        with self._lock:
+            for position, text_id in keys:
+                positions = pending.get(text_id)
+                if positions is not None:
+                    positions.append(position)
+                    duplicates += 1
+                    continue
+                value = self._get(text_id, now)
+                if value is _MISSING:
+                    pending[text_id] = [position]
+                    missing.append(results[position])
+                else:
+                    results[position] = _copy(value)
+            self.deduplicated += duplicates
+        return CachedBatch(self, results, pending, missing)
+
+    def clear(self) -> None:
+        """Kosongkan cache dan reset statistik."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.deduplicated = 0
+            self.evictions = self.expired = 0
+
+    def stats(self) -> dict:
+        """Statistik cache.
+
+        Returns:
+            dict: size, maxsize, bytes, max_bytes, ttl, hits, misses,
+            deduplicated (duplikat dalam batch yang tidak diproses ulang),
+            evictions, expired, hit_rate (hits / lookup), dan saved_rate
+            (teks yang tidak perlu diproses / semua teks)
+        """
+        with self._lock:
+            hits, misses, deduplicated = self.hits, self.misses, self.deduplicated
+            stats = {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": hits,
+                "misses": misses,
+                "deduplicated": deduplicated,
+                "evictions": self.evictions,
+                "expired": self.expired,
+            }
+        lookups = hits + misses
+        total = lookups + deduplicated
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        stats["saved_rate"] = (hits + deduplicated) / total if total else 0.0
+        return stats
@@ -0,0 +1,90 @@
+"""
+Eksekusi step level-token atas satu daftar token bersama.
+
+Step seperti stopword, spell corrector, stemming, dan tokenizer masing-masing
+memecah teks dengan `split()`, memprosesnya, lalu menyatukan lagi dengan
+`" ".join`. Jika beberapa step tersebut berurutan, `TokenStream` cukup memecah
+teks sekali dan meneruskan daftar token antar step; string baru dibentuk sekali
+di akhir.
+"""
+
+from typing import Callable, List, NamedTuple, Sequence
+
+
+class TokenOp(NamedTuple):
+    """Satu step level-token.
+
+    Attributes:
+        getter: Fungsi tanpa argumen yang mengembalikan instance step (lazy)
+        method: Method kelas `method(instance, tokens) -> pieces`
+        clean: True jika setiap hasil dijamin satu token tanpa spasi dan tidak
+            kosong, sehingga bisa langsung diteruskan ke step berikutnya
+        returns_tokens: True jika hasil akhirnya list token (tokenizer), bukan
+            string hasil join
+    """
+
+    getter: Callable[[], object]
+    method: Callable
+    clean: bool = True
+    returns_tokens: bool = False
+
+
+def _flatten(pieces: List[str]) -> List[str]:
+    """Setara `" ".join(pieces).split()` tanpa membuat string gabungan."""
+    tokens = []
+    for piece in pieces:
+        tokens.extend(piece.split())
+    return tokens
+
+
+class TokenStream:
+    """Gabungan beberapa step level-token yang berurutan.
+
+    Hasilnya identik dengan menjalankan method string aslinya satu per satu:
+    setiap method string setara dengan `" ".join(method_tokens(text.split()))`.
+
+    Example:
+        >>> stream = TokenStream(["stopword", "stem"], [stopword_op, stem_op])
+        >>> stream("Saya sedang memakan nasi")
+        'makan nasi'
+    """
+
+    def __init__(self, steps: Sequence[str], ops: Sequence[TokenOp]):
+        """Susun rangkaian step.
+
+        Args:
+            steps: Nama step sesuai urutan config
+            ops: TokenOp untuk setiap step; hanya step terakhir yang boleh
+                mengembalikan list token
+        """
+        if len(steps) != len(ops):
+            raise ValueError("steps and ops must have the same length")
+        if any(op.returns_tokens for op in ops[:-1]):
+            raise ValueError("Only the last step may return tokens")
+        self.steps = tuple(steps)
+        self.ops = tuple(ops)
+        self.returns_tokens = bool(ops) and ops[-1].returns_tokens
+
+    def __call__(self, text: str):
+        return self._run([op.getter() for op in self.ops], text)
+
+    def process_batch(self, texts: List[str]) -> list:
+        """Jalankan rangkaian atas seluruh batch; instance di-resolve sekali."""
+        instances = [op.getter() for op in self.ops]
+        run = self._run
+        return [run(instances, text) for text in texts]
+
+    def _run(self, instances: list, text: str):
+        tokens = text.split()
+        clean = True
+        for op, instance in zip(self.ops, instances):
+            if not clean:
+                tokens = _flatten(tokens)
+            tokens = op.method(instance, tokens)
+            clean = op.clean
+        if self.returns_tokens:
+            return tokens
+        return " ".join(tokens)
+
+    def __repr__(self) -> str:
+        return f"TokenStream(steps={list(self.steps)})"
@@ -1,10 +1,212 @@
 """
 Tokenizer for Indonesian text.
+
+Token dipindai dalam satu kali jalan regex (`TOKEN_PATTERN.finditer`) dan
+dibedakan jenisnya: url, email, mention, hashtag, placeholder (`<link>`,
+dll.), angka, kata, emoji, dan tanda baca. Tidak ada pola yang melewati spasi,
+sehingga memindai teks utuh sama dengan memindai setiap hasil `split()` satu
+per satu.
 """
 
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple
+
+from ..patterns import register_pattern
+
+# Jenis token sesuai urutan grup di TOKEN_PATTERN (kode = indeks di tuple ini)
+TOKEN_KINDS = (
+    "url",
+    "email",
+    "mention",
+    "hashtag",
+    "placeholder",
+    "number",
+    "word",
+    "emoji",
+    "punct",
+)
+
+_EMOJI = (
+    r"[\U0001F300-\U0001F5FF\U0001F600-\U0001F64F\U0001F680-\U0001F6FF"
+    r"\U0001F700-\U0001FAFF\u2600-\u27BF]"
+)
+
+# Urutan alternatif penting: url/email/mention/hashtag/placeholder sebelum kata
+# dan tanda baca. Setiap jenis token satu grup capturing (isinya hanya grup
+# non-capturing), sehingga `lastindex - 1` langsung menjadi kode jenis token.
+TOKEN_PATTERN = register_pattern(
+    "tokenizer.token",
+    # url: tanda baca di akhir (titik, koma, kurung tutup) tidak ikut
+    r"((?:https?://|www\.)\S+?(?=[.,!?;:'\")\]]*(?:\s|$)))"
+    r"|([\w.%+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,})"
+    r"|(@\w+)"
+    r"|(#\w+)"
+    # placeholder hasil replace_email, replace_link, dan replace_user
+    r"|(<(?:email|link|user)>)"
+    # angka: 12, 3,5, 10.000, 12:30 (bukan awalan kata seperti 19an)
+    r"|(\d+(?:[.,:]\d+)*(?!\w))"
+    # kata termasuk kata ulang dan apostrof: anak-anak, Jum'at
+    r"|(\w+(?:[-'\u2019]\w+)*)"
+    # emoji termasuk skin tone, variation selector, dan rangkaian ZWJ
+    rf"|((?:[\U0001F1E6-\U0001F1FF]{{2}}|{_EMOJI})"
+    rf"(?:[\U0001F3FB-\U0001F3FF\uFE0F]|\u200D{_EMOJI})*)"
+    r"|([^\w\s])",
+)
+
+
+class Token(NamedTuple):
+    """Satu token beserta posisinya di teks asli (`text[start:end]`)."""
+
+    text: str
+    start: int
+    end: int
+    kind: str
+
+
+class TokenBatch:
+    """Hasil tokenisasi banyak teks dalam bentuk array, bukan list tuple.
+
+    Semua teks digabung menjadi satu `buffer` (dipisah newline) dan token
+    disimpan sebagai offset awal/akhir di buffer (`array`) plus kode jenis
+    satu byte per token. String token baru dibuat saat diakses.
+
+    Example:
+        >>> batch = Tokenizer().tokenize_batch(["Halo, dunia!", "@budi 2024"])
+        >>> batch[0]
+        ['Halo', ',', 'dunia', '!']
+        >>> batch.spans(1)
+        [(0, 5), (6, 10)]
+        >>> batch.kinds(1)
+        ['mention', 'number']
+    """
+
+    __slots__ = ("buffer", "starts", "ends", "kind_codes", "text_offsets", "bounds")
+
+    def __init__(self, texts: Iterable[str]):
+        """Pindai seluruh teks sekaligus.
+
+        Args:
+            texts: Teks yang akan ditokenisasi (None dianggap teks kosong)
+        """
+        texts = [text or "" for text in texts]
+        self.buffer = buffer = "\n".join(texts)
+        code = "I" if len(buffer) <= 0xFFFFFFFF else "Q"
+        self.starts = starts = array(code)
+        self.ends = ends = array(code)
+        self.kind_codes = kinds = bytearray()
+        add_start, add_end, add_kind = starts.append, ends.append, kinds.append
+        for match in TOKEN_PATTERN.finditer(buffer):
+            start, end = match.span()
+            add_start(start)
+            add_end(end)
+            add_kind(match.lastindex - 1)
+
+        # text_offsets[i]: posisi awal teks ke-i di buffer
+        # bounds[i]..bounds[i + 1]: indeks token milik teks ke-i
+        self.text_offsets = offsets = array(code, [0])
+        for text in texts:
+            offsets.append(offsets[-1] + len(text) + 1)
+        self.bounds = array(code, [bisect_left(starts, pos) for pos in offsets])
+        self.bounds[-1] = len(starts)
+
+    def __len__(self) -> int:
+        return len(self.text_offsets) - 1
+
+    def __getitem__(self, index: int) -> List[str]:
+        return self.tokens(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.tokens(index)
+
+    @property
+    def num_tokens(self) -> int:
+        """Jumlah token di seluruh batch."""
+        return len(self.starts)
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran array offset dan kode jenis (tanpa buffer teks)."""
+        arrays = (self.starts, self.ends, self.text_offsets, self.bounds)
+        return sum(a.itemsize * len(a) for a in arrays) + len(self.kind_codes)
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TokenBatch index out of range")
+        return index
+
+    def _range(self, index: int) -> range:
+        return range(self.bounds[index], self.bounds[index + 1])
+
+    def text(self, index: int) -> str:
+        """Teks asli ke-`index`."""
+        index = self._index(index)
+        offsets = self.text_offsets
+        return self.buffer[offsets[index] : offsets[index + 1] - 1]
+
+    def tokens(self, index: int) -> List[str]:
+        """Token teks ke-`index`."""
+        buffer, starts, ends = self.buffer, self.starts, self.ends
+        return [buffer[starts[i] : ends[i]] for i in self._range(self._index(index))]
+
+    def spans(self, index: int) -> List[tuple]:
+        """Pasangan (awal, akhir) token teks ke-`index`, relatif ke teks itu."""
+        index = self._index(index)
+        base = self.text_offsets[index]
+        starts, ends = self.starts, self.ends
+        return [(starts[i] - base, ends[i] - base) for i in self._range(index)]
+
+    def kinds(self, index: int) -> List[str]:
+        """Jenis token teks ke-`index` (lihat TOKEN_KINDS)."""
+        codes = self.kind_codes
+        return [TOKEN_KINDS[codes[i]] for i in self._range(self._index(index))]
+
+    def to_lists(self) -> List[List[str]]:
+        """Token semua teks sebagai list of list (seperti `tokenize` per teks)."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"TokenBatch(texts={len(self)}, tokens={self.num_tokens})"
+
 
 class Tokenizer:
-    """Memecah kalimat menjadi token (berdasarkan spasi)."""
+    """Memecah kalimat menjadi token kata, angka, tanda baca, emoji, URL, dll."""
 
     def tokenize(self, text: str) -> list:
-        return text.split() if text else []
+        """Token teks dalam urutan kemunculan."""
+        if not text:
+            return []
+        return [match.group() for match in TOKEN_PATTERN.finditer(text)]
+
+    def tokenize_tokens(self, tokens: list) -> list:
+        """Versi token-stream: setara `tokenize(" ".join(tokens))`."""
+        finditer = TOKEN_PATTERN.finditer
+        result = []
+        for token in tokens:
+            # Token berisi huruf saja selalu satu token kata
+            if token.isalpha():
+                result.append(token)
+            else:
+                result.extend(match.group() for match in finditer(token))
+        return result
+
+    def tokenize_with_offsets(self, text: str) -> List[Token]:
+        """Token beserta offset karakter dan jenisnya."""
+        if not text:
+            return []
+        return [
+            Token(
+                match.group(),
+                match.start(),
+                match.end(),
+                TOKEN_KINDS[match.lastindex - 1],
+            )
+            for match in TOKEN_PATTERN.finditer(text)
+        ]
+
+    def tokenize_batch(self, texts: Iterable[str]) -> TokenBatch:
+        """Tokenisasi banyak teks sekaligus ke TokenBatch berbasis array."""
+        return TokenBatch(texts)
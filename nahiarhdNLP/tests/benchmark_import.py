@@ -0,0 +1,129 @@
+"""
+Import-time benchmark for nahiarhdNLP.
+
+Runs each scenario under `python -X importtime` in fresh interpreters,
+reports the total and the slowest modules, and fails if a scenario imports a
+module it should not need (e.g. pandas, or Sastrawi for a cleaning-only
+pipeline). The import-time budget itself is checked by tests/test_import.py.
+
+Run with:
+
+        python -m nahiarhdNLP.tests.benchmark_import [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+# name -> (statement, modules that must not be imported)
+SCENARIOS = {
+    "import nahiarhdNLP": (
+        "import nahiarhdNLP",
+        ["pandas", "numpy", "Sastrawi", "nahiarhdNLP.preprocessing"],
+    ),
+    "cleaning pipeline": (
+        "from nahiarhdNLP.preprocessing import Pipeline\n"
+        "Pipeline({'remove_urls': True, 'remove_mentions': True})"
+        ".process('halo @budi https://example.com')",
+        [
+            "pandas",
+            "numpy",
+            "Sastrawi",
+            "nahiarhdNLP.datasets",
+            "concurrent",
+            "asyncio",
+        ],
+    ),
+}
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def measure_import(statement: str = "import nahiarhdNLP") -> dict:
+    """Run one fresh interpreter and return {module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def check_forbidden_modules(timings: dict, forbidden: list):
+    """Fail if any forbidden module (or its submodules) was imported."""
+    imported = sorted(
+        name
+        for name in timings
+        if any(name == module or name.startswith(module + ".") for module in forbidden)
+    )
+    assert not imported, f"unexpected modules imported: {imported[:5]}"
+
+
+def bench_scenario(name: str, runs: int, top: int):
+    """Time one scenario and check which modules it imports."""
+    print_header(f"⏱️ {name.upper()}")
+
+    statement, forbidden = SCENARIOS[name]
+    # Modul yang sudah di-import interpreter kosong tidak ikut dihitung
+    baseline = set(measure_import("pass"))
+    all_timings = [measure_import(statement) for _ in range(runs)]
+    for timings in all_timings:
+        check_forbidden_modules(timings, forbidden)
+    console.print(f"[green]Not imported: {', '.join(forbidden)}[/green]")
+
+    # Median self time per module across runs
+    modules = [module for module in all_timings[-1] if module not in baseline]
+    self_times = {
+        module: statistics.median(t[module][0] for t in all_timings if module in t)
+        for module in modules
+    }
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Module", style="cyan")
+    table.add_column("Self ms", justify="right")
+    for module, self_us in sorted(self_times.items(), key=lambda x: -x[1])[:top]:
+        table.add_row(module, f"{self_us / 1e3:.1f}")
+    console.print(table)
+
+    totals = [
+        sum(self_us for module, (self_us, _) in t.items() if module not in baseline)
+        for t in all_timings
+    ]
+    median_ms = statistics.median(totals) / 1e3
+    console.print(
+        f"[cyan]Total import time:[/cyan] median {median_ms:.1f} ms over {runs} "
+        f"runs ({len(modules)} modules)"
+    )
+
+
+def main(argv=None):
+    """Run all import scenarios."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    for name in SCENARIOS:
+        bench_scenario(name, args.runs, args.top)
+
+
+if __name__ == "__main__":
+    main()
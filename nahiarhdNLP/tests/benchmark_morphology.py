@@ -0,0 +1,156 @@
+"""
+Speed benchmark for the kamus-based MorphologicalAnalyzer.
+
+Analyzes synthetic corpus sentences and compares the time per sentence with
+Sastrawi stemming of the same tokens:
+
+1. Compile time of the kamus.txt affix rules (done once per analyzer).
+2. Cold time per sentence (empty cache, every token analyzed).
+3. Warm time per sentence with the per-token cache, via `analyze_batch`.
+4. Sastrawi time per sentence on a small sample (it is much slower).
+5. Accuracy: analyzer roots vs Sastrawi roots on corpus tokens plus affixed
+   KBBI roots. Sastrawi roots come from the native DictionaryStemmer with
+   Sastrawi's dictionary, which matches Sastrawi on every token (see
+   benchmark_stemmer_engines) and is fast enough for thousands of tokens.
+
+Run with:
+
+        python -m nahiarhdNLP.tests.benchmark_morphology [--sentences 5000]
+"""
+
+import argparse
+import random
+import time
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from nahiarhdNLP.benchmarks import CorpusGenerator
+from nahiarhdNLP.preprocessing.linguistic.dictionary_stemmer import DictionaryStemmer
+from nahiarhdNLP.preprocessing.linguistic.morphology import MorphologicalAnalyzer
+from nahiarhdNLP.preprocessing.linguistic.stemmer import NON_WORD_PATTERN, Stemmer
+from nahiarhdNLP.tests.benchmark_stemmer_engines import build_tokens
+
+console = Console()
+
+SASTRAWI_SENTENCES = 20
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def build_sentences(count: int, seed: int = 7) -> list:
+    """`count` corpus sentences as lowercase token lists."""
+    texts = CorpusGenerator(seed=seed).generate(count)
+    return [NON_WORD_PATTERN.sub(" ", text.lower()).split() for text in texts]
+
+
+def validate(analyzer: MorphologicalAnalyzer, tokens: list):
+    """Compare analyzer roots with Sastrawi roots and print the results."""
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+    sastrawi = DictionaryStemmer(StemmerFactory().get_words())
+    rows = [
+        (token, sastrawi.stem_word(token), analyzer.analyze(token)) for token in tokens
+    ]
+    # Hanya token yang kata dasarnya menurut Sastrawi juga ada di kamus.txt
+    comparable = [row for row in rows if row[1] in analyzer.roots]
+    agree = sum(expected == analysis.root for _, expected, analysis in rows)
+    agree_comparable = sum(
+        expected == analysis.root for _, expected, analysis in comparable
+    )
+
+    print_header("✅ ROOTS vs SASTRAWI")
+    table = Table(box=box.ROUNDED)
+    table.add_column("Tokens", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Same root", justify="right", style="green")
+    table.add_row("all", f"{len(rows):,}", f"{agree / len(rows):.1%}")
+    table.add_row(
+        "Sastrawi root in kamus.txt",
+        f"{len(comparable):,}",
+        f"{agree_comparable / len(comparable):.1%}",
+    )
+    console.print(table)
+
+    differences = [row for row in comparable if row[1] != row[2].root]
+    if differences:
+        print_header("🔍 SAMPLE DIFFERENCES (root in kamus.txt)")
+        sample = Table(box=box.ROUNDED)
+        sample.add_column("Token", style="cyan")
+        sample.add_column("Sastrawi")
+        sample.add_column("Analyzer")
+        sample.add_column("Affixes", style="dim")
+        for token, expected, analysis in random.Random(1).sample(
+            differences, min(15, len(differences))
+        ):
+            affixes = analysis.prefixes + (analysis.infix or "",) + analysis.suffixes
+            sample.add_row(
+                token, expected, analysis.root, " ".join(filter(None, affixes))
+            )
+        console.print(sample)
+
+
+def main(argv=None):
+    """Benchmark MorphologicalAnalyzer against Sastrawi per sentence."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sentences", type=int, default=5000)
+    parser.add_argument("--tokens", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    sentences = build_sentences(args.sentences)
+    tokens = sum(map(len, sentences))
+
+    print_header("🔬 MORPHOLOGICAL ANALYZER")
+    start = time.perf_counter()
+    analyzer = MorphologicalAnalyzer()
+    compile_ms = (time.perf_counter() - start) * 1e3
+
+    uncached = MorphologicalAnalyzer(cache_size=0)
+    start = time.perf_counter()
+    results = [[uncached._analyze(token) for token in s] for s in sentences]
+    cold_us = (time.perf_counter() - start) / len(sentences) * 1e6
+
+    analyzer.analyze_batch(sentences)
+    start = time.perf_counter()
+    analyzer.analyze_batch(sentences)
+    warm_us = (time.perf_counter() - start) / len(sentences) * 1e6
+
+    sample = sentences[:SASTRAWI_SENTENCES]
+    sastrawi = Stemmer(cache_size=0, engine="sastrawi")
+    start = time.perf_counter()
+    for sentence in sample:
+        sastrawi.stem(" ".join(sentence))
+    sastrawi_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+    known = sum(a.known for sentence in results for a in sentence)
+    affixed = sum(bool(a.prefixes or a.suffixes or a.infix) for s in results for a in s)
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("µs/sentence", justify="right")
+    table.add_column("vs Sastrawi", justify="right", style="green")
+    rows = [
+        ("Sastrawi stem (no cache)", sastrawi_us),
+        ("Analyzer, cold (no cache)", cold_us),
+        ("Analyzer, warm (token cache)", warm_us),
+    ]
+    for mode, us in rows:
+        table.add_row(mode, f"{us:,.1f}", f"{sastrawi_us / us:,.1f}x")
+    console.print(table)
+    console.print(
+        f"[green]{len(sentences):,} sentences, {tokens:,} tokens; "
+        f"rules compiled in {compile_ms:.0f} ms; {known / tokens:.1%} tokens "
+        f"known, {affixed / tokens:.1%} affixed[/green]"
+    )
+    console.print(f"Cache: {analyzer.cache_stats()}")
+
+    validate(uncached, build_tokens(args.tokens))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,644 @@
+"""
+Benchmark script for nahiarhdNLP Pipeline throughput.
+
+Run with:
+
+        python -m nahiarhdNLP.tests.benchmark_pipeline
+"""
+
+import asyncio
+import difflib
+import os
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from nahiarhdNLP.datasets import DatasetCache, DatasetLoader
+from nahiarhdNLP.preprocessing import Pipeline, patterns
+from nahiarhdNLP.preprocessing.cleaning.fusion import CLEANING_OPS, FusedCleaner
+from nahiarhdNLP.preprocessing.linguistic.stemmer import Stemmer
+from nahiarhdNLP.preprocessing.linguistic.stopword import StopwordRemover
+from nahiarhdNLP.preprocessing.normalization.spell_corrector import SpellCorrector
+
+console = Console()
+
+SAMPLE_WORDS = [
+    "Haiii",
+    "@temans",
+    "gw",
+    "udh",
+    "coba",
+    "apps",
+    "baruu",
+    "loh",
+    "https://example.com/promo?id=123",
+    "#KerenBanget",
+    "😍",
+    "🚀",
+    "<b>mantap</b>",
+    "nyesel",
+    "dehhhh!!!",
+    "Rp50.000",
+    "081234567890",
+    "info@example.com",
+    "makan",
+    "siang",
+    "yg",
+    "bgt",
+]
+
+CLEANING_CONFIG = {
+    "remove_html": True,
+    "remove_urls": True,
+    "remove_mentions": True,
+    "remove_hashtags": True,
+    "remove_emoji": True,
+    "remove_lowercase": True,
+    "remove_repeated_chars": True,
+    "remove_extra_spaces": True,
+}
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def generate_corpus(size: int, seed: int = 42) -> list:
+    """Generate a synthetic social-media corpus."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(5, 30)))
+        for _ in range(size)
+    ]
+
+
+def timed(func, *args):
+    """Run func(*args) and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_batch(corpus: list):
+    """Compare a `process` loop against `process_batch` and `process_iter`."""
+    print_header("📦 BATCH API")
+
+    pipeline = Pipeline(dict(CLEANING_CONFIG))
+    # Warm up lazy resources so load time is not measured
+    pipeline.process_batch(corpus[:10])
+
+    loop_result, loop_time = timed(lambda: [pipeline.process(t) for t in corpus])
+    batch_result, batch_time = timed(pipeline.process_batch, corpus)
+    iter_result, iter_time = timed(lambda: list(pipeline.process_iter(corpus)))
+
+    assert loop_result == batch_result == iter_result, "batch output differs"
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Docs/s", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    for name, seconds in [
+        ("process (loop)", loop_time),
+        ("process_batch", batch_time),
+        ("process_iter", iter_time),
+    ]:
+        table.add_row(
+            name,
+            f"{seconds:.3f}",
+            f"{len(corpus) / seconds:,.0f}",
+            f"{loop_time / seconds:.2f}x",
+        )
+    console.print(table)
+
+
+def bench_parallel(corpus: list):
+    """Measure `process_parallel` scaling from 1 worker up to the CPU count."""
+    print_header("🧵 PARALLEL SCALING")
+
+    config = dict(CLEANING_CONFIG, stopword=True)
+    pipeline = Pipeline(config)
+    expected = pipeline.process_batch(corpus)
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, 64, cpu_count})
+    worker_counts = [n for n in worker_counts if n <= cpu_count]
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Workers", justify="right", style="cyan")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Docs/s", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    table.add_column("Efficiency", justify="right")
+
+    base_time = None
+    for workers in worker_counts:
+        result, seconds = timed(
+            lambda: list(pipeline.process_parallel(corpus, workers=workers))
+        )
+        assert result == expected, "parallel output differs"
+        base_time = base_time or seconds
+        speedup = base_time / seconds
+        table.add_row(
+            str(workers),
+            f"{seconds:.3f}",
+            f"{len(corpus) / seconds:,.0f}",
+            f"{speedup:.2f}x",
+            f"{speedup / workers:.0%}",
+        )
+    console.print(table)
+
+
+def bench_spell_lookup(sample_size: int = 200):
+    """Compare difflib against the SymSpell index for out-of-vocabulary words."""
+    print_header("🔎 SPELL CORRECTOR LOOKUP")
+
+    spell = SpellCorrector()
+    _, build_time = timed(lambda: spell.fuzzy_index)
+
+    rng = random.Random(7)
+    queries = []
+    for word in rng.sample(spell.wordlist, sample_size):
+        i = rng.randrange(len(word))
+        queries.append(word[:i] + rng.choice("aiueoknrst") + word[i + 1 :])
+
+    _, difflib_time = timed(
+        lambda: [
+            difflib.get_close_matches(q, spell.wordlist, n=1, cutoff=0.6)
+            for q in queries
+        ]
+    )
+    spell.fuzzy_index._cache.clear()
+    _, cold_time = timed(lambda: [spell.fuzzy_index.lookup(q) for q in queries])
+    _, warm_time = timed(lambda: [spell.fuzzy_index.lookup(q) for q in queries])
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Engine", style="cyan")
+    table.add_column("µs / word", justify="right")
+    for name, seconds in [
+        ("difflib.get_close_matches", difflib_time),
+        ("SymSpellIndex (cold)", cold_time),
+        ("SymSpellIndex (cached)", warm_time),
+    ]:
+        table.add_row(name, f"{seconds / len(queries) * 1e6:,.1f}")
+    console.print(table)
+    console.print(f"[cyan]Index build time:[/cyan] {build_time:.2f}s")
+
+
+def bench_vocabulary_membership(corpus: list):
+    """Compare list scans against frozenset lookups for vocabulary checks."""
+    print_header("📚 VOCABULARY MEMBERSHIP")
+
+    tokens = [token.lower() for text in corpus[:2000] for token in text.split()]
+    spell = SpellCorrector()
+    stopword = StopwordRemover()
+    stopword._load_data()
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Vocabulary", style="cyan")
+    table.add_column("Size", justify="right")
+    table.add_column("list µs/token", justify="right")
+    table.add_column("frozenset µs/token", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    for name, as_list, as_set in [
+        ("wordlist", spell.wordlist, spell.wordset),
+        ("stopwords", stopword.stopwords, stopword.stopword_set),
+    ]:
+        # List scan is slow on 78k entries, so time it on a smaller slice
+        list_tokens = tokens[:500]
+        _, list_time = timed(lambda: [t in as_list for t in list_tokens])
+        _, set_time = timed(lambda: [t in as_set for t in tokens])
+        list_per_token = list_time / len(list_tokens)
+        set_per_token = set_time / len(tokens)
+        table.add_row(
+            name,
+            f"{len(as_list):,}",
+            f"{list_per_token * 1e6:,.2f}",
+            f"{set_per_token * 1e6:,.3f}",
+            f"{list_per_token / set_per_token:,.0f}x",
+        )
+    console.print(table)
+
+
+def unfused_cleaning(steps: list, text: str) -> str:
+    """Run cleaning steps one by one through their original methods."""
+    from nahiarhdNLP.preprocessing.main import _STEP_SPECS
+
+    for step in steps:
+        getter, method, kwargs = _STEP_SPECS[step]
+        text = method(getter(), text, **kwargs)
+    return text
+
+
+def bench_fusion(corpus: list):
+    """Compare the unfused step sequence against FusedCleaner."""
+    print_header("🔗 FUSED CLEANING")
+
+    steps = list(CLEANING_CONFIG)
+    fused = FusedCleaner(steps)
+    unfused_result, unfused_time = timed(
+        lambda: [unfused_cleaning(steps, t) for t in corpus]
+    )
+    fused_result, fused_time = timed(lambda: [fused(t) for t in corpus])
+    assert unfused_result == fused_result, "fused output differs"
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("Passes", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    # Setiap method asli: satu pass regex + satu pass perapian spasi
+    unfused_passes = sum(
+        (op.apply is not None) + op.collapse
+        for op in (CLEANING_OPS[step] for step in steps)
+    )
+    table.add_row("unfused", str(unfused_passes), f"{unfused_time:.3f}", "1.00x")
+    table.add_row(
+        "fused",
+        str(len(fused.plan)),
+        f"{fused_time:.3f}",
+        f"{unfused_time / fused_time:.2f}x",
+    )
+    console.print(table)
+
+
+def bench_patterns(corpus: list, repeat: int = 20):
+    """Compare `re.sub(pattern_string)` against precompiled registry patterns."""
+    print_header("🧩 PRECOMPILED PATTERNS")
+
+    texts = corpus[:500]
+    registry = patterns.registered_patterns()
+    compiled = [patterns.get_pattern(name) for name in registry]
+    sources = list(registry.values())
+
+    def run_strings():
+        for _ in range(repeat):
+            for text in texts:
+                for source, flags in sources:
+                    re.sub(source, " ", text, flags=flags)
+
+    def run_compiled():
+        for _ in range(repeat):
+            for text in texts:
+                for pattern in compiled:
+                    pattern.sub(" ", text)
+
+    calls = repeat * len(texts) * len(sources)
+    _, string_time = timed(run_strings)
+    _, compiled_time = timed(run_compiled)
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("µs / call", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    table.add_row("re.sub(string)", f"{string_time / calls * 1e6:.2f}", "1.00x")
+    table.add_row(
+        f"registry ({patterns.engine.__name__})",
+        f"{compiled_time / calls * 1e6:.2f}",
+        f"{string_time / compiled_time:.2f}x",
+    )
+    console.print(table)
+    console.print(f"[cyan]Registered patterns:[/cyan] {len(sources)}")
+
+
+def bench_dataset_cache():
+    """Compare parsing the dataset files against loading the binary cache."""
+    print_header("💾 DATASET CACHE")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        uncached = DatasetLoader(cache=DatasetCache(enabled=False))
+        cached = DatasetLoader(cache=DatasetCache(cache_dir))
+        cached.warm_cache()
+
+        table = Table(box=box.ROUNDED)
+        table.add_column("Dataset", style="cyan")
+        table.add_column("Parse ms", justify="right")
+        table.add_column("Cached ms", justify="right")
+        table.add_column("Speedup", justify="right", style="green")
+        for name in DatasetLoader.CACHED_DATASETS:
+            method = f"load_{name}_dataset"
+            parsed, parse_time = timed(getattr(uncached, method))
+            loaded, cache_time = timed(getattr(cached, method))
+            assert parsed == loaded, f"cached {name} differs"
+            table.add_row(
+                name,
+                f"{parse_time * 1e3:.1f}",
+                f"{cache_time * 1e3:.1f}",
+                f"{parse_time / cache_time:.1f}x",
+            )
+        console.print(table)
+
+
+def bench_stem_cache(corpus: list):
+    """Compare Sastrawi's unbounded cache against the bounded token cache."""
+    print_header("🌱 STEM CACHE")
+
+    texts = corpus[:5000]
+    sastrawi = Stemmer(cache_size=0).stemmer
+    stemmer = Stemmer()
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Stemmer", style="cyan")
+    table.add_column("Cold s", justify="right")
+    table.add_column("Warm s", justify="right")
+    table.add_column("Cache size", justify="right")
+    table.add_column("Hit rate", justify="right", style="green")
+
+    expected, cold = timed(lambda: [sastrawi.stem(t) for t in texts])
+    _, warm = timed(lambda: [sastrawi.stem(t) for t in texts])
+    size = len(sastrawi.cache.data)
+    table.add_row(
+        "Sastrawi (unbounded)", f"{cold:.3f}", f"{warm:.3f}", f"{size:,}", "-"
+    )
+
+    result, cold = timed(lambda: [stemmer.stem(t) for t in texts])
+    _, warm = timed(lambda: [stemmer.stem(t) for t in texts])
+    assert result == expected, "cached stemming differs"
+    stats = stemmer.cache_stats()
+    table.add_row(
+        f"Stemmer(cache_size={stats['maxsize']:,})",
+        f"{cold:.3f}",
+        f"{warm:.3f}",
+        f"{stats['size']:,}",
+        f"{stats['hit_rate']:.1%}",
+    )
+    console.print(table)
+
+
+def bench_result_cache(corpus: list, size: int = 5000):
+    """Feeds with duplicates: no cache vs. batch dedupe + result cache."""
+    print_header("♻️ RESULT CACHE")
+
+    config = {
+        "remove_urls": True,
+        "remove_mentions": True,
+        "remove_lowercase": True,
+        "spell_corrector_sentence": True,
+        "stopword": True,
+    }
+    plain = Pipeline(dict(config))
+    plain.warm_up()
+    # Hasil spell corrector per kata di-cache; panaskan agar adil
+    plain.process_batch(corpus[:size])
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Duplicates", justify="right")
+    table.add_column("No cache s", justify="right")
+    table.add_column("Cached s", justify="right")
+    table.add_column("Saved", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    rng = random.Random(3)
+    for ratio in (0.0, 0.3, 0.6):
+        unique = corpus[: int(size * (1 - ratio))]
+        feed = unique + [rng.choice(unique) for _ in range(size - len(unique))]
+        rng.shuffle(feed)
+
+        expected, plain_time = timed(plain.process_batch, feed)
+        cached_time = float("inf")
+        # Ambil yang tercepat dari 3 putaran, masing-masing dengan cache kosong
+        for _ in range(3):
+            plain_time = min(plain_time, timed(plain.process_batch, feed)[1])
+            cached = Pipeline(dict(config))
+            cache = cached.enable_result_cache()
+            result, seconds = timed(cached.process_batch, feed)
+            assert result == expected, "cached output differs"
+            cached_time = min(cached_time, seconds)
+        table.add_row(
+            f"{ratio:.0%}",
+            f"{plain_time:.3f}",
+            f"{cached_time:.3f}",
+            f"{cache.stats()['saved_rate']:.1%}",
+            f"{plain_time / cached_time:.2f}x",
+        )
+    console.print(table)
+
+
+def bench_token_stream(corpus: list):
+    """Compare step-by-step string processing against the shared token stream."""
+    print_header("🪙 TOKEN STREAM")
+
+    from nahiarhdNLP.preprocessing.main import _STEP_SPECS
+
+    steps = ["stopword", "spell_corrector_sentence", "stem", "tokenizer"]
+    texts = corpus[:5000]
+    pipeline = Pipeline({step: True for step in steps})
+    # Warm up resources and the stem/spell caches so only execution is measured
+    pipeline.process_batch(texts)
+
+    def unfused_batch():
+        batch = texts
+        for step in steps:
+            getter, method, kwargs = _STEP_SPECS[step]
+            instance = getter()
+            batch = [method(instance, text, **kwargs) for text in batch]
+        return batch
+
+    def measure(func):
+        tracemalloc.start()
+        result, seconds = timed(func)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, seconds, peak
+
+    expected, unfused_time, unfused_peak = measure(unfused_batch)
+    result, stream_time, stream_peak = measure(lambda: pipeline.process_batch(texts))
+    assert result == expected, "token stream output differs"
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("Seconds*", justify="right")
+    table.add_column("Peak MB", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    table.add_row(
+        "string per step", f"{unfused_time:.3f}", f"{unfused_peak / 1e6:.1f}", "1.00x"
+    )
+    table.add_row(
+        "token stream",
+        f"{stream_time:.3f}",
+        f"{stream_peak / 1e6:.1f}",
+        f"{unfused_time / stream_time:.2f}x",
+    )
+    console.print(table)
+    console.print("[dim]* measured under tracemalloc[/dim]")
+
+
+def bench_profiling(corpus: list):
+    """Overhead of per-step profiling, and the resulting per-step report."""
+    print_header("🔬 PROFILING OVERHEAD")
+
+    config = {
+        "remove_urls": True,
+        "remove_mentions": True,
+        "remove_hashtags": True,
+        "remove_punctuation": True,
+        "remove_lowercase": True,
+        "emoji_to_text": True,
+        "stopword": True,
+        "remove_extra_spaces": True,
+    }
+    texts = corpus[:20_000]
+    pipeline = Pipeline(dict(config))
+    expected = pipeline.process_batch(texts)
+
+    modes = [
+        ("disabled", None),
+        ("per stage", False),
+        ("per step", True),
+    ]
+    table = Table(box=box.ROUNDED)
+    table.add_column("Profiling", style="cyan")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Overhead", justify="right", style="green")
+
+    baseline = None
+    for label, per_step in modes:
+        if per_step is None:
+            pipeline.disable_profiling()
+        else:
+            pipeline.enable_profiling(per_step=per_step)
+        result, seconds = timed(pipeline.process_batch, texts)
+        assert result == expected, f"profiling ({label}) changed the output"
+        baseline = baseline or seconds
+        table.add_row(label, f"{seconds:.3f}", f"{seconds / baseline - 1:+.1%}")
+    console.print(table)
+    console.print(
+        "[dim]per step also turns off cleaning fusion and token streams, "
+        "so it includes their unfused cost[/dim]"
+    )
+
+    steps = Table(box=box.ROUNDED, title="Per-step report")
+    steps.add_column("Step", style="cyan")
+    steps.add_column("Total s", justify="right")
+    steps.add_column("Mean µs/text", justify="right")
+    steps.add_column("Chars in → out", justify="right")
+    for name, step in pipeline.stats()["steps"].items():
+        steps.add_row(
+            name,
+            f"{step['total_s']:.3f}",
+            f"{step['mean_ms'] * 1e3:.1f}",
+            f"{step['chars_in']:,} → {step['chars_out']:,}",
+        )
+    console.print(steps)
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_async_load(pipeline: Pipeline, texts: list, mode: str, clients: int):
+    """Serve `texts` from concurrent clients while a ticker measures loop lag."""
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker(interval: float = 0.001):
+        loop = asyncio.get_running_loop()
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(interval)
+            lags.append(loop.time() - start - interval)
+
+    async def client(shard: list) -> list:
+        results = []
+        for text in shard:
+            if mode == "blocking":
+                results.append(pipeline.process(text))
+                # Simulate a handler yielding between requests
+                await asyncio.sleep(0)
+            else:
+                results.append(await pipeline.aprocess(text))
+        return results
+
+    shards = [texts[i::clients] for i in range(clients)]
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    shard_results = await asyncio.gather(*(client(shard) for shard in shards))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    if mode != "blocking":
+        await pipeline.aclose()
+
+    results = [None] * len(texts)
+    for i, shard_result in enumerate(shard_results):
+        results[i::clients] = shard_result
+    return results, elapsed, lags
+
+
+def bench_async(corpus: list, clients: int = 200):
+    """Event loop latency while serving requests with and without aprocess."""
+    print_header("⏱️ ASYNC EVENT LOOP LAG")
+
+    config = {
+        "remove_urls": True,
+        "remove_mentions": True,
+        "remove_hashtags": True,
+        "remove_punctuation": True,
+        "remove_extra_spaces": True,
+        "remove_lowercase": True,
+        "stopword": True,
+    }
+    texts = corpus[:20_000]
+    expected = Pipeline(dict(config)).process_batch(texts)
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("Docs/s", justify="right")
+    table.add_column("Lag p50 ms", justify="right")
+    table.add_column("Lag p99 ms", justify="right", style="green")
+    table.add_column("Lag max ms", justify="right")
+
+    for mode in ["blocking", "thread", "process"]:
+        pipeline = Pipeline(dict(config))
+        if mode == "blocking":
+            pipeline.warm_up()
+        else:
+            pipeline.configure_async(executor=mode, max_workers=2)
+        results, elapsed, lags = asyncio.run(
+            run_async_load(pipeline, texts, mode, clients)
+        )
+        assert results == expected, f"{mode} output differs"
+        table.add_row(
+            mode,
+            f"{len(texts) / elapsed:,.0f}",
+            f"{percentile(lags, 0.50) * 1e3:.2f}",
+            f"{percentile(lags, 0.99) * 1e3:.2f}",
+            f"{max(lags) * 1e3:.2f}",
+        )
+
+    console.print(table)
+    console.print(
+        f"[dim]{clients} concurrent clients; lag = oversleep of a 1 ms ticker[/dim]"
+    )
+
+
+def main(size: int = 50_000):
+    """Run all benchmarks."""
+    corpus = generate_corpus(size)
+    console.print(f"[cyan]Corpus size:[/cyan] {len(corpus):,} documents")
+
+    bench_fusion(corpus)
+    bench_batch(corpus)
+    bench_parallel(corpus)
+    bench_patterns(corpus)
+    bench_spell_lookup()
+    bench_vocabulary_membership(corpus)
+    bench_dataset_cache()
+    bench_stem_cache(corpus)
+    bench_result_cache(corpus)
+    bench_token_stream(corpus)
+    bench_async(corpus)
+    bench_profiling(corpus)
+
+
+if __name__ == "__main__":
+    main()
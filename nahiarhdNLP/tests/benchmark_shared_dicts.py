@@ -0,0 +1,151 @@
+"""
+Memory benchmark for shared dictionaries across process workers.
+
+Starts the process pools used by `process_parallel(executor="process")` with
+growing worker counts, once with plain per-process dicts and once with
+memory-mapped SharedTable dictionaries (see nahiarhdNLP.datasets.shared).
+After warm-up and again after processing a corpus, every worker reports its
+memory from /proc/self/smaps_rollup: RSS counts pages of the mapped tables in
+every worker, while Private (unshared) memory shows what an additional worker
+really costs. Outputs of both modes must be identical.
+
+Linux only. Run with:
+
+        python -m nahiarhdNLP.tests.benchmark_shared_dicts [--max-workers 4]
+"""
+
+import argparse
+import os
+import time
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from nahiarhdNLP.benchmarks import CorpusGenerator
+from nahiarhdNLP.datasets.shared import use_shared_dictionaries
+from nahiarhdNLP.preprocessing import main as pipeline_main
+
+console = Console()
+
+CONFIG = {
+    "emoji_to_text": True,
+    "remove_lowercase": True,
+    "spell_corrector_sentence": True,
+    "stopword": True,
+}
+
+# Kolom memori yang ditampilkan, lihat _memory_kb
+KEYS = ("Rss", "Pss", "Private")
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def _memory_kb() -> dict:
+    """Rss / Pss / Private memory of the current process in kB."""
+    memory = {}
+    with open("/proc/self/smaps_rollup", "r", encoding="ascii") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                memory[name] = int(value.split()[0])
+    memory["Private"] = memory.pop("Private_Clean") + memory.pop("Private_Dirty")
+    return memory
+
+
+def _report(_):
+    # Tahan worker sebentar agar setiap worker menerima satu tugas
+    time.sleep(0.2)
+    return os.getpid(), _memory_kb()
+
+
+def _worker_memory(pool, workers: int) -> list:
+    return list(dict(pool.map(_report, range(workers * 4))).values())
+
+
+def measure(texts: list, config: dict, workers: int, shared: bool):
+    """Per-worker memory after warm-up and after processing `texts`.
+
+    The parent never loads the dictionaries itself, so workers cannot share
+    them through copy-on-write pages inherited from fork.
+    """
+    use_shared_dictionaries(shared)
+    pool = pipeline_main._process_pool(dict(config), workers)
+    try:
+        warm = _worker_memory(pool, workers)
+        chunks = [texts[i : i + 200] for i in range(0, len(texts), 200)]
+        start = time.perf_counter()
+        result = [
+            text
+            for chunk in pool.map(pipeline_main._process_chunk_in_worker, chunks)
+            for text in chunk
+        ]
+        elapsed = time.perf_counter() - start
+        loaded = _worker_memory(pool, workers)
+    finally:
+        pool.shutdown()
+    return result, elapsed, warm, loaded
+
+
+def main(argv=None):
+    """Compare per-worker memory of plain and shared dictionaries."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        console.print("[yellow]Warning: /proc/self/smaps_rollup not found[/yellow]")
+        return
+
+    texts = CorpusGenerator(seed=7).generate(args.size)
+
+    print_header("🧠 WORKER MEMORY (MB per worker, mean)")
+    table = Table(box=box.ROUNDED)
+    table.add_column("Mode", style="cyan")
+    table.add_column("Workers", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("RSS", justify="right")
+    table.add_column("PSS", justify="right")
+    table.add_column("Private warm", justify="right", style="green")
+    table.add_column("Private after run", justify="right", style="green")
+
+    def mean(reports, name):
+        return sum(r[name] for r in reports) / len(reports) / 1024
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+
+    # Worker tanpa step: biaya interpreter + import saja
+    _, _, bare, _ = measure([], {}, 1, False)
+    table.add_row("no steps", "1", "-", *(f"{mean(bare, n):.1f}" for n in KEYS), "-")
+
+    expected = None
+    for shared in (False, True):
+        for count in counts:
+            result, elapsed, warm, loaded = measure(texts, CONFIG, count, shared)
+            expected = expected or result
+            assert result == expected, f"{count} workers: output differs"
+            table.add_row(
+                "shared" if shared else "dict",
+                str(count),
+                f"{elapsed:.2f}",
+                *(f"{mean(warm, name):.1f}" for name in KEYS),
+                f"{mean(loaded, 'Private'):.1f}",
+            )
+    use_shared_dictionaries(None)
+
+    console.print(table)
+    console.print(
+        "[green]Outputs identical; Private is the memory each extra worker "
+        "adds (RSS also counts the mapped tables shared by all workers)[/green]"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Validation and speed benchmark for the stemmer engines.
+
+Stems a sample of synthetic corpus tokens plus affixed forms of KBBI root
+words with Sastrawi and with the native DictionaryStemmer:
+
+1. With Sastrawi's own root dictionary both engines must agree on every token
+   (same algorithm, only the data structures differ).
+2. With the bundled KBBI dictionary (`Stemmer(engine="dictionary")`) the
+   agreement rate with Sastrawi is reported, plus sample differences.
+3. Time per token without the stem cache, i.e. the cost of every new token.
+
+Sastrawi needs up to a few hundred milliseconds for an unknown token, so the
+default sample is small. Run with:
+
+        python -m nahiarhdNLP.tests.benchmark_stemmer_engines [--tokens 600]
+"""
+
+import argparse
+import random
+import time
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from nahiarhdNLP.benchmarks import CorpusGenerator
+from nahiarhdNLP.datasets import DatasetLoader
+from nahiarhdNLP.preprocessing.linguistic.dictionary_stemmer import DictionaryStemmer
+from nahiarhdNLP.preprocessing.linguistic.stemmer import NON_WORD_PATTERN, Stemmer
+
+console = Console()
+
+PREFIXES = ["me", "mem", "men", "meng", "ber", "ter", "di", "ke", "pe", "per", "se"]
+SUFFIXES = ["kan", "an", "i", "nya", "lah", "kannya", "annya", "ku", "mu"]
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def build_tokens(count: int, seed: int = 7) -> list:
+    """`count` unique tokens: half from the corpus, half affixed KBBI roots."""
+    rng = random.Random(seed)
+    texts = CorpusGenerator(seed=seed).generate(500)
+    corpus = sorted(set(NON_WORD_PATTERN.sub(" ", " ".join(texts).lower()).split()))
+    tokens = dict.fromkeys(rng.sample(corpus, min(count // 2, len(corpus))))
+
+    roots = DatasetLoader().load_root_words_dataset()
+    while len(tokens) < count:
+        root = rng.choice(roots)
+        word = rng.choice(PREFIXES + [""]) + root + rng.choice(SUFFIXES + [""])
+        if rng.random() < 0.05:
+            word = f"{root}-{word}"
+        tokens[word] = None
+    return list(tokens)
+
+
+def per_token_us(stem_word, tokens: list):
+    """Results and mean microseconds per token."""
+    start = time.perf_counter()
+    results = [stem_word(token) for token in tokens]
+    return results, (time.perf_counter() - start) / len(tokens) * 1e6
+
+
+def main(argv=None):
+    """Validate DictionaryStemmer against Sastrawi and compare speed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=600)
+    args = parser.parse_args(argv)
+
+    tokens = build_tokens(args.tokens)
+    sastrawi = Stemmer(cache_size=0, engine="sastrawi")
+    dictionary = Stemmer(cache_size=0, engine="dictionary")
+    # Algoritma native dengan kamus Sastrawi: hasil harus identik
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+    same_dict = DictionaryStemmer(StemmerFactory().get_words())
+
+    print_header("🌱 STEMMER ENGINES (no stem cache)")
+    expected, sastrawi_us = per_token_us(sastrawi.stem_word, tokens)
+    native, native_us = per_token_us(same_dict.stem_word, tokens)
+    kbbi, kbbi_us = per_token_us(dictionary.stem_word, tokens)
+
+    mismatches = [t for t, a, b in zip(tokens, expected, native) if a != b]
+    assert not mismatches, f"native engine differs from Sastrawi: {mismatches[:10]}"
+    agree = sum(a == b for a, b in zip(expected, kbbi))
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Engine", style="cyan")
+    table.add_column("Dictionary", justify="right")
+    table.add_column("µs/token", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+    table.add_column("Agrees with Sastrawi", justify="right")
+    rows = [
+        (
+            "sastrawi",
+            "Sastrawi",
+            len(sastrawi.stemmer.delegatedStemmer.dictionary.words),
+            sastrawi_us,
+            len(tokens),
+        ),
+        ("dictionary", "Sastrawi", len(same_dict), native_us, len(tokens)),
+        ("dictionary", "KBBI", len(dictionary.stemmer), kbbi_us, agree),
+    ]
+    for engine, name, words, us, agreed in rows:
+        table.add_row(
+            engine,
+            f"{name} ({words:,})",
+            f"{us:.1f}",
+            f"{sastrawi_us / us:.1f}x",
+            f"{agreed / len(tokens):.1%}",
+        )
+    console.print(table)
+    console.print(
+        f"[green]{len(tokens):,} unique tokens; native engine matches Sastrawi "
+        "on every token with the same dictionary[/green]"
+    )
+
+    differences = [
+        (token, a, b) for token, a, b in zip(tokens, expected, kbbi) if a != b
+    ]
+    if differences:
+        print_header("🔍 SAMPLE DIFFERENCES (KBBI vs Sastrawi dictionary)")
+        sample = Table(box=box.ROUNDED)
+        sample.add_column("Token", style="cyan")
+        sample.add_column("Sastrawi")
+        sample.add_column("KBBI")
+        for token, a, b in random.Random(1).sample(
+            differences, min(15, len(differences))
+        ):
+            sample.add_row(token, a, b)
+        console.print(sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Speed and memory benchmark for the scanner-based Tokenizer.
+
+Tokenizes synthetic corpus texts and compares:
+
+1. `str.split()` (the old tokenizer) with the regex scanner, per text.
+2. `tokenize_with_offsets` per text (a list of Token tuples) with
+   `tokenize_batch` (one TokenBatch: flat buffer plus offset arrays).
+3. Memory held by the offsets: Token tuples vs TokenBatch arrays.
+4. Placeholders inserted by replace_email/replace_link/replace_user stay
+   single tokens when the pipeline ends with `tokenizer`.
+
+Run with:
+
+        python -m nahiarhdNLP.tests.benchmark_tokenizer [--texts 20000]
+"""
+
+import argparse
+import sys
+import time
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from nahiarhdNLP.benchmarks import CorpusGenerator
+from nahiarhdNLP.preprocessing import Pipeline
+from nahiarhdNLP.preprocessing.tokenization.tokenizer import Tokenizer
+
+console = Console()
+
+PLACEHOLDERS = ("<email>", "<link>", "<user>")
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def timed(func, *args):
+    """Result and elapsed milliseconds of `func(*args)`."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def tuples_nbytes(token_lists: list) -> int:
+    """Bytes of the list and Token objects, excluding the token strings."""
+    total = sys.getsizeof(token_lists)
+    for tokens in token_lists:
+        total += sys.getsizeof(tokens)
+        for token in tokens:
+            total += sys.getsizeof(token) + sys.getsizeof(token.start)
+            total += sys.getsizeof(token.end)
+    return total
+
+
+def check_placeholders(texts: list) -> int:
+    """Run replace_* + tokenizer and assert every placeholder is one token."""
+    pipeline = Pipeline(
+        {
+            "replace_email": True,
+            "replace_link": True,
+            "replace_user": True,
+            "tokenizer": True,
+        }
+    )
+    found = 0
+    for tokens in pipeline.process_batch(texts):
+        if not tokens:
+            continue
+        for placeholder in PLACEHOLDERS:
+            name = placeholder[1:-1]
+            assert name not in tokens, f"placeholder {placeholder} was split: {tokens}"
+        found += sum(token in PLACEHOLDERS for token in tokens)
+    assert found, "corpus produced no placeholders"
+    return found
+
+
+def main(argv=None):
+    """Benchmark the Tokenizer on a synthetic corpus."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    texts = CorpusGenerator(seed=11).generate(args.texts)
+    tokenizer = Tokenizer()
+
+    print_header("✂️  TOKENIZER")
+    _, split_ms = timed(lambda: [text.split() for text in texts])
+    scanned, scan_ms = timed(lambda: [tokenizer.tokenize(text) for text in texts])
+    offsets, offsets_ms = timed(
+        lambda: [tokenizer.tokenize_with_offsets(text) for text in texts]
+    )
+    batch, batch_ms = timed(tokenizer.tokenize_batch, texts)
+    assert batch.to_lists() == scanned, "TokenBatch differs from tokenize()"
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Method", style="cyan")
+    table.add_column("Output", style="dim")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("µs/text", justify="right", style="green")
+    rows = [
+        ("str.split()", "list of str, no offsets", split_ms),
+        ("tokenize()", "list of str", scan_ms),
+        ("tokenize_with_offsets()", "list of Token tuples", offsets_ms),
+        ("tokenize_batch()", "TokenBatch arrays", batch_ms),
+    ]
+    for name, output, ms in rows:
+        table.add_row(name, output, f"{ms:,.1f}", f"{ms * 1e3 / len(texts):.2f}")
+    console.print(table)
+
+    placeholders = check_placeholders(texts)
+    console.print(
+        f"[green]replace_* + tokenizer: {placeholders:,} placeholders kept as "
+        "single tokens[/green]"
+    )
+
+    tuple_bytes = tuples_nbytes(offsets)
+    console.print(
+        f"[green]{len(texts):,} texts, {batch.num_tokens:,} tokens; offsets "
+        f"take {batch.nbytes / 1e6:.1f} MB in TokenBatch vs "
+        f"{tuple_bytes / 1e6:.1f} MB as Token tuples "
+        f"({tuple_bytes / batch.nbytes:.0f}x)[/green]"
+    )
+
+
+if __name__ == "__main__":
+    main()
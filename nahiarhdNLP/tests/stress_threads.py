@@ -0,0 +1,279 @@
+"""
+Thread-safety stress test and thread scaling benchmark for nahiarhdNLP.
+
+Each round resets the lazily created global resources, then releases many
+threads at once (via a barrier) on a cold Pipeline. It checks that every
+resource is constructed exactly once, that all threads see the same fully
+loaded instances, and that every output equals the single-threaded result.
+A shared StemCache is also hammered with a tiny capacity to force
+concurrent evictions. Finally `process_parallel(executor="thread")` is
+timed with growing thread counts; it only scales when the GIL is disabled
+(free-threaded CPython 3.13t, e.g. `python3.13t -X gil=0`).
+
+Run with:
+
+        python -m nahiarhdNLP.tests.stress_threads [--threads 32] [--rounds 5]
+"""
+
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from nahiarhdNLP.preprocessing import Pipeline
+from nahiarhdNLP.preprocessing import main as pipeline_main
+from nahiarhdNLP.preprocessing.linguistic.stem_cache import StemCache
+
+console = Console()
+
+# Global resource variables in preprocessing.main, reset before every round
+RESOURCE_GLOBALS = [
+    "_text_cleaner",
+    "_text_cleaner_word",
+    "_text_replace",
+    "_stemmer",
+    "_stopword",
+    "_emoji",
+    "_spell_corrector",
+    "_tokenizer",
+]
+
+STRESS_CONFIG = {
+    "clean_html": True,
+    "remove_urls": True,
+    "remove_mentions": True,
+    "replace_email": True,
+    "emoji_to_text": True,
+    "remove_lowercase": True,
+    "spell_corrector_sentence": True,
+    "stopword": True,
+    "stem": True,
+    "remove_extra_spaces": True,
+}
+
+WORDS = [
+    "Haiii",
+    "@teman",
+    "gw",
+    "udh",
+    "makan",
+    "memakan",
+    "minuman",
+    "https://example.com/promo",
+    "<b>mantap</b>",
+    "😍",
+    "info@example.com",
+    "yang",
+    "sedang",
+    "bgt",
+]
+
+
+def print_header(title: str):
+    """Print a styled header."""
+    console.print(f"\n[bold cyan]{title}[/bold cyan]", justify="center")
+    console.print("=" * 80, style="cyan")
+
+
+def generate_texts(size: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+        for _ in range(size)
+    ]
+
+
+def reset_resources():
+    for name in RESOURCE_GLOBALS:
+        setattr(pipeline_main, name, None)
+    pipeline_main._resource_load_times.clear()
+
+
+def run_threads(count: int, target) -> list:
+    """Start `count` threads on `target(index)` together; re-raise errors."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = []
+
+    def worker(index):
+        try:
+            barrier.wait()
+            results[index] = target(index)
+        except BaseException as e:  # noqa: B902 - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def stress_cold_start(threads: int, rounds: int, texts: list):
+    """Hammer cold resource initialization from many threads at once."""
+    print_header("🧵 COLD START STRESS")
+
+    expected = Pipeline(dict(STRESS_CONFIG)).process_batch(texts)
+    expected_single = [Pipeline(dict(STRESS_CONFIG)).process(t) for t in texts[:20]]
+
+    constructions = Counter()
+    load_resource = pipeline_main._load_resource
+
+    def counting_load_resource(cls, *loaders):
+        constructions[cls.__name__] += 1
+        return load_resource(cls, *loaders)
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Round", justify="right")
+    table.add_column("Threads", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Constructions", style="green")
+
+    pipeline_main._load_resource = counting_load_resource
+    try:
+        for round_number in range(1, rounds + 1):
+            reset_resources()
+            constructions.clear()
+            pipeline = Pipeline(dict(STRESS_CONFIG))
+
+            def target(index):
+                # Mix batch and single-text calls so both paths race
+                if index % 2:
+                    result = pipeline.process_batch(texts)
+                else:
+                    result = [pipeline.process(t) for t in texts[:20]]
+                instances = tuple(
+                    id(getattr(pipeline_main, name)) for name in RESOURCE_GLOBALS
+                )
+                return index, result, instances
+
+            start = time.perf_counter()
+            results = run_threads(threads, target)
+            elapsed = time.perf_counter() - start
+
+            for index, result, _ in results:
+                wanted = expected if index % 2 else expected_single
+                assert result == wanted, f"thread {index}: output differs"
+            assert (
+                len({instances for _, _, instances in results}) == 1
+            ), "threads saw different resource instances"
+            duplicates = {name: n for name, n in constructions.items() if n != 1}
+            assert not duplicates, f"resources loaded more than once: {duplicates}"
+
+            table.add_row(
+                str(round_number),
+                str(threads),
+                f"{elapsed:.2f}",
+                ", ".join(sorted(constructions)),
+            )
+    finally:
+        pipeline_main._load_resource = load_resource
+
+    console.print(table)
+    console.print(
+        "[green]Every resource loaded exactly once; outputs identical[/green]"
+    )
+
+
+def stress_stem_cache(threads: int, operations: int = 20_000):
+    """Concurrent get/set on a tiny StemCache to force evictions."""
+    print_header("🗄️ STEM CACHE STRESS")
+
+    cache = StemCache(maxsize=64)
+    keys = [f"kata{i}" for i in range(256)]
+
+    def target(index):
+        rng = random.Random(index)
+        for _ in range(operations):
+            word = rng.choice(keys)
+            root = cache.get(word)
+            if root is None:
+                cache.set(word, word.upper())
+            else:
+                assert root == word.upper(), "cache returned a wrong value"
+        return index
+
+    start = time.perf_counter()
+    run_threads(threads, target)
+    elapsed = time.perf_counter() - start
+
+    stats = cache.stats()
+    assert stats["size"] <= 64, "cache grew beyond maxsize"
+    assert stats["hits"] + stats["misses"] == threads * operations, "lost updates"
+    console.print(
+        f"[green]{threads * operations:,} operations in {elapsed:.2f}s, "
+        f"{stats['evictions']:,} evictions, size {stats['size']}[/green]"
+    )
+
+
+def bench_thread_scaling(texts: list, max_threads: int):
+    """Throughput of process_parallel(executor="thread") by thread count."""
+    print_header("📈 THREAD SCALING")
+
+    gil = pipeline_main._gil_enabled()
+    config = {key: value for key, value in STRESS_CONFIG.items() if key != "stem"}
+    pipeline = Pipeline(config)
+    pipeline.warm_up()
+    expected = pipeline.process_batch(texts)
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Threads", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Docs/s", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    counts = [1]
+    while counts[-1] * 2 <= max_threads:
+        counts.append(counts[-1] * 2)
+
+    baseline = None
+    for count in counts:
+        start = time.perf_counter()
+        result = list(
+            pipeline.process_parallel(
+                texts, workers=count, chunk_size=500, executor="thread"
+            )
+        )
+        elapsed = time.perf_counter() - start
+        assert result == expected, f"{count} threads: output differs"
+        baseline = baseline or elapsed
+        table.add_row(
+            str(count),
+            f"{elapsed:.2f}",
+            f"{len(texts) / elapsed:,.0f}",
+            f"{baseline / elapsed:.2f}x",
+        )
+
+    console.print(table)
+    console.print(
+        f"[dim]GIL {'enabled' if gil else 'disabled'}; threads only scale on "
+        "free-threaded CPython with the GIL disabled[/dim]"
+    )
+
+
+def main(argv=None):
+    """Run the stress tests and the scaling benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--scaling-size", type=int, default=20_000)
+    parser.add_argument("--max-threads", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    texts = generate_texts(args.size)
+    stress_cold_start(args.threads, args.rounds, texts)
+    stress_stem_cache(args.threads)
+    bench_thread_scaling(generate_texts(args.scaling_size), args.max_threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Shared fuzz corpus helpers for the equivalence tests."""
+
+import random
+
+from nahiarhdNLP.preprocessing.main import _STEP_SPECS
+
+# Fragments that exercise every cleaning pattern and whitespace edge case
+FUZZ_FRAGMENTS = [
+    "@budi",
+    "#tag",
+    "https://x.co/a?b=1",
+    "www.a.com",
+    "<b>",
+    "</p>",
+    "<a href='x'>",
+    " ",
+    "  ",
+    "\t",
+    "\n",
+    "\r\n",
+    "😊",
+    "👍🏽",
+    "AAA",
+    "haaaai",
+    "123",
+    "08123 456 789",
+    "+62 812-3456-7890",
+    "(021) 555 1234",
+    "Rp10.000",
+    "$5,00",
+    "a@b.co",
+    "!",
+    "...",
+    "-",
+    "_",
+    "é",
+    "KATA",
+    "'",
+    "()",
+]
+
+
+def random_text(
+    rng: random.Random, fragments: list, max_fragments: int, min_fragments: int = 0
+) -> str:
+    """Concatenate random fragments, each followed by a random separator."""
+    return "".join(
+        rng.choice(fragments) + rng.choice(["", " ", "  ", "\n"])
+        for _ in range(rng.randint(min_fragments, max_fragments))
+    )
+
+
+def unfused_cleaning(steps: list, text: str) -> str:
+    """Run steps one by one through their original methods."""
+    for step in steps:
+        getter, method, kwargs = _STEP_SPECS[step]
+        text = method(getter(), text, **kwargs)
+    return text
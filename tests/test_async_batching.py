@@ -0,0 +1,69 @@
+"""MicroBatcher backpressure: `map` shares the limits with `submit`."""
+
+import asyncio
+
+import pytest
+
+from nahiarhdNLP.preprocessing.async_batching import MicroBatcher
+
+
+def test_map_keeps_order_and_respects_max_pending():
+    async def main():
+        outstanding = {"now": 0, "peak": 0}
+
+        async def run_batch(items):
+            outstanding["now"] += len(items)
+            outstanding["peak"] = max(outstanding["peak"], outstanding["now"])
+            await asyncio.sleep(0.001)
+            outstanding["now"] -= len(items)
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(
+            run_batch, max_batch_size=8, max_pending=32, max_concurrency=8
+        )
+        results = await batcher.map(list(range(1000)))
+        assert results == [item * 2 for item in range(1000)]
+        assert outstanding["peak"] <= 32
+        assert batcher._slots._value == 32
+
+    asyncio.run(main())
+
+
+def test_submit_does_not_wait_for_the_whole_map():
+    async def main():
+        finished = []
+
+        async def run_batch(items):
+            await asyncio.sleep(0.002)
+            finished.extend(items)
+            return items
+
+        batcher = MicroBatcher(
+            run_batch, max_batch_size=10, max_pending=100, max_concurrency=2
+        )
+        big = asyncio.ensure_future(batcher.map([("map", i) for i in range(500)]))
+        await asyncio.sleep(0.005)
+        assert await batcher.submit(("submit", 0)) == ("submit", 0)
+        # Permintaan submit selesai jauh sebelum isi map habis
+        assert len(finished) < 250
+        await big
+
+    asyncio.run(main())
+
+
+def test_map_releases_slots_on_error():
+    async def main():
+        async def run_batch(items):
+            if 13 in items:
+                raise RuntimeError("boom")
+            return items
+
+        batcher = MicroBatcher(
+            run_batch, max_batch_size=4, max_pending=16, max_concurrency=2
+        )
+        with pytest.raises(RuntimeError):
+            await batcher.map(list(range(40)))
+        await asyncio.sleep(0.01)
+        assert batcher._slots._value == 16
+
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""FusedCleaner must give the same output as the unfused step sequence."""
+
+import random
+
+import pytest
+from fuzz import FUZZ_FRAGMENTS, random_text, unfused_cleaning
+
+from nahiarhdNLP.preprocessing.cleaning.fusion import CLEANING_OPS, FusedCleaner
+
+TRIALS = 2_000
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_fused_matches_unfused_on_fuzz_corpus(seed):
+    rng = random.Random(seed)
+    steps = list(CLEANING_OPS)
+    mismatches = []
+    for _ in range(TRIALS):
+        sequence = rng.sample(steps, rng.randint(1, 8))
+        text = random_text(rng, FUZZ_FRAGMENTS, 15)
+        expected = unfused_cleaning(sequence, text)
+        if FusedCleaner(sequence)(text) != expected:
+            mismatches.append((sequence, text))
+    assert not mismatches, f"fused output differs: {mismatches[:3]}"
+
+
+def test_without_trailing_collapse_splits_the_same():
+    rng = random.Random(0)
+    steps = list(CLEANING_OPS)
+    for _ in range(TRIALS):
+        sequence = rng.sample(steps, rng.randint(1, 8))
+        text = random_text(rng, FUZZ_FRAGMENTS, 15)
+        fused = FusedCleaner(sequence, trailing_collapse=False)
+        assert fused(text).split() == unfused_cleaning(sequence, text).split()
+
+
+def test_unknown_step_is_rejected():
+    with pytest.raises(ValueError):
+        FusedCleaner(["remove_html", "stem"])
@@ -0,0 +1,78 @@
+"""Import-time checks, each in a fresh interpreter."""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLEANING_PIPELINE = (
+    "from nahiarhdNLP.preprocessing import Pipeline\n"
+    "Pipeline({'remove_urls': True, 'remove_mentions': True, "
+    "'remove_lowercase': True}).process('halo @budi https://example.com')"
+)
+
+# Longgar: pipeline cleaning hanya butuh ~40 ms di laptop
+IMPORT_BUDGET_S = 1.5
+
+
+def run_python(code: str) -> str:
+    """Run `code` in a new interpreter and return the last stdout line."""
+    path = os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=path),
+    )
+    return result.stdout.splitlines()[-1]
+
+
+def imported_modules(statement: str) -> set:
+    """Run `statement` in a new interpreter and return its sys.modules."""
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    return set(json.loads(run_python(code)))
+
+
+def test_import_does_not_load_pandas():
+    modules = imported_modules("import nahiarhdNLP")
+    assert "pandas" not in modules
+
+
+def test_loading_a_dataset_does_not_load_pandas():
+    modules = imported_modules(
+        "from nahiarhdNLP.datasets import DatasetLoader\n"
+        "DatasetLoader().load_stopwords_dataset()"
+    )
+    assert "nahiarhdNLP.datasets.loaders" in modules
+    assert "pandas" not in modules
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import nahiarhdNLP")
+    assert "nahiarhdNLP.preprocessing" not in modules
+
+
+def test_cleaning_pipeline_skips_heavy_modules():
+    modules = imported_modules(CLEANING_PIPELINE)
+    for module in (
+        "Sastrawi",
+        "nahiarhdNLP.preprocessing.linguistic.stemmer",
+        "nahiarhdNLP.preprocessing.normalization.spell_corrector",
+    ):
+        assert module not in modules
+
+
+def test_cleaning_pipeline_import_time_budget():
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{CLEANING_PIPELINE}\n"
+        "print(time.perf_counter() - start)"
+    )
+    # Waktu terbaik dari beberapa interpreter baru, agar tidak flaky
+    best = min(float(run_python(code)) for _ in range(3))
+    assert best <= IMPORT_BUDGET_S, f"cleaning pipeline took {best:.3f}s"
@@ -0,0 +1,94 @@
+"""The optimized execution plan must give the same output as the config order."""
+
+import random
+
+import pytest
+from fuzz import FUZZ_FRAGMENTS, random_text, unfused_cleaning
+
+from nahiarhdNLP.preprocessing import Pipeline
+from nahiarhdNLP.preprocessing.linguistic.stemmer import ENGINE_ENV_VAR
+
+TRIALS = 1_000
+
+PLAN_FUZZ_WORDS = ["Memakan", "yang", "sedang", "gw", "bgt", "senyum", "Σ"]
+
+TEXTS = [
+    "Halo 😍 <b>Budi</b>  yang   sedang memakan",
+    "<p>gw\tbgt</p> 👍🏽 <a href='x'>senyum</a>",
+    "  Memakan  ",
+]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def dictionary_stemmer():
+    # Engine dictionary jauh lebih cepat dimuat daripada Sastrawi
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(ENGINE_ENV_VAR, "dictionary")
+        yield
+
+
+def assert_same_as_unfused(pipeline: Pipeline, texts: list):
+    expected = [unfused_cleaning(pipeline.plan.configured, text) for text in texts]
+    assert pipeline.process_batch(texts) == expected
+    assert [pipeline.process(text) for text in texts] == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_plan_matches_config_order_on_fuzz_corpus(seed):
+    rng = random.Random(seed)
+    # Tokenizer menghasilkan list, jadi hanya boleh di akhir
+    steps = [step for step in Pipeline.get_available_steps() if step != "tokenizer"]
+    fragments = FUZZ_FRAGMENTS + PLAN_FUZZ_WORDS
+    mismatches = []
+    rewritten = 0
+    for _ in range(TRIALS):
+        sequence = rng.sample(steps, rng.randint(1, 8))
+        if rng.random() < 0.2:
+            sequence.append("tokenizer")
+        pipeline = Pipeline({step: True for step in sequence})
+        rewritten += bool(pipeline.plan.moved or pipeline.plan.dropped)
+        # Teks kosong dikembalikan apa adanya, bukan diproses
+        texts = [random_text(rng, fragments, 12, 1) for _ in range(3)]
+        expected = [unfused_cleaning(sequence, text) for text in texts]
+        if pipeline.process_batch(texts) != expected:
+            mismatches.append((sequence, texts))
+    assert not mismatches, f"optimized plan output differs: {mismatches[:3]}"
+    # Fuzz harus benar-benar mengenai aturan penulisan ulang
+    assert rewritten > TRIALS // 10
+
+
+@pytest.mark.parametrize("html_step", ["remove_html", "clean_html"])
+def test_html_removal_moves_before_emoji_to_text(html_step):
+    pipeline = Pipeline({"emoji_to_text": True, html_step: True})
+    assert pipeline.plan.steps == (html_step, "emoji_to_text")
+    assert [move[:2] for move in pipeline.plan.moved] == [(html_step, "emoji_to_text")]
+    assert_same_as_unfused(pipeline, TEXTS)
+
+
+@pytest.mark.parametrize(
+    "whitespace_step", ["remove_extra_spaces", "remove_whitespace"]
+)
+@pytest.mark.parametrize("splitter", ["stopword", "stem", "spell_corrector_sentence"])
+def test_whitespace_step_dropped_before_split(whitespace_step, splitter):
+    pipeline = Pipeline({"remove_urls": True, whitespace_step: True, splitter: True})
+    assert whitespace_step not in pipeline.plan.steps
+    assert [step for step, _ in pipeline.plan.dropped] == [whitespace_step]
+    assert_same_as_unfused(pipeline, TEXTS)
+
+
+def test_duplicate_html_removal_dropped():
+    pipeline = Pipeline(
+        {"remove_html": True, "remove_lowercase": True, "clean_html": True}
+    )
+    assert pipeline.plan.steps == ("remove_html", "remove_lowercase")
+    assert [step for step, _ in pipeline.plan.dropped] == ["clean_html"]
+    assert_same_as_unfused(pipeline, TEXTS)
+
+
+def test_html_removal_kept_after_step_that_can_add_tags():
+    pipeline = Pipeline(
+        {"remove_html": True, "replace_email": True, "clean_html": True}
+    )
+    assert pipeline.plan.steps == ("remove_html", "replace_email", "clean_html")
+    assert not pipeline.plan.dropped
+    assert_same_as_unfused(pipeline, TEXTS + ["a@b.co <i>x</i>"])
@@ -0,0 +1,108 @@
+"""Cold resource initialization from many threads at once."""
+
+import threading
+from collections import Counter
+
+import pytest
+
+from nahiarhdNLP.preprocessing import Pipeline
+from nahiarhdNLP.preprocessing import main as pipeline_main
+from nahiarhdNLP.preprocessing.linguistic.stemmer import ENGINE_ENV_VAR
+
+THREADS = 16
+
+# Variabel global resource di preprocessing.main, dikosongkan sebelum test
+RESOURCE_GLOBALS = [
+    "_text_cleaner",
+    "_text_cleaner_word",
+    "_text_replace",
+    "_stemmer",
+    "_stopword",
+    "_emoji",
+    "_spell_corrector",
+    "_tokenizer",
+]
+
+CONFIG = {
+    "clean_html": True,
+    "remove_urls": True,
+    "remove_mentions": True,
+    "replace_email": True,
+    "emoji_to_text": True,
+    "remove_lowercase": True,
+    "spell_corrector_sentence": True,
+    "stopword": True,
+    "stem": True,
+    "remove_extra_spaces": True,
+}
+
+TEXTS = [
+    "Haiii @teman gw udh makan <b>mantap</b> 😍",
+    "memakan minuman yang sedang https://example.com/promo bgt",
+    "info@example.com sedang memakan makan",
+]
+
+
+@pytest.fixture
+def cold_resources(monkeypatch):
+    """Kosongkan resource global dan hitung berapa kali tiap kelas dibuat."""
+    # Engine dictionary jauh lebih cepat dimuat daripada Sastrawi
+    monkeypatch.setenv(ENGINE_ENV_VAR, "dictionary")
+    for name in RESOURCE_GLOBALS:
+        monkeypatch.setattr(pipeline_main, name, None)
+    monkeypatch.setattr(pipeline_main, "_resource_load_times", {})
+
+    constructions = Counter()
+    load_resource = pipeline_main._load_resource
+
+    def counting_load_resource(cls, *loaders):
+        constructions[cls.__name__] += 1
+        return load_resource(cls, *loaders)
+
+    monkeypatch.setattr(pipeline_main, "_load_resource", counting_load_resource)
+    return constructions
+
+
+def run_threads(count: int, target) -> list:
+    """Start `count` threads on `target(index)` together; re-raise errors."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = []
+
+    def worker(index):
+        try:
+            barrier.wait()
+            results[index] = target(index)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def test_cold_start_loads_each_resource_once(cold_resources):
+    pipeline = Pipeline(dict(CONFIG))
+
+    def target(index):
+        # Campur jalur batch dan per teks agar keduanya berebut
+        if index % 2:
+            result = pipeline.process_batch(TEXTS)
+        else:
+            result = [pipeline.process(text) for text in TEXTS]
+        instances = tuple(getattr(pipeline_main, name) for name in RESOURCE_GLOBALS)
+        return result, tuple(map(id, instances))
+
+    results = run_threads(THREADS, target)
+
+    duplicates = {name: n for name, n in cold_resources.items() if n != 1}
+    assert cold_resources and not duplicates
+    assert len({instances for _, instances in results}) == 1
+    outputs = [result for result, _ in results]
+    assert all(output == outputs[0] for output in outputs)
+    assert outputs[0] == Pipeline(dict(CONFIG)).process_batch(TEXTS)